@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark pentru timpul de import și latența primului apel.
+
+Fiecare măsurătoare rulează într-un proces nou (cold start), o dată cu
+dicționarul JSON și o dată cu dicționarul precompilat (dict.bin).
+Rezultatele sunt afișate ca JSON, câte o linie per mod.
+
+Utilizare:
+    python benchmarks/bench_import.py [--runs 5]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from diacritice_rom.lexicon import compile_lexicon  # noqa: E402
+
+_PROBE = """
+import json, time
+t0 = time.perf_counter()
+import diacritice_rom
+t1 = time.perf_counter()
+diacritice_rom.add_diacritics("Romania este o tara frumoasa")
+t2 = time.perf_counter()
+print(json.dumps({"import_ms": (t1 - t0) * 1000, "first_call_ms": (t2 - t1) * 1000}))
+"""
+
+
+def _run_probe(dict_path):
+    env = dict(os.environ, DIACRITICE_ROM_DICT=dict_path, PYTHONPATH=ROOT)
+    out = subprocess.run([sys.executable, "-c", _PROBE], env=env, check=True, capture_output=True, text=True)
+    return json.loads(out.stdout)
+
+
+def measure(runs=5):
+    """Mediana timpului de import și a primului apel, pentru JSON și dict.bin"""
+    records = []
+    with tempfile.TemporaryDirectory() as tmp:
+        json_only = os.path.join(tmp, "json", "dict.json")
+        compiled = os.path.join(tmp, "bin", "dict.json")
+        for path in (json_only, compiled):
+            os.makedirs(os.path.dirname(path))
+            shutil.copy(os.path.join(ROOT, "diacritice_rom", "dict.json"), path)
+        compile_lexicon(compiled)
+
+        for mode, path in (("json", json_only), ("compiled", compiled)):
+            samples = [_run_probe(path) for _ in range(runs)]
+            records.append({
+                "benchmark": "import",
+                "mode": mode,
+                "runs": runs,
+                "import_ms": statistics.median(s["import_ms"] for s in samples),
+                "first_call_ms": statistics.median(s["first_call_ms"] for s in samples),
+            })
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    for record in measure(args.runs):
+        print(json.dumps(record))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Corpusuri deterministe pentru benchmark-uri.
+
+Toate corpusurile sunt generate din dicționarul pachetului cu un generator
+aleator cu sămânță fixă, deci două rulări (pe mașini sau versiuni diferite)
+folosesc exact același text și pot fi comparate direct.
+"""
+
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from diacritice_rom import core  # noqa: E402
+from diacritice_rom.build import generate_word_variants  # noqa: E402
+
+SEED = 2024
+
+# Cuvinte care nu sunt în dicționar (nume proprii, termeni străini) și rămân neschimbate
+UNKNOWN_WORDS = ["microsoft", "ionescu", "python", "server", "github", "email", "weekend", "online"]
+
+_PUNCTUATION = [" ", " ", " ", " ", ", ", ". ", "; ", " - ", "\n"]
+
+
+def _dictionary_words(rng, count):
+    """Cuvinte fără diacritice care au match exact (cheile dicționarului)"""
+    keys = [key for key in core._get_lexicon().entries if len(key) >= 2]
+    return [rng.choice(keys) for _ in range(count)]
+
+
+def fuzzy_words(count, seed=SEED):
+    """
+    Cuvinte greșite fără match exact: o variantă din generate_word_variants a
+    unui cuvânt din dicționar, la care se aplică încă o greșeală.
+    """
+    rng = random.Random(seed)
+    entries = core._get_lexicon().entries
+    keys = [key for key in entries if len(key) >= 5]
+    words = []
+    while len(words) < count:
+        key = rng.choice(keys)
+        first = rng.choice(list(generate_word_variants(key, entries[key])))
+        second = rng.choice(list(generate_word_variants(first, entries[key])))
+        if second and core._lookup_exact(second.lower()) is None:
+            words.append(second)
+    return words
+
+
+def _join(rng, words):
+    """Leagă cuvintele cu spații și punctuație, ca într-un text obișnuit"""
+    parts = []
+    for word in words:
+        parts.append(word)
+        parts.append(rng.choice(_PUNCTUATION))
+    return "".join(parts)
+
+
+def exact_text(words=20000, seed=SEED):
+    """Text format doar din cuvinte cu match exact"""
+    rng = random.Random(seed)
+    return _join(rng, _dictionary_words(rng, words))
+
+
+def fuzzy_text(words=2000, seed=SEED):
+    """Text format doar din cuvinte greșite, rezolvate prin căutarea fuzzy"""
+    rng = random.Random(seed)
+    return _join(rng, fuzzy_words(words, seed))
+
+
+def mixed_words(rng, count, fuzzy_ratio=0.1, unknown_ratio=0.05):
+    """Amestec realist: majoritatea exacte, câteva greșite și câteva necunoscute"""
+    exact = _dictionary_words(rng, count)
+    fuzzy = fuzzy_words(max(1, int(count * fuzzy_ratio)), rng.randrange(1 << 30))
+    words = []
+    for word in exact:
+        roll = rng.random()
+        if roll < fuzzy_ratio:
+            word = rng.choice(fuzzy)
+        elif roll < fuzzy_ratio + unknown_ratio:
+            word = rng.choice(UNKNOWN_WORDS)
+        if rng.random() < 0.1:
+            word = word.capitalize()
+        words.append(word)
+    return words
+
+
+def long_document(words=50000, seed=SEED):
+    """Un singur document lung, cu amestecul realist de cuvinte"""
+    rng = random.Random(seed)
+    return _join(rng, mixed_words(rng, words))
+
+
+def short_texts(count=5000, words_per_text=8, seed=SEED):
+    """Multe texte scurte (mesaje, titluri), cu amestecul realist de cuvinte"""
+    rng = random.Random(seed)
+    pool = mixed_words(rng, count * words_per_text)
+    return [
+        _join(rng, pool[i:i + words_per_text]).rstrip()
+        for i in range(0, len(pool), words_per_text)
+    ]
+
+
+def scaled_entries(size, seed=SEED):
+    """
+    Un dicționar cu aproximativ size intrări: o parte din dicționarul real sau
+    dicționarul real extins cu variantele generate de generate_word_variants.
+    """
+    entries = core._get_lexicon().entries
+    keys = list(entries)
+    if size <= len(keys):
+        rng = random.Random(seed)
+        chosen = set(rng.sample(range(len(keys)), size))
+        return {keys[i]: entries[keys[i]] for i in range(len(keys)) if i in chosen}
+
+    scaled = dict(entries)
+    for key in keys:
+        for variant, correct in generate_word_variants(key, entries[key]).items():
+            if len(scaled) >= size:
+                return scaled
+            scaled.setdefault(variant, correct)
+    return scaled
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Suita de benchmark-uri pentru diacritice_rom.
+
+Scenarii:
+    exact          text format doar din cuvinte cu match exact
+    fuzzy          cuvinte greșite (variante din build.generate_word_variants), fără match exact
+    long_document  un singur document lung, amestec realist de cuvinte
+    short_texts    multe texte scurte, fiecare corectat separat
+    import         timpul de import și primul apel, în procese noi (JSON și dict.bin)
+    scaling        același text corectat cu dicționare de dimensiuni diferite
+    threads        un Corrector comun folosit din 1, 2, 4, 8 thread-uri (ThreadPoolExecutor);
+                   crește cu numărul de thread-uri doar pe CPython fără GIL (3.13t+)
+
+Pentru fiecare scenariu se afișează o linie JSON cu debitul (cuvinte/s, MB/s),
+latențele per apel (p50/p95/p99/max, în ms) și memoria maximă alocată
+(tracemalloc, într-o rulare separată, ca să nu influențeze timpii).
+
+Utilizare:
+    python benchmarks/run.py                          # toate scenariile
+    python benchmarks/run.py fuzzy scaling --quick    # doar unele, corpusuri mici
+    python benchmarks/run.py -o rezultate.jsonl       # salvează rezultatele
+    python benchmarks/run.py --compare baseline.jsonl # compară cu o rulare anterioară
+"""
+
+import argparse
+import gc
+import json
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import corpora
+from corpora import ROOT  # noqa: F401 - adaugă pachetul în sys.path
+
+import bench_import as import_probe
+from diacritice_rom import core
+from diacritice_rom.lexicon import Lexicon
+
+SCENARIOS = ["exact", "fuzzy", "long_document", "short_texts", "import", "scaling", "threads"]
+
+# Dimensiunile dicționarului pentru scenariul scaling
+SCALING_SIZES = [1000, 2500, None, 20000, 50000]
+
+# Numărul de thread-uri pentru scenariul threads
+THREAD_COUNTS = [1, 2, 4, 8]
+
+# Câte cuvinte are o unitate de măsurare a latenței în textele lungi
+_LINE_WORDS = 50
+
+
+def _percentiles(samples):
+    """p50/p95/p99/max, în milisecunde"""
+    ordered = sorted(samples)
+    if not ordered:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+
+    def pick(p):
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] * 1000
+
+    return {"p50": pick(50), "p95": pick(95), "p99": pick(99), "max": ordered[-1] * 1000}
+
+
+def _count_words(texts):
+    return sum(len(core._split_words(text)) // 2 for text in texts)
+
+
+def _split_lines(text, words=_LINE_WORDS):
+    """Taie un text lung în bucăți de câte words cuvinte, păstrând separatorii"""
+    parts = core._split_words(text)
+    return ["".join(parts[i:i + 2 * words]) for i in range(0, len(parts), 2 * words)]
+
+
+def _run(texts, threshold=0.8):
+    """Corectează fiecare text, măsurând latența fiecărui apel"""
+    latencies = []
+    start = time.perf_counter()
+    for text in texts:
+        t0 = time.perf_counter()
+        core.add_diacritics(text, threshold)
+        latencies.append(time.perf_counter() - t0)
+    return time.perf_counter() - start, latencies
+
+
+def _peak_memory(texts, threshold=0.8):
+    """Memoria maximă alocată în timpul corectării (cache-ul rece, ca la măsurarea timpilor)"""
+    core.clear_cache()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for text in texts:
+            core.add_diacritics(text, threshold)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(name, texts, threshold=0.8, **extra):
+    """Rulează un scenariu cu cache-ul rece și returnează înregistrarea JSON"""
+    core._get_lexicon()
+    words = _count_words(texts)
+    size = sum(len(text.encode("utf-8")) for text in texts)
+
+    core.clear_cache()
+    gc.collect()
+    seconds, latencies = _run(texts, threshold)
+    cache = core.cache_info()
+    seconds = max(seconds, 1e-9)
+
+    record = {
+        "benchmark": name,
+        "texts": len(texts),
+        "words": words,
+        "bytes": size,
+        "seconds": seconds,
+        "words_per_s": words / seconds,
+        "mb_per_s": size / 1e6 / seconds,
+        "latency_ms": _percentiles(latencies),
+        "peak_alloc_bytes": _peak_memory(texts, threshold),
+        "cache": {"hits": cache.hits, "misses": cache.misses},
+    }
+    record.update(extra)
+    return record
+
+
+def bench_exact(quick):
+    text = corpora.exact_text(5000 if quick else 50000)
+    return [measure("exact", _split_lines(text))]
+
+
+def bench_fuzzy(quick):
+    text = corpora.fuzzy_text(300 if quick else 3000)
+    return [measure("fuzzy", _split_lines(text, 10))]
+
+
+def bench_long_document(quick):
+    text = corpora.long_document(5000 if quick else 100000)
+    return [measure("long_document", [text])]
+
+
+def bench_short_texts(quick):
+    return [measure("short_texts", corpora.short_texts(500 if quick else 10000))]
+
+
+def bench_import(quick):
+    return import_probe.measure(runs=2 if quick else 5)
+
+
+def bench_scaling(quick):
+    """Același text mixt, corectat cu dicționare de dimensiuni diferite"""
+    base = core._get_lexicon()
+    text = corpora.long_document(1000 if quick else 10000, seed=corpora.SEED + 1)
+    records = []
+    try:
+        for size in SCALING_SIZES:
+            entries = dict(base.entries) if size is None else corpora.scaled_entries(size)
+            t0 = time.perf_counter()
+            core.set_lexicon(Lexicon(entries, _edit_distance(base)))
+            build_ms = (time.perf_counter() - t0) * 1000
+            records.append(measure("scaling", _split_lines(text), entries=len(entries), index_build_ms=build_ms))
+    finally:
+        core.set_lexicon(base)
+        core.clear_cache()
+    return records
+
+
+def bench_threads(quick):
+    """
+    Textele scurte, împărțite între thread-uri care folosesc același Corrector
+    (dicționar și cache comune). speedup este raportat la un singur thread.
+    """
+    texts = corpora.short_texts(1000 if quick else 10000) + _split_lines(corpora.fuzzy_text(200 if quick else 2000), 10)
+    words = _count_words(texts)
+    records = []
+    single = None
+    for threads in THREAD_COUNTS:
+        corrector = core.Corrector(core._get_lexicon())
+        gc.collect()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(threads) as executor:
+            for _ in executor.map(corrector.add_diacritics, texts, chunksize=64):
+                pass
+        seconds = max(time.perf_counter() - start, 1e-9)
+        single = single or seconds
+        records.append({
+            "benchmark": "threads",
+            "mode": threads,
+            "texts": len(texts),
+            "words": words,
+            "seconds": seconds,
+            "words_per_s": words / seconds,
+            "speedup": single / seconds,
+        })
+    return records
+
+
+_BENCHMARKS = {
+    "exact": bench_exact,
+    "fuzzy": bench_fuzzy,
+    "long_document": bench_long_document,
+    "short_texts": bench_short_texts,
+    "import": bench_import,
+    "scaling": bench_scaling,
+    "threads": bench_threads,
+}
+
+
+def _edit_distance(lexicon):
+    """Distanța indexului de ștergeri al dicționarului (None = scanare completă)"""
+    return None if lexicon.delete_index is None else lexicon.delete_index.max_distance
+
+
+def _environment():
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "gil_enabled": getattr(sys, "_is_gil_enabled", lambda: True)(),
+        "max_edit_distance": _edit_distance(core._get_lexicon()),
+    }
+
+
+def _key(record):
+    return record["benchmark"], record.get("mode"), record.get("entries")
+
+
+def _compare(records, baseline_path, stream):
+    """Afișează raportul dintre rezultatele curente și cele din baseline"""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {_key(r): r for r in map(json.loads, f) if "benchmark" in r}
+    for record in records:
+        old = baseline.get(_key(record))
+        if old is None:
+            continue
+        label = " ".join(str(part) for part in _key(record) if part is not None)
+        if "latency_ms" in record:
+            speedup = record["words_per_s"] / max(old["words_per_s"], 1e-9)
+            p99 = record["latency_ms"]["p99"] / max(old["latency_ms"]["p99"], 1e-9)
+            print(f"{label}: debit x{speedup:.2f}, p99 x{p99:.2f}", file=stream)
+        elif "words_per_s" in record:
+            speedup = record["words_per_s"] / max(old["words_per_s"], 1e-9)
+            print(f"{label}: debit x{speedup:.2f}", file=stream)
+        else:
+            ratio = record["first_call_ms"] / max(old["first_call_ms"], 1e-9)
+            print(f"{label}: primul apel x{ratio:.2f}", file=stream)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark-urile diacritice_rom")
+    parser.add_argument("scenarios", nargs="*", metavar="scenariu",
+                        help=f"scenariile rulate (implicit toate): {', '.join(SCENARIOS)}")
+    parser.add_argument("--quick", action="store_true", help="corpusuri mici, pentru verificări rapide")
+    parser.add_argument("-o", "--output", help="adaugă rezultatele (JSON-lines) în acest fișier")
+    parser.add_argument("--compare", help="fișier JSON-lines cu rezultatele unei rulări anterioare")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.scenarios if name not in _BENCHMARKS]
+    if unknown:
+        parser.error(f"scenarii necunoscute: {', '.join(unknown)}")
+
+    environment = _environment()
+    records = []
+    for name in args.scenarios or SCENARIOS:
+        for record in _BENCHMARKS[name](args.quick):
+            record.update(environment)
+            records.append(record)
+            print(json.dumps(record), flush=True)
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss este în KB pe Linux și în octeți pe macOS
+    summary = {"summary": True, "max_rss_bytes": max_rss if sys.platform == "darwin" else max_rss * 1024}
+    summary.update(environment)
+    print(json.dumps(summary))
+
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as f:
+            for record in records + [summary]:
+                f.write(json.dumps(record) + "\n")
+    if args.compare:
+        _compare(records, args.compare, sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,32 @@
-from .core import add_diacritics, get_correction_details
+from .batch import add_diacritics_batch
+from .core import Corrector, add_diacritics, get_correction_details, suggest, set_cache_size, clear_cache, cache_info
+from .core import enable_stats, get_stats, reset_stats, profile
+from .core import reload_dictionary, set_lexicon, add_overlay, remove_overlay, list_overlays
+from .incremental import IncrementalDocument
+from .lattice import add_diacritics_lattice
+from .stream import iter_add_diacritics, correct_stream
 
-__all__ = ["add_diacritics", "get_correction_details"]
+__all__ = [
+    "Corrector",
+    "add_diacritics",
+    "add_diacritics_batch",
+    "add_diacritics_lattice",
+    "get_correction_details",
+    "suggest",
+    "set_cache_size",
+    "clear_cache",
+    "cache_info",
+    "enable_stats",
+    "get_stats",
+    "reset_stats",
+    "profile",
+    "reload_dictionary",
+    "set_lexicon",
+    "add_overlay",
+    "remove_overlay",
+    "list_overlays",
+    "iter_add_diacritics",
+    "correct_stream",
+    "IncrementalDocument",
+]
 __version__ = "0.1.0"
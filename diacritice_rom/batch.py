@@ -0,0 +1,55 @@
+"""
+Corectarea în paralel a multor texte scurte, pe mai multe procese.
+"""
+
+import multiprocessing
+import os
+from functools import partial
+
+from . import core
+
+# Sub acest număr de texte costul pornirii proceselor depășește câștigul
+MIN_PARALLEL_BATCH = 64
+
+
+def _pool_context():
+    """
+    Preferă "fork": procesele copil moștenesc dicționarul și indexurile deja
+    încărcate, în loc să reîncarce dict.json fiecare.
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def add_diacritics_batch(texts, workers=None, chunksize=None, similarity_threshold: float = 0.8) -> list:
+    """
+    Adaugă diacritice unei liste de texte, folosind un pool de procese.
+    
+    Args:
+        texts: Textele de corectat (orice iterabil de str)
+        workers: Numărul de procese (implicit numărul de nuclee)
+        chunksize: Câte texte primește un proces odată (implicit calculat automat)
+        similarity_threshold: Pragul de similaritate, ca la add_diacritics
+    
+    Returns:
+        Lista textelor corectate, în ordinea de intrare
+    """
+    texts = list(texts)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    
+    correct = partial(core.add_diacritics, similarity_threshold=similarity_threshold)
+    
+    # Pentru loturi mici sau un singur proces lucrăm serial
+    if workers <= 1 or len(texts) < MIN_PARALLEL_BATCH:
+        return [correct(text) for text in texts]
+    
+    if chunksize is None:
+        chunksize = max(1, len(texts) // (workers * 4))
+    
+    # Încarcă dicționarul înainte de fork, ca procesele copil să-l moștenească
+    core._get_lexicon()
+    
+    with _pool_context().Pool(workers) as pool:
+        return pool.map(correct, texts, chunksize)
@@ -0,0 +1,323 @@
+"""
+Construirea dicționarului dintr-o listă de cuvinte, în paralel și incremental.
+
+Intrarea este un fișier text (UTF-8), câte o intrare pe linie:
+    cuvânt                       # un cuvânt corect, cu diacritice
+    cuvânt<TAB>frecvență         # frecvența decide coliziunile
+    formă<TAB>cuvânt[<TAB>frecvență]   # o formă (greșită) explicită pentru cuvânt
+Liniile goale și cele care încep cu '#' sunt ignorate.
+
+Pentru fiecare cuvânt se generează cheia fără diacritice și, opțional,
+variantele cu greșeli comune (generate_word_variants). Coliziunile sunt
+rezolvate determinist: la aceeași cheie câștigă întâi cuvântul real (o
+variantă nu suprascrie niciodată un cuvânt), apoi frecvența mai mare, apoi
+cuvântul cel mai mic alfabetic; rezultatul nu depinde de ordinea liniilor
+sau de numărul de procese.
+
+Fișierul sursă este împărțit în bucăți după conținut (o linie încheie o
+bucată dacă hash-ul ei o cere), iar rezultatul fiecărei bucăți este păstrat
+în directorul de cache, sortat. La o nouă rulare, doar bucățile modificate
+sunt regenerate; bucățile sortate sunt apoi interclasate (heapq.merge),
+fără să fie ținute toate în memorie.
+
+Artefactul scris depinde de extensia ieșirii: .json (plus dict.bin
+precompilat alături) sau .lex (dicționarul mapat în memorie).
+
+Utilizare:
+    python -m diacritice_rom.build cuvinte.txt -o diacritice_rom/dict.json
+    python -m diacritice_rom.build lexicon.tsv -o lexicon.lex --no-variants -j 8
+"""
+
+import argparse
+import hashlib
+import heapq
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+
+from .index import fold_diacritics
+from .lexicon import Lexicon, compiled_path, write_compiled
+
+# Versiunea generatorului: schimbarea ei invalidează cache-ul bucăților
+BUILD_VERSION = 1
+
+# Numărul mediu și maxim de linii dintr-o bucată
+CHUNK_LINES = 4096
+MAX_CHUNK_LINES = 4 * CHUNK_LINES
+
+# Lungimea minimă a unei chei din dicționar
+MIN_KEY_LENGTH = 2
+
+# Tipul intrării: cuvintele reale au prioritate față de variantele generate
+_WORD = 0
+_VARIANT = 1
+
+
+def generate_word_variants(base_word, correct_word):
+    """
+    Generează variante cu erori comune pentru un cuvânt
+    """
+    variants = {}
+
+    # Variante cu litere lipsă
+    if len(base_word) > 3:
+        for i in range(1, len(base_word) - 1):
+            variant = base_word[:i] + base_word[i+1:]
+            if variant not in variants:
+                variants[variant] = correct_word
+
+    # Variante cu litere adăugate
+    vowels = "aeiouăâîșț"
+    for i in range(len(base_word) + 1):
+        for vowel in vowels:
+            variant = base_word[:i] + vowel + base_word[i:]
+            if variant not in variants:
+                variants[variant] = correct_word
+
+    # Variante cu litere înlocuite
+    common_replacements = {
+        'a': ['ă', 'â'],
+        'i': ['î'],
+        's': ['ș'],
+        't': ['ț'],
+        'ă': ['a'],
+        'â': ['a'],
+        'î': ['i'],
+        'ș': ['s'],
+        'ț': ['t']
+    }
+
+    for i, char in enumerate(base_word):
+        if char in common_replacements:
+            for replacement in common_replacements[char]:
+                variant = base_word[:i] + replacement + base_word[i+1:]
+                if variant not in variants:
+                    variants[variant] = correct_word
+
+    # Variante cu litere inversate
+    if len(base_word) > 2:
+        for i in range(len(base_word) - 1):
+            variant = base_word[:i] + base_word[i+1] + base_word[i] + base_word[i+2:]
+            if variant not in variants:
+                variants[variant] = correct_word
+
+    return variants
+
+
+def parse_line(line):
+    """
+    Interpretează o linie din lista de cuvinte.
+    Returnează (formă, cuvânt, frecvență) sau None pentru liniile ignorate.
+    """
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    fields = line.split("\t")
+    frequency = 0
+    if len(fields) > 1 and fields[-1].isdigit():
+        frequency = int(fields.pop())
+    word = fields[-1].strip().lower()
+    form = fields[0].strip().lower() if len(fields) > 1 else word
+    if not word or not form:
+        return None
+    return form, word, frequency
+
+
+def _generate(lines, variants=True):
+    """
+    Intrările unei bucăți: listă sortată de (cheie, tip, -frecvență, cuvânt),
+    cu o singură intrare (cea prioritară) per cheie.
+    """
+    best = {}
+
+    def offer(key, record):
+        # Cheile de o literă ar produce potriviri false pentru aproape orice cuvânt scurt
+        if len(key) < MIN_KEY_LENGTH:
+            return
+        current = best.get(key)
+        if current is None or record < current:
+            best[key] = record
+
+    for line in lines:
+        parsed = parse_line(line)
+        if parsed is None:
+            continue
+        form, word, frequency = parsed
+        base = fold_diacritics(form)
+        offer(base, (_WORD, -frequency, word))
+        if variants:
+            for variant in generate_word_variants(base, word):
+                offer(fold_diacritics(variant), (_VARIANT, -frequency, word))
+
+    return sorted((key,) + record for key, record in best.items())
+
+
+def _chunks(lines):
+    """
+    Împarte liniile în bucăți după conținut: o modificare locală în fișier
+    schimbă doar bucata (bucățile) în care apare.
+    """
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        digest = hashlib.blake2b(line.encode("utf-8"), digest_size=8).digest()
+        if int.from_bytes(digest, "little") % CHUNK_LINES == 0 or len(chunk) >= MAX_CHUNK_LINES:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# Numele unei bucăți din cache: hash-ul sha256 al conținutului ei
+_CHUNK_NAME_RE = re.compile(r"[0-9a-f]{64}\.tsv")
+
+
+def _chunk_digest(lines, variants):
+    h = hashlib.sha256(f"{BUILD_VERSION}:{int(variants)}\n".encode("ascii"))
+    for line in lines:
+        h.update(line.encode("utf-8"))
+    return h.hexdigest()
+
+
+def _write_records(path, records):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+        for key, kind, negative_frequency, word in records:
+            f.write(f"{key}\t{kind}\t{negative_frequency}\t{word}\n")
+    os.replace(tmp_path, path)
+
+
+def _read_records(path):
+    with open(path, "r", encoding="utf-8", newline="\n") as f:
+        for line in f:
+            key, kind, negative_frequency, word = line.rstrip("\n").split("\t")
+            yield key, int(kind), int(negative_frequency), word
+
+
+def _build_chunk(task):
+    """Generează și salvează o bucată (rulează într-un proces worker)"""
+    path, lines, variants = task
+    _write_records(path, _generate(lines, variants))
+    return path
+
+
+def merge_chunks(paths):
+    """
+    Interclasează bucățile sortate; returnează intrările (cheie → cuvânt),
+    în ordinea cheilor, păstrând pentru fiecare cheie intrarea prioritară.
+    """
+    entries = {}
+    previous = None
+    for key, _, _, word in heapq.merge(*(_read_records(path) for path in paths)):
+        if key != previous:
+            entries[key] = word
+            previous = key
+    return entries
+
+
+def _pool(jobs):
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork").Pool(jobs)
+    return multiprocessing.Pool(jobs)
+
+
+def write_artifact(entries, out_path, max_edit_distance=2):
+    """
+    Scrie dicționarul: .lex (mapat în memorie) sau JSON împreună cu
+    varianta precompilată (.bin). Returnează lista fișierelor scrise.
+    """
+    lexicon = Lexicon(entries, max_edit_distance)
+    if out_path.endswith(".lex"):
+        from .mapped import write_mapped
+
+        return [write_mapped(lexicon, out_path)]
+
+    source = json.dumps(entries, ensure_ascii=False, indent=2).encode("utf-8")
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(source)
+    os.replace(tmp_path, out_path)
+    compiled = write_compiled(lexicon, compiled_path(out_path), hashlib.sha256(source).digest())
+    return [out_path, compiled]
+
+
+def build(source_path, out_path, variants=True, jobs=None, cache_dir=None, max_edit_distance=2):
+    """
+    Construiește dicționarul din lista de cuvinte și scrie artefactul.
+
+    Args:
+        source_path: Lista de cuvinte (text sau TSV)
+        out_path: Fișierul rezultat (.json sau .lex)
+        variants: Dacă se generează și variantele cu greșeli comune
+        jobs: Procese paralele (implicit numărul de nuclee)
+        cache_dir: Directorul bucăților generate (implicit lângă out_path)
+        max_edit_distance: Distanța indexului de ștergeri (None = fără index)
+
+    Returns:
+        Dict cu statistici: bucăți, bucăți refolosite, intrări, fișiere scrise
+    """
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(out_path)), ".diacritice-build")
+    os.makedirs(cache_dir, exist_ok=True)
+    jobs = jobs or os.cpu_count() or 1
+
+    paths = []
+    missing = []
+    with open(source_path, "r", encoding="utf-8") as f:
+        for lines in _chunks(f):
+            path = os.path.join(cache_dir, _chunk_digest(lines, variants) + ".tsv")
+            paths.append(path)
+            if not os.path.exists(path):
+                missing.append((path, lines, variants))
+
+    if jobs > 1 and len(missing) > 1:
+        with _pool(min(jobs, len(missing))) as pool:
+            for _ in pool.imap_unordered(_build_chunk, missing):
+                pass
+    else:
+        for task in missing:
+            _build_chunk(task)
+
+    # Bucățile care nu mai apar în sursă sunt șterse, ca cache-ul să nu crească la nesfârșit.
+    # Doar fișierele create de build (<sha256>.tsv): directorul poate conține și alte date.
+    used = {os.path.basename(path) for path in paths}
+    for name in os.listdir(cache_dir):
+        if _CHUNK_NAME_RE.fullmatch(name) and name not in used:
+            os.unlink(os.path.join(cache_dir, name))
+
+    entries = merge_chunks(paths)
+    written = write_artifact(entries, out_path, max_edit_distance)
+    return {
+        "chunks": len(paths),
+        "reused": len(paths) - len(missing),
+        "entries": len(entries),
+        "files": written,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m diacritice_rom.build", description="Construiește dicționarul dintr-o listă de cuvinte")
+    parser.add_argument("source", help="lista de cuvinte (text sau TSV, UTF-8)")
+    parser.add_argument("-o", "--output", default=os.path.join(os.path.dirname(__file__), "dict.json"),
+                        help="fișierul rezultat: .json (plus .bin) sau .lex")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="procese paralele")
+    parser.add_argument("--no-variants", action="store_true", help="fără variantele cu greșeli comune")
+    parser.add_argument("--cache-dir", help="directorul bucăților generate (pentru reconstruiri incrementale)")
+    parser.add_argument("--max-edit-distance", type=int, default=2, help="distanța indexului de ștergeri (-1 = fără index)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    distance = None if args.max_edit_distance < 0 else args.max_edit_distance
+    result = build(args.source, args.output, not args.no_variants, args.jobs, args.cache_dir, distance)
+    print(
+        f"✅ {result['entries']} intrări în {time.perf_counter() - start:.1f} s "
+        f"({result['chunks']} bucăți, {result['reused']} refolosite): {', '.join(result['files'])}",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
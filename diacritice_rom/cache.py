@@ -0,0 +1,87 @@
+"""
+Cache LRU pentru rezoluțiile cuvintelor care nu au match exact în dicționar.
+"""
+
+import threading
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+
+class ResolutionCache:
+    """
+    Cache LRU cu dimensiune mărginită, sigur pentru folosirea din mai multe thread-uri.
+
+    Păstrează și contoare pentru hit-uri, miss-uri și evacuări.
+    maxsize=0 dezactivează cache-ul.
+    """
+
+    def __init__(self, maxsize=4096):
+        if maxsize < 0:
+            raise ValueError("maxsize trebuie să fie >= 0")
+        self._maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key, default=None):
+        """Returnează valoarea din cache și o marchează ca folosită recent"""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key, value):
+        """Adaugă o valoare, evacuând cele mai vechi intrări dacă e nevoie"""
+        with self._lock:
+            if self._maxsize == 0:
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def resize(self, maxsize):
+        """Schimbă capacitatea cache-ului"""
+        if maxsize < 0:
+            raise ValueError("maxsize trebuie să fie >= 0")
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._data) > maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def discard_if(self, predicate):
+        """
+        Elimină intrările pentru care predicate(cheie) este adevărat, fără să
+        reseteze contoarele. Returnează numărul de intrări eliminate.
+        """
+        with self._lock:
+            stale = [key for key in self._data if predicate(key)]
+            for key in stale:
+                del self._data[key]
+            return len(stale)
+
+    def clear(self):
+        """Golește cache-ul și resetează contoarele"""
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def info(self):
+        """Returnează statisticile cache-ului"""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self._maxsize, len(self._data))
+
+    def __len__(self):
+        return len(self._data)
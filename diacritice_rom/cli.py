@@ -0,0 +1,373 @@
+"""
+Linia de comandă: corectează fișiere, glob-uri, directoare sau stdin.
+
+Exemple:
+    diacritice-rom articol.txt                      # rezultatul la stdout
+    diacritice-rom -i docs/ "arhiva/*.txt"          # în loc, în paralel
+    diacritice-rom -o corectat/ docs/ -j 8          # într-un alt director
+    cat text.txt | diacritice-rom --details         # detalii JSON per cuvânt
+    diacritice-rom -o corectat/ arhiva/ --table rezolutii.tsv   # în două treceri
+
+Cu --two-phase (sau --table), fiecare cuvânt distinct din toate fișierele este
+rezolvat o singură dată, iar fișierele sunt apoi rescrise doar prin căutări în
+tabelul de rezoluții (vezi modulul corpus); util pentru arhive mari.
+
+Fișierele sunt citite pe bucăți (memorie constantă) și procesate în paralel pe
+toate nucleele. La final, pe stderr apare un rezumat cu viteza de procesare
+(cuvinte/s, MB/s) și numărul de corecturi exacte și fuzzy.
+"""
+
+import argparse
+import contextlib
+import fnmatch
+import glob
+import io
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from . import core
+from .stream import CHUNK_SIZE, _word_aligned
+
+# Modelul implicit al fișierelor căutate în directoare
+DEFAULT_PATTERN = "*.txt"
+
+
+class _Counts:
+    """Contoarele pentru un fișier (sau pentru total)"""
+
+    __slots__ = ("files", "bytes", "words", "exact", "fuzzy", "none")
+
+    def __init__(self):
+        self.files = 0
+        self.bytes = 0
+        self.words = 0
+        self.exact = 0
+        self.fuzzy = 0
+        self.none = 0
+
+    def add(self, other):
+        for name in self.__slots__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _correct_chunks(chunks, threshold, counts, details_out=None, name=None):
+    """
+    Corectează bucățile de text, numărând tipurile de corecturi. Dacă se dă
+    fișierul details_out, scrie în el câte o linie JSON pentru fiecare bucată
+    (vezi _details_record), așa că memoria rămâne constantă și la fișiere mari.
+    """
+    chunk = 0
+    for text, correctable in _word_aligned(chunks):
+        counts.bytes += len(text.encode("utf-8"))
+        if not correctable:
+            yield text
+            continue
+
+        parts, words, details = core._resolve_text(text, threshold, details=True)
+        if details_out is not None and words:
+            record = _details_record(name, chunk, counts.words, details)
+            details_out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            chunk += 1
+        counts.words += len(words)
+        counts.exact += details.count_kind('exact')
+        counts.fuzzy += details.count_kind('fuzzy')
+        counts.none += details.count_kind('none')
+        yield "".join(parts)
+
+
+def _details_record(name, chunk, first_word, details):
+    """
+    Linia JSON pentru o bucată dintr-un fișier: first_word este indicele, în
+    fișier, al primului cuvânt din corrections.
+    """
+    return {
+        'file': name,
+        'chunk': chunk,
+        'first_word': first_word,
+        'corrections': details.as_list(),
+        'total_corrected': len(details) - details.count_kind('none'),
+        'total_words': len(details),
+    }
+
+
+def _process_file(task):
+    """
+    Corectează un fișier (rulează într-un proces worker). Cu detalii, liniile
+    JSON sunt scrise într-un fișier temporar, afișat apoi de procesul principal.
+    Returnează (nume, contoare, fișierul cu detalii sau None, eroare sau None).
+    """
+    source, destination, threshold, details = task
+    counts = _Counts()
+    counts.files = 1
+    details_path = None
+    try:
+        with contextlib.ExitStack() as stack:
+            details_out = None
+            if details:
+                fd, details_path = tempfile.mkstemp(prefix=".diacritice-", suffix=".jsonl")
+                details_out = stack.enter_context(open(fd, "w", encoding="utf-8", newline="\n"))
+            infile = stack.enter_context(open(source, "r", encoding="utf-8", newline=""))
+            chunks = iter(lambda: infile.read(CHUNK_SIZE), "")
+            corrected = _correct_chunks(chunks, threshold, counts, details_out, source)
+            if destination is None:
+                for _ in corrected:
+                    pass
+            else:
+                directory = os.path.dirname(destination) or "."
+                os.makedirs(directory, exist_ok=True)
+                # Scrie într-un fișier temporar și îl mută la final (sigur și pentru -i)
+                fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".diacritice-")
+                try:
+                    with open(fd, "w", encoding="utf-8", newline="") as outfile:
+                        for piece in corrected:
+                            outfile.write(piece)
+                    # mkstemp creează fișierul cu 0600; rezultatul păstrează drepturile sursei
+                    shutil.copymode(source, tmp_path)
+                    os.replace(tmp_path, destination)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+    except (OSError, UnicodeDecodeError) as exc:
+        if details_path is not None:
+            os.unlink(details_path)
+        return source, counts, None, str(exc)
+    return source, counts, details_path, None
+
+
+def _spool_file(task):
+    """
+    Corectează un fișier într-un fișier temporar (rulează într-un proces worker),
+    pentru afișarea la stdout în ordinea fișierelor.
+    Returnează (nume, contoare, fișierul temporar sau None, eroare sau None).
+    """
+    source, _, threshold, _ = task
+    fd, spool = tempfile.mkstemp(prefix=".diacritice-")
+    os.close(fd)
+    name, counts, _, error = _process_file((source, spool, threshold, False))
+    if error is not None:
+        os.unlink(spool)
+        return name, counts, None, error
+    return name, counts, spool, None
+
+
+def _copy_spool(spool, stdout):
+    """Copiază un fișier temporar la stdout și îl șterge"""
+    try:
+        with open(spool, "r", encoding="utf-8", newline="") as infile:
+            shutil.copyfileobj(infile, stdout, CHUNK_SIZE)
+    finally:
+        os.unlink(spool)
+
+
+def _expand_inputs(inputs, pattern):
+    """
+    Transformă argumentele (fișiere, glob-uri, directoare) în perechi
+    (cale, cale relativă pentru directorul de ieșire).
+    """
+    files = []
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, _, names in os.walk(item):
+                for name in sorted(names):
+                    if fnmatch.fnmatch(name, pattern):
+                        path = os.path.join(root, name)
+                        files.append((path, os.path.relpath(path, item)))
+        elif os.path.exists(item):
+            files.append((item, os.path.basename(item)))
+        else:
+            matches = sorted(glob.glob(item, recursive=True))
+            if not matches:
+                raise FileNotFoundError(item)
+            files.extend((path, os.path.basename(path)) for path in matches if os.path.isfile(path))
+    return files
+
+
+def _text_stream(stream, mode):
+    """
+    Deschide stdin/stdout în UTF-8, fără conversia liniilor noi, ca textul
+    să rămână identic; dacă stream-ul nu are descriptor, îl folosește ca atare.
+    """
+    try:
+        return open(stream.fileno(), mode, encoding="utf-8", newline="", closefd=False)
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return stream
+
+
+def _pool(jobs):
+    core._get_lexicon()
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork").Pool(jobs)
+    return multiprocessing.Pool(jobs)
+
+
+def _print_summary(total, elapsed, stream):
+    seconds = max(elapsed, 1e-9)
+    print(
+        f"diacritice-rom: {total.files} fișiere, {total.words} cuvinte, "
+        f"{total.bytes / 1e6:.2f} MB în {elapsed:.2f} s "
+        f"({total.words / seconds:,.0f} cuvinte/s, {total.bytes / 1e6 / seconds:.2f} MB/s); "
+        f"exacte: {total.exact}, fuzzy: {total.fuzzy}, neschimbate: {total.none}",
+        file=stream,
+    )
+
+
+def _two_phase(tasks, args, total):
+    """Corectează fișierele în două treceri (vezi modulul corpus); returnează codul de ieșire"""
+    from . import corpus
+
+    sources = [task[0] for task in tasks]
+    destinations = [task[1] for task in tasks]
+    table = corpus.resolve_vocabulary(corpus.collect_vocabulary(sources, args.jobs), args.threshold, args.jobs)
+    if args.table:
+        corpus.export_table(table, args.table)
+
+    status = 0
+    for name, kinds, size, error in corpus.rewrite_files(sources, destinations, table, args.jobs):
+        counts = _Counts()
+        counts.files = 1
+        counts.bytes = size
+        counts.words = sum(kinds.values())
+        counts.exact = kinds['exact']
+        counts.fuzzy = kinds['fuzzy']
+        counts.none = kinds['none']
+        total.add(counts)
+        if error is not None:
+            print(f"diacritice-rom: {name}: {error}", file=sys.stderr)
+            status = 1
+    return status
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="diacritice-rom", description="Adaugă diacritice textelor românești.")
+    parser.add_argument("inputs", nargs="*", help="fișiere, glob-uri sau directoare (implicit stdin)")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("-i", "--in-place", action="store_true", help="rescrie fișierele corectate în loc")
+    target.add_argument("-o", "--output-dir", help="scrie fișierele corectate în acest director")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="procese paralele")
+    parser.add_argument("-t", "--threshold", type=float, default=0.8, help="pragul de similaritate (implicit 0.8)")
+    parser.add_argument("--pattern", default=DEFAULT_PATTERN, help="fișierele căutate în directoare (implicit *.txt)")
+    parser.add_argument("--details", action="store_true", help="afișează detaliile corecturilor ca JSON-lines")
+    parser.add_argument("--two-phase", action="store_true",
+                        help="rezolvă întâi vocabularul tuturor fișierelor, apoi rescrie fișierele (cere -i sau -o)")
+    parser.add_argument("--table", help="exportă tabelul de rezoluții (TSV) aici; implică --two-phase")
+    parser.add_argument("-q", "--quiet", action="store_true", help="fără rezumatul final")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    total = _Counts()
+    status = 0
+
+    if not args.inputs or args.inputs == ["-"]:
+        if args.in_place or args.output_dir:
+            parser.error("stdin nu poate fi corectat în loc sau într-un director")
+        total.files = 1
+        stdin = _text_stream(sys.stdin, "r")
+        stdout = _text_stream(sys.stdout, "w")
+        chunks = iter(lambda: stdin.read(CHUNK_SIZE), "")
+        details_out = stdout if args.details else None
+        for piece in _correct_chunks(chunks, args.threshold, total, details_out, "-"):
+            if not args.details:
+                stdout.write(piece)
+        stdout.flush()
+    else:
+        try:
+            files = _expand_inputs(args.inputs, args.pattern)
+        except FileNotFoundError as exc:
+            parser.error(f"fișier inexistent: {exc}")
+
+        to_stdout = not (args.in_place or args.output_dir)
+        two_phase = args.two_phase or args.table is not None
+        if two_phase and (to_stdout or args.details):
+            parser.error("--two-phase și --table cer -i sau -o și nu pot fi folosite cu --details")
+        tasks = []
+        for path, relative in files:
+            if args.in_place:
+                destination = path
+            elif args.output_dir:
+                destination = os.path.join(args.output_dir, relative)
+            else:
+                destination = None
+            tasks.append((path, destination, args.threshold, args.details))
+
+        # Două intrări cu aceeași destinație (ex. -o out d/a.txt e/a.txt) s-ar suprascrie una pe alta
+        seen = {}
+        for path, destination, _, _ in tasks:
+            if destination is None:
+                continue
+            key = os.path.normcase(os.path.realpath(destination))
+            if key in seen:
+                parser.error(f"{seen[key]} și {path} ar fi scrise în același fișier: {destination}")
+            seen[key] = path
+
+        if two_phase:
+            status = _two_phase(tasks, args, total)
+        elif to_stdout and not args.details and args.jobs > 1 and len(tasks) > 1:
+            # Fișierele sunt corectate în paralel în fișiere temporare, afișate în ordine
+            stdout = _text_stream(sys.stdout, "w")
+            pool = _pool(min(args.jobs, len(tasks)))
+            try:
+                for name, counts, spool, error in pool.imap(_spool_file, tasks):
+                    total.add(counts)
+                    if error is not None:
+                        print(f"diacritice-rom: {name}: {error}", file=sys.stderr)
+                        status = 1
+                        continue
+                    _copy_spool(spool, stdout)
+            finally:
+                pool.close()
+                pool.join()
+            stdout.flush()
+        elif to_stdout and not args.details:
+            # Fără destinație, textul corectat merge la stdout, în ordinea fișierelor
+            stdout = _text_stream(sys.stdout, "w")
+            for path, _ in files:
+                counts = _Counts()
+                counts.files = 1
+                try:
+                    with open(path, "r", encoding="utf-8", newline="") as infile:
+                        chunks = iter(lambda: infile.read(CHUNK_SIZE), "")
+                        for piece in _correct_chunks(chunks, args.threshold, counts):
+                            stdout.write(piece)
+                except (OSError, UnicodeDecodeError) as exc:
+                    print(f"diacritice-rom: {path}: {exc}", file=sys.stderr)
+                    status = 1
+                total.add(counts)
+            stdout.flush()
+        else:
+            if args.jobs > 1 and len(tasks) > 1:
+                pool = _pool(min(args.jobs, len(tasks)))
+                results = pool.imap(_process_file, tasks)
+            else:
+                pool = None
+                results = map(_process_file, tasks)
+            stdout = _text_stream(sys.stdout, "w") if args.details else None
+            try:
+                for name, counts, details_path, error in results:
+                    total.add(counts)
+                    if error is not None:
+                        print(f"diacritice-rom: {name}: {error}", file=sys.stderr)
+                        status = 1
+                    elif details_path is not None:
+                        _copy_spool(details_path, stdout)
+                if stdout is not None:
+                    stdout.flush()
+            finally:
+                if pool is not None:
+                    pool.close()
+                    pool.join()
+
+    if not args.quiet:
+        _print_summary(total, time.perf_counter() - start, sys.stderr)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,73 @@
-import json
 import os
+import re
+import threading
+import time
+from contextlib import contextmanager
 from difflib import SequenceMatcher
 
-# Încarcă dicționarul de cuvinte cu diacritice
-DICT_PATH = os.path.join(os.path.dirname(__file__), "dict.json")
-try:
-    with open(DICT_PATH, "r", encoding="utf-8") as f:
-        DICT = json.load(f)
-except FileNotFoundError:
-    DICT = {}
+from .cache import ResolutionCache
+from .details import Corrections, Suggestion, WordContext
+from .index import char_signature, common_chars_bound, fold_diacritics
+from .lexicon import load_lexicon
+from .normalize import apply_convention, normalize_text
+from .overlay import layered, load_overlay, may_affect
+from .stats import Stats
+from .vectorized import _EPSILON, _score_bound
+
+# Distanța maximă (în ștergeri) la care sunt căutați candidații fuzzy.
+# None dezactivează indexul și revine la scanarea completă a dicționarului.
+MAX_EDIT_DISTANCE = 2
+
+# Numărul maxim de cuvinte fără match exact memorate între apeluri
+RESOLUTION_CACHE_SIZE = 4096
+
+# Dicționarul de cuvinte cu diacritice; dict.bin (precompilat) este folosit dacă e la zi.
+# Variabila de mediu DIACRITICE_ROM_DICT permite folosirea altui dicționar.
+DICT_PATH = os.environ.get("DIACRITICE_ROM_DICT") or os.path.join(os.path.dirname(__file__), "dict.json")
+
+# Valoarea implicită a parametrilor Corrector care urmează setările modulului
+# (MAX_EDIT_DISTANCE, RESOLUTION_CACHE_SIZE), citite abia la încărcarea dicționarului
+_MODULE_SETTING = object()
+
+# Nucleul unui cuvânt: litere/cifre, eventual legate prin cratimă sau apostrof (ex. "într-o").
+# Semnele diacritice combinate (U+0300-U+036F, text NFD) nu sunt \w, dar fac parte din cuvânt.
+# Grupul de captură face ca re.split să păstreze și separatorii (spații, punctuație).
+_WORD_RE = re.compile(r"(\w[\w\u0300-\u036f]*(?:[-'’]\w[\w\u0300-\u036f]*)*)")
+
+# Statisticile sunt opționale: DIACRITICE_ROM_STATS=1 sau enable_stats() le activează global,
+# iar profile() le colectează pentru un singur apel. Fără ele, costul este un test per cuvânt.
+_STATS = Stats() if os.environ.get("DIACRITICE_ROM_STATS") else None
+_PROFILE = threading.local()
+_STATS_LOCK = threading.Lock()
+_ACTIVE_PROFILES = 0
+_INSTRUMENTED = _STATS is not None
+
+
+def _get_lexicon():
+    """
+    Returnează dicționarul instanței implicite, încărcându-l la primul apel.
+    """
+    return _DEFAULT.lexicon
+
+
+def _collector():
+    """Statisticile în care se înregistrează apelul curent (profilul thread-ului sau cele globale)"""
+    stats = getattr(_PROFILE, "stats", None)
+    return stats if stats is not None else _STATS
+
+
+def __getattr__(name):
+    # Compatibilitate: DICT, FOLDED_DICT și DELETE_INDEX declanșează încărcarea leneșă
+    if name == "DICT":
+        return _get_lexicon().entries
+    if name == "FOLDED_DICT":
+        return _get_lexicon().folded
+    if name == "DELETE_INDEX":
+        return _get_lexicon().delete_index
+    # Dicționarul instanței implicite, fără să-l încarce (None înainte de prima utilizare)
+    if name == "_LEXICON":
+        return _DEFAULT._lexicon
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _similarity(a, b):
@@ -16,9 +75,19 @@ def _similarity(a, b):
     return SequenceMatcher(None, a.lower(), b.lower()).ratio()
 
 
-def _validate_correction(original_word, corrected_word, context_words):
+def _lookup_exact(word_lower, lexicon=None):
     """
-    Validează dacă corectarea are sens în context
+    Caută cuvântul direct în dicționar, apoi după forma fără diacritice,
+    astfel încât variantele care diferă doar prin diacritice nu trebuie stocate.
+    Returnează None dacă nu există match exact.
+    """
+    return (lexicon if lexicon is not None else _get_lexicon()).lookup(word_lower)
+
+
+def _may_validate(original_word, corrected_word):
+    """
+    Verificările ieftine din _validate_correction (lungime și prima literă),
+    folosite și pentru a sări peste candidații care oricum ar fi respinși.
     """
     # Verifică dacă lungimea nu s-a schimbat dramatic
     length_diff = abs(len(original_word) - len(corrected_word))
@@ -29,6 +98,16 @@ def _validate_correction(original_word, corrected_word, context_words):
     if original_word and corrected_word and original_word[0].lower() != corrected_word[0].lower():
         return False
     
+    return True
+
+
+def _validate_correction(original_word, corrected_word, context_words):
+    """
+    Validează dacă corectarea are sens în context
+    """
+    if not _may_validate(original_word, corrected_word):
+        return False
+    
     # Verifică dacă cuvântul corectat nu este prea diferit
     if _similarity(original_word.lower(), corrected_word.lower()) < 0.6:
         return False
@@ -36,41 +115,291 @@ def _validate_correction(original_word, corrected_word, context_words):
     return True
 
 
-def _find_best_match(word, threshold=0.8, context_words=None):
+def _score_candidate(word, dict_word):
     """
-    Găsește cel mai bun match pentru un cuvânt din dicționar
-    threshold: similaritatea minimă pentru a considera un match (mărit la 0.8)
-    context_words: cuvintele din jur pentru validare
+    Calculează scorul unui cuvânt din dicționar față de cuvântul căutat,
+    incluzând bonusurile pentru prefix și lungime similară.
+    """
+    return _with_bonuses(word, dict_word, _similarity(word.lower(), dict_word))
+
+
+def _with_bonuses(word, dict_word, base_score):
+    """
+    Adaugă la similaritatea brută bonusurile din _score_candidate.
+    """
+    word_lower = word.lower()
+    
+    # Bonus pentru cuvinte care încep la fel (doar dacă sunt suficient de similare)
+    if base_score >= 0.7:
+        if word_lower.startswith(dict_word[:3]) or dict_word.startswith(word_lower[:3]):
+            base_score += 0.05
+        
+        # Bonus pentru cuvinte de lungime similară
+        length_diff = abs(len(word) - len(dict_word))
+        if length_diff <= 1:
+            base_score += 0.03
+        elif length_diff <= 2:
+            base_score += 0.01
+    
+    return base_score
+
+
+def _best_among(word, candidates, threshold, context_words, lexicon=None):
     """
-    if word.lower() in DICT:
-        return DICT[word.lower()]
+    Alege cel mai bun candidat validat; la scor egal câștigă primul în ordinea dicționarului.
+    Returnează (match, încredere), unde încrederea este similaritatea calculată
+    la validare; match este None dacă niciun candidat nu trece.
     
+    Înainte de SequenceMatcher, semnăturile de caractere dau o margine a scorului;
+    candidații care nu pot atinge pragul (sau scorul cel mai bun de până acum) sunt săriți.
+    
+    Cheile dicționarului sunt fără diacritice, deci scorul se calculează pe forma
+    pliată a cuvântului; validarea și încrederea folosesc cuvântul original.
+    """
+    if lexicon is None:
+        lexicon = _get_lexicon()
+    entries = lexicon.entries
+    folded = fold_diacritics(word.lower())
+    length = len(folded)
+    query = char_signature(folded)
     best_match = None
     best_score = 0
+    best_confidence = 0.0
+    scored = 0
     
-    for dict_word, correct_word in DICT.items():
-        # Verifică dacă cuvântul din dicționar este similar
-        base_score = _similarity(word.lower(), dict_word)
+    for dict_word in candidates:
+        correct_word = entries[dict_word]
+        if not _may_validate(word, correct_word):
+            continue
         
-        # Bonus pentru cuvinte care încep la fel (doar dacă sunt suficient de similare)
-        if base_score >= 0.7:
-            if word.lower().startswith(dict_word[:3]) or dict_word.startswith(word.lower()[:3]):
-                base_score += 0.05
-            
-            # Bonus pentru cuvinte de lungime similară
-            length_diff = abs(len(word) - len(dict_word))
-            if length_diff <= 1:
-                base_score += 0.03
-            elif length_diff <= 2:
-                base_score += 0.01
+        total = length + len(dict_word.lower())
+        common = common_chars_bound(query, length, lexicon.signature(dict_word))
+        if total and _score_bound(2.0 * common / total) + _EPSILON < max(threshold, best_score):
+            continue
         
-        # Validează corectarea în context
+        scored += 1
+        base_score = _score_candidate(folded, dict_word)
+        
+        # Validează corectarea (ca _validate_correction; lungimea și prima literă sunt deja verificate)
         if base_score > best_score and base_score >= threshold:
-            if _validate_correction(word, correct_word, context_words):
+            confidence = _similarity(word, correct_word)
+            if confidence >= 0.6:
                 best_score = base_score
                 best_match = correct_word
+                best_confidence = confidence
+    
+    stats = _collector() if _INSTRUMENTED else None
+    if stats is not None:
+        stats.record_lookup(len(candidates), scored)
+    return best_match, best_confidence
+
+
+def _scan_best_match(word, threshold=0.8, context_words=None, lexicon=None):
+    """
+    Caută cel mai bun match fără indexul de ștergeri. Candidații care nu pot
+    trece validarea sau nu pot atinge pragul (după marginea LCS, calculată
+    vectorizat cu NumPy dacă este disponibil) nu mai sunt evaluați.
+    """
+    if lexicon is None:
+        lexicon = _get_lexicon()
+    candidates = lexicon.scorer.candidates(fold_diacritics(word.lower()), threshold)
+    return _best_among(word, candidates, threshold, context_words, lexicon)
+
+
+def _find_best_match(word, threshold=0.8, context_words=None, lexicon=None):
+    """
+    Găsește cel mai bun match pentru un cuvânt din dicționar
+    threshold: similaritatea minimă pentru a considera un match (mărit la 0.8)
+    context_words: cuvintele din jur pentru validare
+    
+    Candidații sunt luați din indexul de ștergeri (cel mult MAX_EDIT_DISTANCE
+    ștergeri față de forma fără diacritice a cuvântului, ca și cheile) și sunt
+    evaluați cu aceleași reguli ca la scanarea completă.
+    Returnează (match, încredere), ca _best_among.
+    """
+    if lexicon is None:
+        lexicon = _get_lexicon()
+    exact = lexicon.lookup(word.lower())
+    if exact is not None:
+        return exact, 1.0
+    
+    delete_index = lexicon.delete_index
+    if delete_index is None:
+        return _scan_best_match(word, threshold, context_words, lexicon)
+    
+    candidates = delete_index.candidates(fold_diacritics(word.lower()))
+    return _best_among(word, candidates, threshold, context_words, lexicon)
+
+
+def _suggest_among(word, candidates, k, threshold, lexicon):
+    """
+    Cei mai buni k candidați validați, ca listă de Suggestion în ordinea
+    descrescătoare a scorului (la scor egal, în ordinea dicționarului); fiecare
+    corectură apare o singură dată, cu scorul cel mai bun.
+    
+    Candidații sunt parcurși în ordinea descrescătoare a marginii scorului dată
+    de semnăturile de caractere, deci parcurgerea se oprește la primul candidat
+    care nu mai poate depăși al k-lea scor. Pentru ceilalți, real_quick_ratio()
+    și quick_ratio() (margini superioare ale ratio()) evită calculul complet
+    când candidatul oricum nu ar intra în top-k.
+    
+    Ca în _best_among, scorul folosește forma pliată a cuvântului.
+    """
+    if k <= 0:
+        return []
+    entries = lexicon.entries
+    folded = fold_diacritics(word.lower())
+    length = len(folded)
+    query = char_signature(folded)
+    
+    bounded = []
+    for position, dict_word in enumerate(candidates):
+        correct_word = entries[dict_word]
+        if not _may_validate(word, correct_word):
+            continue
+        total = length + len(dict_word.lower())
+        common = common_chars_bound(query, length, lexicon.signature(dict_word))
+        bound = _score_bound(2.0 * common / total if total else 1.0)
+        if bound + _EPSILON >= threshold:
+            bounded.append((-bound, position, dict_word, correct_word))
+    bounded.sort()
     
-    return best_match
+    # best[corectură] = (-scor, poziție, încredere); top păstrează cei mai buni k, ordonați
+    best = {}
+    top = []
+    scored = 0
+    # Ca în _similarity, cuvântul este prima secvență (ratio() depinde de ordine)
+    matcher = SequenceMatcher()
+    matcher.set_seq1(folded)
+    for negative_bound, position, dict_word, correct_word in bounded:
+        floor = threshold if len(top) < k else max(threshold, -top[-1][0])
+        if -negative_bound + _EPSILON < floor:
+            break
+        
+        matcher.set_seq2(dict_word.lower())
+        if _score_bound(matcher.real_quick_ratio()) + _EPSILON < floor:
+            continue
+        if _score_bound(matcher.quick_ratio()) + _EPSILON < floor:
+            continue
+        scored += 1
+        score = _with_bonuses(folded, dict_word, matcher.ratio())
+        # Rangul este (-scor, poziție): la scor egal cu al k-lea, candidatul mai
+        # devreme în ordinea dicționarului îl înlocuiește (ca în _best_among)
+        if score < threshold or (len(top) == k and (-score, position) >= top[-1][:2]):
+            continue
+        
+        previous = best.get(correct_word)
+        if previous is not None and (previous[0], previous[1]) <= (-score, position):
+            continue
+        confidence = _similarity(word, correct_word)
+        if confidence < 0.6:
+            continue
+        best[correct_word] = (-score, position, confidence)
+        top = sorted((rank[0], rank[1], corrected) for corrected, rank in best.items())[:k]
+    
+    stats = _collector() if _INSTRUMENTED else None
+    if stats is not None:
+        stats.record_lookup(len(candidates), scored)
+    return [Suggestion(corrected, -negative_score, best[corrected][2]) for negative_score, _, corrected in top]
+
+
+def _suggest(word, k=5, threshold=0.8, lexicon=None):
+    """
+    Cei mai buni k candidați pentru un cuvânt (vezi _suggest_among), luați din
+    indexul de ștergeri sau, fără el, din scanarea completă.
+    """
+    if lexicon is None:
+        lexicon = _get_lexicon()
+    folded = fold_diacritics(word.lower())
+    if lexicon.delete_index is not None:
+        candidates = lexicon.delete_index.candidates(folded)
+    else:
+        candidates = lexicon.scorer.candidates(folded, threshold)
+    return _suggest_among(word.lower(), candidates, k, threshold, lexicon)
+
+
+def _alternatives(word, corrected, k, threshold, lexicon):
+    """
+    Alternativele unui cuvânt pentru detalii: sugestiile diferite de corectura
+    aleasă, cu majusculele cuvântului original.
+    """
+    chosen = corrected.lower()
+    return [
+        Suggestion(_preserve_casing(word, suggestion.word), suggestion.score, suggestion.confidence)
+        for suggestion in _suggest(word, k + 1, threshold, lexicon)
+        if suggestion.word != chosen
+    ][:k]
+
+
+def _overlay_layers(overlays):
+    """Overlay-urile, de la cel mai recent (prioritatea cea mai mare) la cel mai vechi"""
+    return list(reversed(overlays.values()))
+
+
+def _set_instrumented():
+    global _INSTRUMENTED
+    _INSTRUMENTED = _STATS is not None or _ACTIVE_PROFILES > 0
+
+
+def enable_stats(enabled: bool = True) -> None:
+    """
+    Activează (sau dezactivează) statisticile globale: contoare pentru match-uri
+    exacte și fuzzy, candidați evaluați, timpi per etapă și cele mai lente cuvinte.
+    """
+    global _STATS
+    with _STATS_LOCK:
+        if not enabled:
+            _STATS = None
+        elif _STATS is None:
+            _STATS = Stats()
+        _set_instrumented()
+
+
+def get_stats() -> dict:
+    """
+    Returnează statisticile globale ca dict (contoare, timpi în secunde și
+    cele mai lente cuvinte). Toate valorile sunt 0 dacă statisticile nu sunt activate.
+    """
+    stats = _STATS
+    result = (stats if stats is not None else Stats()).as_dict()
+    result['enabled'] = stats is not None
+    return result
+
+
+def reset_stats() -> None:
+    """
+    Readuce la zero statisticile globale.
+    """
+    stats = _STATS
+    if stats is not None:
+        stats.reset()
+
+
+@contextmanager
+def profile():
+    """
+    Colectează statisticile apelurilor din blocul with, pe thread-ul curent:
+
+        with profile() as stats:
+            add_diacritics(text)
+        print(stats.as_dict())
+
+    Dacă statisticile globale sunt activate, sunt actualizate și ele.
+    """
+    global _ACTIVE_PROFILES
+    previous = getattr(_PROFILE, "stats", None)
+    stats = Stats(parent=previous if previous is not None else _STATS)
+    with _STATS_LOCK:
+        _ACTIVE_PROFILES += 1
+        _set_instrumented()
+    _PROFILE.stats = stats
+    try:
+        yield stats
+    finally:
+        _PROFILE.stats = previous
+        with _STATS_LOCK:
+            _ACTIVE_PROFILES -= 1
+            _set_instrumented()
 
 
 def _preserve_casing(original_word: str, corrected_word: str) -> str:
@@ -84,91 +413,476 @@ def _preserve_casing(original_word: str, corrected_word: str) -> str:
     return corrected_word
 
 
-def add_diacritics(text: str, similarity_threshold: float = 0.8) -> str:
+def _split_words(text: str) -> list:
+    """
+    Împarte textul într-o singură trecere în bucăți alternante
+    [separator, cuvânt, separator, ..., cuvânt, separator], astfel încât
+    "".join(bucăți) reface exact textul original. Cuvintele sunt pe pozițiile impare.
+    """
+    if not _INSTRUMENTED:
+        return _WORD_RE.split(text)
+    start = time.perf_counter()
+    parts = _WORD_RE.split(text)
+    stats = _collector()
+    if stats is not None:
+        stats.record_tokenize(time.perf_counter() - start, len(parts) // 2)
+    return parts
+
+
+class Corrector:
+    """
+    Un corector cu configurația proprie: dicționar, overlay-uri, prag de
+    similaritate și cache de rezoluții.
+
+    Dicționarul (Lexicon) și indexurile lui nu sunt modificate după construire,
+    deci același obiect poate fi împărțit între mai multe instanțe (de exemplu
+    câte una per client, cu praguri sau overlay-uri diferite) și între thread-uri.
+    Fiecare instanță are cache-ul ei, protejat de un lock; înlocuirea
+    dicționarului publică un obiect nou, complet construit. Metodele pot fi
+    apelate din mai multe thread-uri, inclusiv pe CPython fără GIL.
+
+        corrector = Corrector(load_lexicon("/srv/dict.lex"), similarity_threshold=0.85)
+        corrector.add_diacritics("Romania este o tara frumoasa")
+    """
+
+    def __init__(
+        self,
+        lexicon=None,
+        dict_path: str = None,
+        similarity_threshold: float = 0.8,
+        max_edit_distance=_MODULE_SETTING,
+        cache_size: int = _MODULE_SETTING,
+    ):
+        """
+        Args:
+            lexicon: Un Lexicon deja încărcat; dacă lipsește, dict_path este încărcat la prima utilizare
+            dict_path: Dicționarul de încărcat (implicit core.DICT_PATH)
+            similarity_threshold: Pragul implicit al metodelor de corectare
+            max_edit_distance: Distanța indexului de ștergeri (None = scanare completă);
+                implicit core.MAX_EDIT_DISTANCE, citit la încărcarea dicționarului
+            cache_size: Numărul maxim de rezoluții memorate (0 dezactivează cache-ul);
+                implicit core.RESOLUTION_CACHE_SIZE, citit la încărcarea dicționarului
+        """
+        self.dict_path = dict_path
+        self.similarity_threshold = similarity_threshold
+        self._max_edit_distance = max_edit_distance
+        self._default_cache_size = cache_size is _MODULE_SETTING
+        self._base = lexicon
+        self._overlays = {}
+        # Dicționarul folosit (cel de bază plus overlay-urile); este înlocuit
+        # doar cu obiecte complet construite, sub _lock
+        self._lexicon = lexicon
+        self._lock = threading.Lock()
+        self._cache = ResolutionCache(RESOLUTION_CACHE_SIZE if self._default_cache_size else cache_size)
+
+    @property
+    def max_edit_distance(self):
+        """Distanța indexului de ștergeri folosită la încărcarea dicționarelor"""
+        if self._max_edit_distance is _MODULE_SETTING:
+            return MAX_EDIT_DISTANCE
+        return self._max_edit_distance
+
+    @property
+    def lexicon(self):
+        """Dicționarul folosit, încărcat la prima utilizare"""
+        lexicon = self._lexicon
+        if lexicon is None:
+            with self._lock:
+                if self._lexicon is None:
+                    start = time.perf_counter()
+                    # Setările modulului pot fi schimbate până la prima corectare
+                    if self._default_cache_size:
+                        self._cache.resize(RESOLUTION_CACHE_SIZE)
+                    self._base = load_lexicon(self.dict_path or DICT_PATH, self.max_edit_distance)
+                    self._lexicon = layered(self._base, _overlay_layers(self._overlays))
+                    stats = _collector() if _INSTRUMENTED else None
+                    if stats is not None:
+                        stats.record_load(time.perf_counter() - start)
+                lexicon = self._lexicon
+        return lexicon
+
+    def _resolve_fuzzy(self, word, threshold=0.8, context_words=None, lexicon=None):
+        """
+        Rezolvă un cuvânt fără match exact, memorând rezultatul în cache-ul LRU.
+        Returnează (match, încredere); match este None dacă nu s-a găsit nimic.
+        """
+        word_lower = word.lower()
+        key = (word_lower, threshold)
+        resolution = self._cache.get(key)
+        if resolution is not None:
+            return resolution
+
+        if lexicon is None:
+            lexicon = self.lexicon
+        resolution = _find_best_match(word_lower, threshold, context_words, lexicon)
+        # Un rezultat calculat pe un dicționar înlocuit între timp nu mai intră în cache
+        with self._lock:
+            if lexicon is self._lexicon:
+                self._cache.put(key, resolution)
+        return resolution
+
+    def _resolve_word(self, word, similarity_threshold=0.8, context_words=None, lexicon=None, deadline=None):
+        """
+        Rezolvă un singur cuvânt, păstrând majusculele.
+        Returnează (corectat, tip, încredere), unde tip este 'exact', 'fuzzy' sau 'none';
+        cuvintele fără niciun match sunt returnate neschimbate.
+
+        După deadline (un moment time.perf_counter()) se face doar căutarea exactă;
+        cuvintele fără match exact sunt returnate neschimbate, cu tipul 'skipped'.
+        """
+        if lexicon is None:
+            lexicon = self.lexicon
+        stats = _collector() if _INSTRUMENTED else None
+        if stats is not None:
+            return self._resolve_word_timed(stats, word, similarity_threshold, context_words, lexicon, deadline)
+
+        # Încearcă să găsești un match exact
+        exact = lexicon.lookup(word.lower())
+        if exact is not None:
+            return _preserve_casing(word, exact), 'exact', 1.0
+
+        if deadline is not None and time.perf_counter() >= deadline:
+            return word, 'skipped', 0.0
+
+        # Încearcă fuzzy matching pentru cuvinte cu erori (cu validare strictă)
+        best_match, confidence = self._resolve_fuzzy(word, similarity_threshold, context_words, lexicon)
+        if best_match:
+            return _preserve_casing(word, best_match), 'fuzzy', confidence
+
+        # Dacă nu găsești niciun match, lasă cuvântul neschimbat
+        return word, 'none', 1.0
+
+    def _resolve_word_timed(self, stats, word, similarity_threshold, context_words, lexicon, deadline=None):
+        """
+        Ca _resolve_word, dar măsoară căutarea exactă și cea fuzzy.
+        """
+        start = time.perf_counter()
+        exact = lexicon.lookup(word.lower())
+        end = time.perf_counter()
+        exact_seconds = end - start
+        if exact is not None:
+            stats.record_word(word, 'exact', exact_seconds, None)
+            return _preserve_casing(word, exact), 'exact', 1.0
+
+        if deadline is not None and end >= deadline:
+            stats.record_word(word, 'skipped', exact_seconds, None)
+            return word, 'skipped', 0.0
+
+        start = time.perf_counter()
+        best_match, confidence = self._resolve_fuzzy(word, similarity_threshold, context_words, lexicon)
+        fuzzy_seconds = time.perf_counter() - start
+        if best_match:
+            stats.record_word(word, 'fuzzy', exact_seconds, fuzzy_seconds)
+            return _preserve_casing(word, best_match), 'fuzzy', confidence
+
+        stats.record_word(word, 'none', exact_seconds, fuzzy_seconds)
+        return word, 'none', 1.0
+
+    def _resolve_text(self, text, similarity_threshold=None, details=False, alternatives=0, budget_ms=None):
+        """
+        Motorul comun pentru add_diacritics și get_correction_details.
+
+        Returnează (bucăți, cuvinte, detalii): bucățile au cuvintele înlocuite cu
+        forma corectată, iar detaliile (doar dacă details=True, altfel None) sunt
+        un obiect Corrections cu tipul și încrederea fiecărui cuvânt și, dacă
+        alternatives > 0, cu cel mult atâtea alternative per cuvânt.
+
+        Cu budget_ms, după epuizarea bugetului restul textului este corectat doar
+        prin căutări exacte (vezi _resolve_word), fără alternative.
+
+        Textul este întâi normalizat (ş/ţ cu sedilă și formele descompuse devin
+        ș/ț, ă, â, î standard), deci cuvintele din bucăți și detalii sunt cele normalizate.
+        """
+        deadline = None if budget_ms is None else time.perf_counter() + budget_ms / 1000
+        if similarity_threshold is None:
+            similarity_threshold = self.similarity_threshold
+        parts = _split_words(normalize_text(text))
+        words = parts[1::2]
+        corrections = Corrections.empty(words, alternatives > 0) if details else None
+        # Tot textul este corectat cu același dicționar, chiar dacă între timp este reîncărcat
+        lexicon = self.lexicon
+
+        for i, word in enumerate(words):
+            # Contextul (cuvintele din jur) este o vedere, nu o copie
+            corrected, kind, confidence = self._resolve_word(
+                word, similarity_threshold, WordContext(words, i), lexicon, deadline
+            )
+            parts[2 * i + 1] = corrected
+            if corrections is not None:
+                others = None
+                if alternatives > 0:
+                    # Alternativele cer o căutare completă: nu și după epuizarea bugetului
+                    if deadline is not None and (kind == 'skipped' or time.perf_counter() >= deadline):
+                        others = []
+                    else:
+                        others = _alternatives(word, corrected, alternatives, similarity_threshold, lexicon)
+                corrections.append(corrected, kind, confidence, others)
+
+        return parts, words, corrections
+
+    def add_diacritics(
+        self, text: str, similarity_threshold: float = None, budget_ms: float = None, convention: str = "comma"
+    ) -> str:
+        """
+        Adaugă diacritice textului (vezi add_diacritics); pragul implicit este cel al instanței.
+        """
+        parts, _, _ = self._resolve_text(text, similarity_threshold, budget_ms=budget_ms)
+
+        # Spațiile și punctuația rămân exact ca în textul original
+        return apply_convention("".join(parts), convention)
+
+    def get_correction_details(
+        self, text: str, similarity_threshold: float = None, alternatives: int = 0, budget_ms: float = None
+    ) -> dict:
+        """
+        Returnează detalii despre corectările efectuate (vezi get_correction_details).
+        """
+        parts, words, corrections = self._resolve_text(text, similarity_threshold, True, alternatives, budget_ms)
+        skipped = corrections.indices_of_kind('skipped')
+
+        return {
+            'original_text': text,
+            'corrected_text': "".join(parts),
+            'corrections': corrections,
+            'total_corrected': len(words) - corrections.count_kind('none') - len(skipped),
+            'total_words': len(words),
+            'skipped': skipped,
+        }
+
+    def suggest(self, word: str, k: int = 5, similarity_threshold: float = None) -> list:
+        """
+        Cei mai buni k candidați pentru un cuvânt (vezi suggest).
+        """
+        if similarity_threshold is None:
+            similarity_threshold = self.similarity_threshold
+        return _suggest(word, k, similarity_threshold, self.lexicon)
+
+    def set_cache_size(self, maxsize: int) -> None:
+        """Schimbă numărul maxim de rezoluții memorate (0 dezactivează cache-ul)"""
+        self._default_cache_size = False
+        self._cache.resize(maxsize)
+
+    def clear_cache(self) -> None:
+        """Golește cache-ul de rezoluții și resetează contoarele"""
+        self._cache.clear()
+
+    def cache_info(self):
+        """Statisticile cache-ului: hits, misses, evictions, maxsize, currsize"""
+        return self._cache.info()
+
+    def _publish(self, base, overlays, affected=None):
+        """
+        Înlocuiește dicționarul folosit (apelat cu _lock ținut). Apelurile în
+        curs termină cu dicționarul vechi; din cache sunt scoase rezoluțiile
+        cuvintelor pentru care affected(cuvânt, prag) este adevărat (toate dacă affected lipsește).
+        """
+        lexicon = layered(base, _overlay_layers(overlays))
+        self._base, self._overlays, self._lexicon = base, overlays, lexicon
+        if affected is None:
+            self._cache.discard_if(lambda key: True)
+        else:
+            self._cache.discard_if(lambda key: affected(*key))
+
+    def _affected_by(self, layers):
+        full_scan = self._base.delete_index is None
+        return lambda word, threshold: any(may_affect(layer, word, threshold, full_scan) for layer in layers)
+
+    def set_lexicon(self, lexicon) -> None:
+        """
+        Înlocuiește atomic dicționarul de bază cu un Lexicon deja construit
+        (de exemplu load_lexicon(cale)). Overlay-urile rămân active.
+        """
+        with self._lock:
+            self._publish(lexicon, self._overlays)
+
+    def reload_dictionary(self, path: str = None) -> int:
+        """
+        Reîncarcă dicționarul de bază (din path sau din dict_path), fără să
+        oprească apelurile în curs: noul dicționar este construit complet și abia
+        apoi înlocuiește dicționarul vechi. Returnează numărul de intrări.
+        """
+        lexicon = load_lexicon(path or self.dict_path or DICT_PATH, self.max_edit_distance)
+        with self._lock:
+            if path is not None:
+                self.dict_path = path
+            self._publish(lexicon, self._overlays)
+        return len(lexicon)
+
+    def add_overlay(self, name: str, entries) -> None:
+        """
+        Adaugă (sau înlocuiește) un overlay: un dicționar mic, ca dict (formă → cuvânt)
+        sau cale către un fișier JSON, consultat înaintea dicționarului de bază.
+        Indexurile dicționarului de bază nu sunt reconstruite; din cache sunt
+        scoase doar cuvintele a căror rezoluție se poate schimba.
+        """
+        layer = load_overlay(entries, self.max_edit_distance)
+        # Overlay-urile se compun cu dicționarul de bază, care trebuie deci încărcat
+        self.lexicon
+        with self._lock:
+            overlays = dict(self._overlays)
+            changed = [layer]
+            if name in overlays:
+                changed.append(overlays.pop(name))
+            overlays[name] = layer
+            self._publish(self._base, overlays, self._affected_by(changed))
+
+    def remove_overlay(self, name: str) -> bool:
+        """
+        Elimină overlay-ul cu numele dat. Returnează False dacă nu exista.
+        """
+        with self._lock:
+            if name not in self._overlays:
+                return False
+            overlays = dict(self._overlays)
+            layer = overlays.pop(name)
+            # Un overlay există doar după încărcare, deci self._base este setat
+            self._publish(self._base, overlays, self._affected_by([layer]))
+        return True
+
+    def list_overlays(self) -> list:
+        """
+        Numele overlay-urilor active, de la cel mai vechi la cel mai recent
+        (cel mai recent are prioritatea cea mai mare).
+        """
+        return list(self._overlays)
+
+
+# Instanța folosită de funcțiile la nivel de modul
+_DEFAULT = Corrector()
+
+
+def _resolve_word(word: str, similarity_threshold: float = 0.8, context_words=None, lexicon=None):
+    """Ca Corrector._resolve_word, pentru instanța implicită"""
+    return _DEFAULT._resolve_word(word, similarity_threshold, context_words, lexicon)
+
+
+def _correct_word(word: str, similarity_threshold: float = 0.8, context_words=None) -> str:
+    """
+    Corectează un singur cuvânt, păstrând majusculele.
+    """
+    return _DEFAULT._resolve_word(word, similarity_threshold, context_words)[0]
+
+
+def _resolve_text(text: str, similarity_threshold: float = 0.8, details: bool = False):
+    """Ca Corrector._resolve_text, pentru instanța implicită"""
+    return _DEFAULT._resolve_text(text, similarity_threshold, details)
+
+
+def set_cache_size(maxsize: int) -> None:
+    """
+    Schimbă numărul maxim de rezoluții memorate (0 dezactivează cache-ul).
+    """
+    _DEFAULT.set_cache_size(maxsize)
+
+
+def clear_cache() -> None:
+    """
+    Golește cache-ul de rezoluții și resetează contoarele.
+    """
+    _DEFAULT.clear_cache()
+
+
+def cache_info():
+    """
+    Returnează statisticile cache-ului: hits, misses, evictions, maxsize, currsize.
+    """
+    return _DEFAULT.cache_info()
+
+
+def set_lexicon(lexicon) -> None:
+    """
+    Înlocuiește atomic dicționarul de bază cu un Lexicon deja construit
+    (de exemplu load_lexicon(cale)). Overlay-urile rămân active.
+    """
+    _DEFAULT.set_lexicon(lexicon)
+
+
+def reload_dictionary(path: str = None) -> int:
+    """
+    Reîncarcă dicționarul de bază (din path sau din DICT_PATH), fără să
+    oprească apelurile în curs: noul dicționar este construit complet și abia
+    apoi înlocuiește dicționarul vechi. Returnează numărul de intrări.
+    """
+    return _DEFAULT.reload_dictionary(path)
+
+
+def add_overlay(name: str, entries) -> None:
+    """
+    Adaugă (sau înlocuiește) un overlay: un dicționar mic, ca dict (formă → cuvânt)
+    sau cale către un fișier JSON, consultat înaintea dicționarului de bază.
+    Indexurile dicționarului de bază nu sunt reconstruite; din cache sunt
+    scoase doar cuvintele a căror rezoluție se poate schimba.
+    """
+    _DEFAULT.add_overlay(name, entries)
+
+
+def remove_overlay(name: str) -> bool:
+    """
+    Elimină overlay-ul cu numele dat. Returnează False dacă nu exista.
+    """
+    return _DEFAULT.remove_overlay(name)
+
+
+def list_overlays() -> list:
+    """
+    Numele overlay-urilor active, de la cel mai vechi la cel mai recent
+    (cel mai recent are prioritatea cea mai mare).
+    """
+    return _DEFAULT.list_overlays()
+
+
+def add_diacritics(
+    text: str, similarity_threshold: float = 0.8, budget_ms: float = None, convention: str = "comma"
+) -> str:
     """
     Adaugă diacritice textelor românești folosind un dicționar complet și fuzzy matching îmbunătățit.
     
     Args:
         text: Textul de corectat
         similarity_threshold: Pragul de similaritate pentru detectarea erorilor (0.8 = 80% - mai strict)
+        budget_ms: Bugetul de timp al apelului, în milisecunde; după epuizarea lui
+            restul textului este corectat doar prin căutări exacte
+            (get_correction_details arată ce cuvinte au fost sărite)
+        convention: Cum sunt scrise ș/ț în rezultat: "comma" (ș/ț, standard) sau
+            "cedilla" (ş/ţ, pentru sisteme vechi). Intrarea poate folosi oricare
+            formă, inclusiv descompusă (NFD); este normalizată înainte de căutare.
     
     Returns:
         Textul corectat cu diacritice
     """
-    words = text.split()
-    corrected_words = []
-    
-    for i, word in enumerate(words):
-        # Obține contextul (cuvintele din jur)
-        context_start = max(0, i - 2)
-        context_end = min(len(words), i + 3)
-        context_words = words[context_start:context_end]
-        
-        # Încearcă să găsești un match exact
-        if word.lower() in DICT:
-            corrected = _preserve_casing(word, DICT[word.lower()])
-            corrected_words.append(corrected)
-            continue
-        
-        # Încearcă fuzzy matching pentru cuvinte cu erori (cu validare strictă)
-        best_match = _find_best_match(word, similarity_threshold, context_words)
-        
-        if best_match:
-            corrected = _preserve_casing(word, best_match)
-            corrected_words.append(corrected)
-        else:
-            # Dacă nu găsești niciun match, lasă cuvântul neschimbat
-            corrected_words.append(word)
-    
-    return " ".join(corrected_words)
+    return _DEFAULT.add_diacritics(text, similarity_threshold, budget_ms, convention)
 
 
-def get_correction_details(text: str, similarity_threshold: float = 0.8) -> dict:
+def get_correction_details(
+    text: str, similarity_threshold: float = 0.8, alternatives: int = 0, budget_ms: float = None
+) -> dict:
     """
     Returnează detalii despre corectările efectuate.
     
+    'corrections' este o secvență compactă (Corrections), doar pentru citire:
+    fiecare element se citește ca un dict cu cheile 'original', 'corrected',
+    'type', 'confidence' și 'context', dar nu este creat decât la acces. Pentru
+    JSON sau modificări: details['corrections'].as_list() (dict-uri obișnuite)
+    sau details['corrections'].to_json(). Cu alternatives > 0, fiecare element
+    are și cheia 'alternatives': cel mult atâtea alte corecturi posibile (vezi
+    suggest), ca Suggestion(word, score, confidence).
+    
+    Cu budget_ms (vezi add_diacritics), cuvintele fără match exact rămase după
+    epuizarea bugetului au tipul 'skipped', iar 'skipped' conține pozițiile lor.
+    
     Returns:
         Dict cu informații despre corectări
     """
-    words = text.split()
-    corrections = []
-    total_corrected = 0
+    return _DEFAULT.get_correction_details(text, similarity_threshold, alternatives, budget_ms)
+
+
+def suggest(word: str, k: int = 5, similarity_threshold: float = 0.8) -> list:
+    """
+    Returnează cei mai buni k candidați pentru un cuvânt, ca listă de
+    Suggestion(word, score, confidence) în ordinea descrescătoare a scorului.
     
-    for i, word in enumerate(words):
-        # Obține contextul
-        context_start = max(0, i - 2)
-        context_end = min(len(words), i + 3)
-        context_words = words[context_start:context_end]
-        
-        correction_info = {
-            'original': word,
-            'corrected': word,
-            'type': 'none',
-            'confidence': 1.0,
-            'context': context_words
-        }
-        
-        # Verifică match exact
-        if word.lower() in DICT:
-            correction_info['corrected'] = _preserve_casing(word, DICT[word.lower()])
-            correction_info['type'] = 'exact'
-            correction_info['confidence'] = 1.0
-            total_corrected += 1
-        else:
-            # Verifică fuzzy matching
-            best_match = _find_best_match(word, similarity_threshold, context_words)
-            if best_match:
-                correction_info['corrected'] = _preserve_casing(word, best_match)
-                correction_info['type'] = 'fuzzy'
-                correction_info['confidence'] = _similarity(word.lower(), best_match.lower())
-                total_corrected += 1
-        
-        corrections.append(correction_info)
-    
-    return {
-        'original_text': text,
-        'corrected_text': " ".join([c['corrected'] for c in corrections]),
-        'corrections': corrections,
-        'total_corrected': total_corrected,
-        'total_words': len(words)
-    }
+    Candidații care nu pot intra în top-k (după marginile scorului) nu sunt
+    evaluați complet, iar căutarea se oprește când nicio margine rămasă nu
+    poate depăși al k-lea scor.
+    """
+    return _DEFAULT.suggest(word, k, similarity_threshold)
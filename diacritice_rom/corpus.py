@@ -0,0 +1,240 @@
+"""
+Corectarea unui corpus mare în două treceri.
+
+Trecerea 1 citește toate documentele și strânge vocabularul: cuvintele
+distincte, lowercase. Fiecare cuvânt este rezolvat o singură dată, în
+paralel, cu aceeași logică exactă/fuzzy ca add_diacritics. Trecerea 2
+rescrie documentele doar prin căutări în tabelul de rezoluții, deci costul
+total depinde de mărimea vocabularului, nu de numărul de cuvinte.
+
+Tabelul poate fi exportat (TSV: cuvânt, corectură, tip, încredere) pentru
+audit și refolosit la o rulare ulterioară.
+
+    table = correct_corpus(["a.txt", "b.txt"], ["out/a.txt", "out/b.txt"], table_path="rezolutii.tsv")
+"""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+from collections import Counter, namedtuple
+
+from . import core
+from .normalize import normalize_text
+from .stream import CHUNK_SIZE, _word_aligned
+
+# Rezoluția unui cuvânt (lowercase): corectura (lowercase), tipul și încrederea
+Resolution = namedtuple("Resolution", ["corrected", "type", "confidence"])
+
+# Câte cuvinte primește un proces odată la rezolvarea vocabularului
+RESOLVE_CHUNK = 256
+
+# Tabelul folosit de procesele worker la rescriere (setat de _init_rewrite)
+_TABLE = None
+
+
+def _pool(workers, initializer=None, initargs=()):
+    """Pool de procese; cu "fork", copiii moștenesc dicționarul deja încărcat"""
+    core._get_lexicon()
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork").Pool(workers, initializer, initargs)
+    return multiprocessing.Pool(workers, initializer, initargs)
+
+
+def _chunks(source):
+    """Bucățile de text ale unei surse: cale de fișier sau iterabil de str"""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "r", encoding="utf-8", newline="") as f:
+            yield from iter(lambda: f.read(CHUNK_SIZE), "")
+    else:
+        yield from source
+
+
+def _vocabulary(source):
+    """
+    Cuvintele distincte (lowercase) dintr-o sursă. Un fișier care nu poate fi
+    citit contribuie cu ce s-a citit până la eroare; eroarea apare la rescriere.
+    """
+    words = set()
+    try:
+        for text, correctable in _word_aligned(_chunks(source)):
+            if correctable:
+                words.update(map(str.lower, core._split_words(normalize_text(text))[1::2]))
+    except (OSError, UnicodeDecodeError):
+        pass
+    return words
+
+
+def collect_vocabulary(sources, workers=None) -> set:
+    """
+    Trecerea 1: cuvintele distincte (lowercase) din toate sursele.
+
+    Args:
+        sources: Căi de fișiere sau iterabile de bucăți de text (de exemplu [text])
+        workers: Numărul de procese (implicit numărul de nuclee); sursele care
+            nu sunt căi sunt citite în procesul curent
+    """
+    sources = list(sources)
+    paths = [source for source in sources if isinstance(source, (str, os.PathLike))]
+    others = [source for source in sources if not isinstance(source, (str, os.PathLike))]
+    workers = workers or os.cpu_count() or 1
+
+    vocabulary = set()
+    for source in others:
+        vocabulary |= _vocabulary(source)
+    if workers > 1 and len(paths) > 1:
+        with _pool(min(workers, len(paths))) as pool:
+            for words in pool.imap_unordered(_vocabulary, paths):
+                vocabulary |= words
+    else:
+        for path in paths:
+            vocabulary |= _vocabulary(path)
+    return vocabulary
+
+
+def _resolve_many(task):
+    """Rezolvă o bucată din vocabular (rulează într-un proces worker)"""
+    words, threshold = task
+    return [(word, Resolution(*core._resolve_word(word, threshold))) for word in words]
+
+
+def resolve_vocabulary(vocabulary, similarity_threshold: float = 0.8, workers=None) -> dict:
+    """
+    Rezolvă fiecare cuvânt din vocabular o singură dată.
+
+    Returns:
+        Dict cuvânt (lowercase) → Resolution
+    """
+    words = sorted(vocabulary)
+    workers = workers or os.cpu_count() or 1
+    tasks = [(words[i:i + RESOLVE_CHUNK], similarity_threshold) for i in range(0, len(words), RESOLVE_CHUNK)]
+
+    table = {}
+    if workers > 1 and len(tasks) > 1:
+        with _pool(min(workers, len(tasks))) as pool:
+            for resolved in pool.imap_unordered(_resolve_many, tasks):
+                table.update(resolved)
+    else:
+        for task in tasks:
+            table.update(_resolve_many(task))
+    return table
+
+
+def rewrite(text: str, table: dict, counts: Counter = None) -> str:
+    """
+    Trecerea 2: înlocuiește cuvintele textului după tabel, păstrând majusculele.
+    Cuvintele care lipsesc din tabel rămân neschimbate. Dacă se dă counts,
+    numără tipurile rezoluțiilor folosite. Textul este normalizat ca la add_diacritics.
+    """
+    parts = core._split_words(normalize_text(text))
+    for i in range(1, len(parts), 2):
+        word = parts[i]
+        resolution = table.get(word.lower())
+        if resolution is None:
+            continue
+        if counts is not None:
+            counts[resolution.type] += 1
+        if resolution.type != 'none':
+            parts[i] = core._preserve_casing(word, resolution.corrected)
+    return "".join(parts)
+
+
+def _init_rewrite(table):
+    global _TABLE
+    _TABLE = table
+
+
+def _rewrite_file(task, table=None):
+    """
+    Rescrie un fișier după tabel (rulează într-un proces worker).
+    Returnează (sursă, contoare pe tipuri, octeți, eroare sau None).
+    """
+    source, destination = task
+    table = _TABLE if table is None else table
+    counts = Counter()
+    size = 0
+    try:
+        directory = os.path.dirname(destination) or "."
+        os.makedirs(directory, exist_ok=True)
+        # Scrie într-un fișier temporar și îl mută la final (sigur și când sursa = destinația)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".diacritice-")
+        try:
+            with open(fd, "w", encoding="utf-8", newline="") as outfile:
+                for text, correctable in _word_aligned(_chunks(source)):
+                    size += len(text.encode("utf-8"))
+                    outfile.write(rewrite(text, table, counts) if correctable else text)
+            # mkstemp creează fișierul cu 0600; rezultatul păstrează drepturile sursei
+            shutil.copymode(source, tmp_path)
+            os.replace(tmp_path, destination)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, UnicodeDecodeError) as exc:
+        return source, counts, size, str(exc)
+    return source, counts, size, None
+
+
+def rewrite_files(sources, destinations, table: dict, workers=None):
+    """
+    Trecerea 2 pentru fișiere: rescrie fiecare sursă în destinația ei.
+
+    Yields:
+        (sursă, contoare pe tipuri, octeți, eroare sau None), în ordinea surselor
+    """
+    tasks = list(zip(sources, destinations))
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(tasks) > 1:
+        # Tabelul ajunge o singură dată în fiecare proces, nu cu fiecare fișier
+        with _pool(min(workers, len(tasks)), _init_rewrite, (table,)) as pool:
+            yield from pool.imap(_rewrite_file, tasks)
+    else:
+        for task in tasks:
+            yield _rewrite_file(task, table)
+
+
+def export_table(table: dict, path: str) -> None:
+    """Scrie tabelul de rezoluții ca TSV (cuvânt, corectură, tip, încredere), sortat"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+        for word in sorted(table):
+            resolution = table[word]
+            f.write(f"{word}\t{resolution.corrected}\t{resolution.type}\t{resolution.confidence!r}\n")
+    os.replace(tmp_path, path)
+
+
+def load_table(path: str) -> dict:
+    """Citește un tabel scris de export_table"""
+    table = {}
+    with open(path, "r", encoding="utf-8", newline="\n") as f:
+        for line in f:
+            word, corrected, kind, confidence = line.rstrip("\n").split("\t")
+            table[word] = Resolution(corrected, kind, float(confidence))
+    return table
+
+
+def correct_corpus(sources, destinations, similarity_threshold: float = 0.8, workers=None, table_path=None) -> dict:
+    """
+    Corectează fișierele în două treceri: vocabular → rezoluții → rescriere.
+
+    Args:
+        sources: Căile fișierelor de corectat
+        destinations: Căile fișierelor corectate (pot coincide cu sursele)
+        similarity_threshold: Pragul de similaritate, ca la add_diacritics
+        workers: Numărul de procese (implicit numărul de nuclee)
+        table_path: Dacă este dat, tabelul de rezoluții este exportat aici
+
+    Returns:
+        Tabelul de rezoluții (cuvânt lowercase → Resolution)
+    """
+    sources = list(sources)
+    destinations = list(destinations)
+    if len(sources) != len(destinations):
+        raise ValueError("sources și destinations trebuie să aibă aceeași lungime")
+
+    table = resolve_vocabulary(collect_vocabulary(sources, workers), similarity_threshold, workers)
+    if table_path is not None:
+        export_table(table, table_path)
+    for source, _, _, error in rewrite_files(sources, destinations, table, workers):
+        if error is not None:
+            raise OSError(f"{source}: {error}")
+    return table
@@ -0,0 +1,182 @@
+"""
+Detaliile corecturilor (get_correction_details), ținute compact.
+
+Pentru un text se păstrează doar listele de cuvinte (originale și corectate),
+tipul fiecărei rezoluții (un octet) și încrederea (un double). Înregistrările
+per cuvânt și contextul lor sunt create abia când sunt citite; contoarele
+(count_kind, indices_of_kind) nu creează nicio înregistrare.
+
+get_correction_details returnează această formă compactă (Corrections), doar
+pentru citire; pentru JSON sau modificări se folosește as_list() sau to_json().
+"""
+
+import json
+from array import array
+from collections import namedtuple
+from collections.abc import Mapping, Sequence
+
+# 'skipped': cuvânt fără match exact, necăutat fuzzy pentru că bugetul de timp s-a epuizat
+KINDS = ("exact", "fuzzy", "none", "skipped")
+KIND_CODES = {kind: code for code, kind in enumerate(KINDS)}
+
+# Un candidat propus de suggest(): corectura, scorul (cu bonusuri) și încrederea
+Suggestion = namedtuple("Suggestion", ["word", "score", "confidence"])
+
+# Contextul unui cuvânt: câte cuvinte înainte și după el
+CONTEXT_BEFORE = 2
+CONTEXT_AFTER = 2
+
+
+class WordContext(Sequence):
+    """
+    Cuvintele din jurul unui cuvânt (inclusiv el), ca vedere asupra listei de
+    cuvinte a textului; se compară egal cu lista echivalentă.
+    """
+
+    __slots__ = ("_words", "_index")
+
+    def __init__(self, words, index):
+        self._words = words
+        self._index = index
+
+    def _bounds(self):
+        return max(0, self._index - CONTEXT_BEFORE), min(len(self._words), self._index + CONTEXT_AFTER + 1)
+
+    def __len__(self):
+        start, end = self._bounds()
+        return end - start
+
+    def __getitem__(self, i):
+        start, end = self._bounds()
+        return self._words[start:end][i]
+
+    def __iter__(self):
+        start, end = self._bounds()
+        return iter(self._words[start:end])
+
+    def __eq__(self, other):
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class Correction(Mapping):
+    """
+    Rezoluția unui cuvânt. Se citește ca un dict cu cheile 'original',
+    'corrected', 'type', 'confidence' și 'context' (sau ca atribute), plus
+    'alternatives' (listă de Suggestion) dacă au fost cerute alternative;
+    as_dict() dă un dict obișnuit, de exemplu pentru JSON.
+    """
+
+    __slots__ = ("original", "corrected", "type", "confidence", "alternatives", "_words", "_index")
+
+    _KEYS = ("original", "corrected", "type", "confidence", "context")
+    _KEYS_WITH_ALTERNATIVES = _KEYS + ("alternatives",)
+
+    def __init__(self, original, corrected, kind, confidence, words, index, alternatives=None):
+        self.original = original
+        self.corrected = corrected
+        self.type = kind
+        self.confidence = confidence
+        self.alternatives = alternatives
+        self._words = words
+        self._index = index
+
+    @property
+    def context(self):
+        return WordContext(self._words, self._index)
+
+    def _keys(self):
+        return self._KEYS if self.alternatives is None else self._KEYS_WITH_ALTERNATIVES
+
+    def __getitem__(self, key):
+        if key not in self._keys():
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __len__(self):
+        return len(self._keys())
+
+    def as_dict(self):
+        result = dict(self)
+        result["context"] = list(self.context)
+        if self.alternatives is not None:
+            result["alternatives"] = [suggestion._asdict() for suggestion in self.alternatives]
+        return result
+
+    def __repr__(self):
+        return f"Correction({self.as_dict()!r})"
+
+
+class Corrections(Sequence):
+    """
+    Rezoluțiile tuturor cuvintelor unui text, în tablouri paralele;
+    elementele sunt obiecte Correction create la citire.
+    """
+
+    __slots__ = ("_words", "_corrected", "_kinds", "_confidences", "_alternatives")
+
+    def __init__(self, words, corrected, kinds, confidences, alternatives=None):
+        self._words = words
+        self._corrected = corrected
+        self._kinds = kinds
+        self._confidences = confidences
+        self._alternatives = alternatives
+
+    @classmethod
+    def empty(cls, words, alternatives=False):
+        return cls(words, [], bytearray(), array("d"), [] if alternatives else None)
+
+    def append(self, corrected, kind, confidence, alternatives=None):
+        self._corrected.append(corrected)
+        self._kinds.append(KIND_CODES[kind])
+        self._confidences.append(confidence)
+        if self._alternatives is not None:
+            self._alternatives.append(alternatives)
+
+    def __len__(self):
+        return len(self._corrected)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("index în afara listei de corecturi")
+        alternatives = self._alternatives[i] if self._alternatives is not None else None
+        return Correction(
+            self._words[i], self._corrected[i], KINDS[self._kinds[i]], self._confidences[i], self._words, i,
+            alternatives,
+        )
+
+    def count_kind(self, kind):
+        """Numărul de cuvinte rezolvate cu tipul dat ('exact', 'fuzzy', 'none' sau 'skipped')"""
+        return self._kinds.count(KIND_CODES[kind])
+
+    def indices_of_kind(self, kind):
+        """Pozițiile cuvintelor rezolvate cu tipul dat"""
+        code = KIND_CODES[kind]
+        return [i for i, value in enumerate(self._kinds) if value == code]
+
+    def as_list(self):
+        """Lista de dict-uri obișnuite (de exemplu pentru JSON sau pentru modificări)"""
+        return [correction.as_dict() for correction in self]
+
+    def to_json(self, **kwargs):
+        """Corecturile ca text JSON; kwargs sunt transmise lui json.dumps"""
+        return json.dumps(self.as_list(), **kwargs)
+
+    def __eq__(self, other):
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Corrections({self.as_list()!r})"
@@ -0,0 +1,204 @@
+"""
+Corectare incrementală pentru editoare: după fiecare modificare sunt
+re-rezolvate doar cuvintele afectate și contextul lor, nu tot documentul.
+
+Documentul este ținut în blocuri de cel mult BLOCK_WORDS cuvinte; fiecare
+bloc păstrează bucățile de text (ca _split_words) și varianta lor corectată.
+O modificare re-tokenizează doar blocurile atinse și vecinii lor, iar
+cuvintele neschimbate din afara ferestrei de context își păstrează rezoluția.
+
+Offset-urile se referă la textul original, deci textul nu este normalizat ca
+întreg; fiecare cuvânt este normalizat (vezi normalize) înainte de corectare,
+ceea ce dă același rezultat ca add_diacritics.
+"""
+
+from collections import namedtuple
+
+from . import core
+from .normalize import normalize_text
+
+# Numărul maxim de cuvinte dintr-un bloc
+BLOCK_WORDS = 256
+
+# Câte cuvinte de fiecare parte a modificării sunt re-rezolvate (ca fereastra de context din core)
+CONTEXT_WORDS = 2
+
+# O zonă din textul corectat anterior, [start, end), înlocuită cu text
+Change = namedtuple("Change", ["start", "end", "text"])
+
+
+class _Block:
+    __slots__ = ("parts", "corrected", "length", "corrected_length")
+
+    def __init__(self, parts, corrected):
+        self.parts = parts
+        self.corrected = corrected
+        self.length = sum(map(len, parts))
+        self.corrected_length = sum(map(len, corrected))
+
+
+def _joined(blocks, attribute):
+    """Bucățile alternante (separator, cuvânt, ...) ale mai multor blocuri consecutive"""
+    parts = list(getattr(blocks[0], attribute))
+    for block in blocks[1:]:
+        block_parts = getattr(block, attribute)
+        # Blocul anterior se termină cu un separator gol, continuat de primul separator al blocului
+        parts[-1] += block_parts[0]
+        parts.extend(block_parts[1:])
+    return parts
+
+
+def _common_prefix(a, b):
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def _common_suffix(a, b, limit):
+    """Lungimea sufixului comun, fără să depășească limit elemente"""
+    n = min(len(a), len(b)) - limit
+    i = 0
+    while i < n and a[-1 - i] == b[-1 - i]:
+        i += 1
+    return i
+
+
+class IncrementalDocument:
+    """
+    Un document corectat care primește modificări de tipul
+    (offset, lungime ștearsă, text inserat), cu offset-uri în textul original.
+
+        doc = IncrementalDocument("Romania este o tara")
+        doc.corrected                    # "România este o țară"
+        doc.edit(19, 0, " frumoasa")     # [Change(start=19, end=19, text=" frumoasă")]
+
+    edit() returnează zonele din textul corectat anterior care s-au schimbat,
+    astfel încât un editor poate actualiza doar acele porțiuni.
+    """
+
+    def __init__(self, text: str = "", similarity_threshold: float = 0.8, block_words: int = BLOCK_WORDS):
+        if block_words < 1:
+            raise ValueError("block_words trebuie să fie >= 1")
+        self.similarity_threshold = similarity_threshold
+        self._block_words = block_words
+        parts = core._split_words(text)
+        self._blocks = self._make_blocks(parts, self._resolve_all(parts))
+
+    def __len__(self):
+        return sum(block.length for block in self._blocks)
+
+    @property
+    def text(self) -> str:
+        """Textul original, cu toate modificările aplicate"""
+        return "".join(part for block in self._blocks for part in block.parts)
+
+    @property
+    def corrected(self) -> str:
+        """Textul corectat"""
+        return "".join(part for block in self._blocks for part in block.corrected)
+
+    def _resolve(self, words, indices):
+        """Corectează cuvintele de pe pozițiile date, cu contextul lor"""
+        threshold = self.similarity_threshold
+        return {
+            i: core._correct_word(
+                normalize_text(words[i]), threshold, [normalize_text(word) for word in words[max(0, i - 2):i + 3]]
+            )
+            for i in indices
+        }
+
+    def _resolve_all(self, parts):
+        words = parts[1::2]
+        corrected = list(parts)
+        for i, word in self._resolve(words, range(len(words))).items():
+            corrected[2 * i + 1] = word
+        return corrected
+
+    def _make_blocks(self, parts, corrected):
+        """
+        Împarte bucățile în blocuri; fiecare bloc (în afară de ultimul) se termină
+        imediat după un cuvânt, deci tokenizarea lui separată dă aceleași cuvinte.
+        """
+        step = 2 * self._block_words
+        blocks = []
+        start = 0
+        while len(parts) - start > step + 1:
+            end = start + step
+            blocks.append(_Block(parts[start:end] + [""], corrected[start:end] + [""]))
+            start = end
+        blocks.append(_Block(parts[start:], corrected[start:]))
+        return blocks
+
+    def _locate(self, offset):
+        """Indexul blocului care conține offset-ul și începutul acestuia (în original și corectat)"""
+        start = corrected_start = 0
+        last = len(self._blocks) - 1
+        for i, block in enumerate(self._blocks):
+            if offset <= start + block.length or i == last:
+                return i, start, corrected_start
+            start += block.length
+            corrected_start += block.corrected_length
+
+    def edit(self, offset: int, removed: int, inserted: str = "") -> list:
+        """
+        Înlocuiește removed caractere de la offset cu textul inserat și
+        re-corectează doar cuvintele afectate.
+
+        Returns:
+            Lista de Change(start, end, text): zona [start, end) din textul
+            corectat anterior trebuie înlocuită cu text (listă goală dacă
+            textul corectat nu s-a schimbat)
+        """
+        if offset < 0 or removed < 0 or offset + removed > len(self):
+            raise ValueError("modificarea depășește limitele documentului")
+
+        first, start, corrected_start = self._locate(offset)
+        last, _, _ = self._locate(offset + removed)
+        # Vecinii sunt incluși: un cuvânt de la marginea unui bloc se poate uni cu cel alăturat
+        if first > 0:
+            first -= 1
+            start -= self._blocks[first].length
+            corrected_start -= self._blocks[first].corrected_length
+        last = min(last + 1, len(self._blocks) - 1)
+        region = self._blocks[first:last + 1]
+
+        old_parts = _joined(region, "parts")
+        old_corrected = _joined(region, "corrected")
+        text = "".join(old_parts)
+        local = offset - start
+        parts = core._split_words(text[:local] + inserted + text[local + removed:])
+
+        # Cuvintele neschimbate la început și la sfârșit își păstrează rezoluția
+        # (dacă nu sunt în fereastra de context a modificării)
+        old_words = old_parts[1::2]
+        words = parts[1::2]
+        same = _common_prefix(old_parts, parts)
+        prefix = same // 2
+        suffix = _common_suffix(old_parts, parts, same) // 2
+        corrected = list(parts)
+        shift = len(old_words) - len(words)
+        lo = max(0, prefix - CONTEXT_WORDS)
+        hi = min(len(words), len(words) - suffix + CONTEXT_WORDS)
+        for i in range(len(words)):
+            if i < lo:
+                corrected[2 * i + 1] = old_corrected[2 * i + 1]
+            elif i >= hi:
+                corrected[2 * i + 1] = old_corrected[2 * (i + shift) + 1]
+        for i, word in self._resolve(words, range(lo, hi)).items():
+            corrected[2 * i + 1] = word
+
+        self._blocks[first:last + 1] = self._make_blocks(parts, corrected)
+
+        old_text = "".join(old_corrected)
+        new_text = "".join(corrected)
+        head = _common_prefix(old_text, new_text)
+        tail = _common_suffix(old_text, new_text, head)
+        if head == len(old_text) == len(new_text):
+            return []
+        return [Change(
+            corrected_start + head,
+            corrected_start + len(old_text) - tail,
+            new_text[head:len(new_text) - tail],
+        )]
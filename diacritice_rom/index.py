@@ -0,0 +1,201 @@
+"""
+Indexuri construite peste dicționar pentru căutarea rapidă.
+"""
+
+from array import array
+
+# Tabel de pliere a diacriticelor (inclusiv formele cu sedilă) la ASCII
+_FOLD_TABLE = str.maketrans("ăâîșşțţĂÂÎȘŞȚŢ", "aaissttAAISSTT")
+
+
+def fold_diacritics(word):
+    """
+    Elimină diacriticele: țară -> tara, ȘCOALĂ -> SCOALA.
+    """
+    return word.translate(_FOLD_TABLE)
+
+
+def build_folded_index(dictionary):
+    """
+    Construiește indexul după cheia fără diacritice pentru cheile care nu
+    sunt deja ASCII. Cheile prezente în dicționar nu sunt duplicate, așa că
+    pentru un dicționar cu chei ASCII indexul rămâne gol.
+    """
+    folded = {}
+    for key, value in dictionary.items():
+        folded_key = fold_diacritics(key)
+        if folded_key != key and folded_key not in dictionary:
+            folded.setdefault(folded_key, value)
+    return folded
+
+
+def _deletes(word, max_distance):
+    """
+    Generează toate variantele obținute prin ștergerea a cel mult
+    max_distance caractere din cuvânt (inclusiv cuvântul însuși).
+    """
+    result = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        next_frontier = set()
+        for variant in frontier:
+            for i in range(len(variant)):
+                next_frontier.add(variant[:i] + variant[i + 1:])
+        next_frontier -= result
+        result |= next_frontier
+        frontier = next_frontier
+    return result
+
+
+class DeleteIndex:
+    """
+    Index de tip SymSpell (symmetric delete) peste cheile dicționarului.
+
+    Fiecare cheie este înregistrată sub toate variantele sale cu cel mult
+    max_distance caractere șterse. La căutare se generează aceleași variante
+    pentru cuvântul primit, așa că sunt găsite doar cheile aflate la o
+    distanță de editare mărginită, fără a parcurge tot dicționarul.
+
+    Pozițiile cheilor sunt păstrate în tablouri plate (offsets + postings),
+    care se pot salva și reîncărca direct din dicționarul precompilat.
+    """
+
+    __slots__ = ("max_distance", "_keys", "_variants", "_offsets", "_postings")
+
+    def __init__(self, words, max_distance=2):
+        keys = list(words)
+        buckets = {}
+        for position, key in enumerate(keys):
+            for variant in _deletes(key, max_distance):
+                buckets.setdefault(variant, []).append(position)
+
+        offsets = array("I", [0])
+        postings = array("I")
+        for positions in buckets.values():
+            postings.extend(positions)
+            offsets.append(len(postings))
+
+        self.max_distance = max_distance
+        self._keys = keys
+        self._variants = {variant: slot for slot, variant in enumerate(buckets)}
+        self._offsets = offsets
+        self._postings = postings
+
+    @classmethod
+    def from_arrays(cls, max_distance, keys, variants, offsets, postings):
+        """Reconstruiește indexul din tablourile produse de to_arrays()"""
+        index = cls.__new__(cls)
+        index.max_distance = max_distance
+        index._keys = keys
+        index._variants = {variant: slot for slot, variant in enumerate(variants)}
+        index._offsets = offsets
+        index._postings = postings
+        return index
+
+    def to_arrays(self):
+        """Returnează (keys, variants, offsets, postings) pentru serializare"""
+        return self._keys, list(self._variants), self._offsets, self._postings
+
+    def __len__(self):
+        return len(self._keys)
+
+    def candidates(self, word):
+        """
+        Returnează cheile aflate la cel mult max_distance ștergeri de cuvânt,
+        în ordinea în care apar în dicționar.
+        """
+        offsets = self._offsets
+        positions = set()
+        for variant in _deletes(word, self.max_distance):
+            slot = self._variants.get(variant)
+            if slot is not None:
+                positions.update(self._postings[offsets[slot]:offsets[slot + 1]])
+        return [self._keys[position] for position in sorted(positions)]
+
+
+class LengthBuckets:
+    """
+    Partiționează intrările după prima literă (fără diacritice) și lungimea corecturii.
+
+    _validate_correction respinge orice corectură care începe cu altă literă
+    decât cuvântul sau a cărei lungime diferă cu mai mult de max_length_diff,
+    așa că scanarea fuzzy poate vizita doar gălețile care pot trece validarea.
+    Prima literă este pliată, pentru că scanarea primește cuvântul pliat; gălețile
+    sunt astfel un superset, iar validarea exactă rămâne în core.
+    """
+
+    __slots__ = ("max_length_diff", "_keys", "_buckets")
+
+    def __init__(self, entries, max_length_diff=3):
+        self.max_length_diff = max_length_diff
+        self._keys = []
+        self._buckets = {}
+        for position, (key, value) in enumerate(entries.items()):
+            self._keys.append(key)
+            # O corectură goală nu are primă literă de comparat
+            first = fold_diacritics(value[0].lower()) if value else ""
+            self._buckets.setdefault((first, len(value)), []).append(position)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def candidates(self, word):
+        """
+        Returnează cheile ale căror corecturi pot trece validarea pentru cuvânt,
+        în ordinea în care apar în dicționar.
+        """
+        first = fold_diacritics(word[0].lower()) if word else ""
+        lengths = range(len(word) - self.max_length_diff, len(word) + self.max_length_diff + 1)
+        positions = []
+        for length in lengths:
+            positions.extend(self._buckets.get((first, length), ()))
+            if length == 0 and first:
+                positions.extend(self._buckets.get(("", 0), ()))
+        positions.sort()
+        return [self._keys[position] for position in positions]
+
+
+# Semnăturile de caractere: prima și a doua apariție a fiecărei litere românești
+# au biți proprii; aparițiile următoare și celelalte caractere împart biții rămași.
+_SIGNATURE_LETTERS = {ch: i for i, ch in enumerate("abcdefghijklmnopqrstuvwxyzăâîșț")}
+_SIGNATURE_BITS = 64
+
+
+def _signature_bit(ch, occurrence):
+    index = _SIGNATURE_LETTERS.get(ch)
+    if index is None:
+        return (ord(ch) + occurrence) % _SIGNATURE_BITS
+    if occurrence <= 2:
+        return index + (occurrence - 1) * len(_SIGNATURE_LETTERS)
+    return 2 * len(_SIGNATURE_LETTERS) + (index & 1)
+
+
+def char_signature(word):
+    """
+    Semnătura pe 64 de biți a multisetului de caractere al unui cuvânt (deja
+    lowercase): a k-a apariție a caracterului c setează bitul (c, k). Două
+    caractere comune setează același bit în ambele semnături.
+    """
+    seen = {}
+    signature = 0
+    for ch in word:
+        occurrence = seen.get(ch, 0) + 1
+        seen[ch] = occurrence
+        signature |= 1 << _signature_bit(ch, occurrence)
+    return signature
+
+
+def common_chars_bound(query_signature, query_length, signature):
+    """
+    Margine superioară a numărului de caractere comune (cu multiplicitate)
+    dintre cuvântul căutat și o cheie, deci și a blocurilor găsite de
+    SequenceMatcher. Caracterele cuvântului care au nimerit pe același bit
+    sunt adăugate, ca marginea să rămână validă.
+    """
+    query_bits = bin(query_signature).count("1")
+    return bin(query_signature & signature).count("1") + query_length - query_bits
+
+
+def build_signatures(entries):
+    """Semnătura fiecărei chei din dicționar"""
+    return {key: char_signature(key.lower()) for key in entries}
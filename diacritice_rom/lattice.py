@@ -0,0 +1,356 @@
+"""
+Dezambiguizare prin context: mai multe forme cu diacritice pentru același cuvânt.
+
+Multe forme fără diacritice corespund mai multor cuvinte valide ("fata" →
+fata/fată, "tata" → tata/tată, "casa" → casa/casă), dar dicționarul păstrează
+o singură țintă. În modul lattice, fiecare cuvânt primește toate variantele
+cunoscute (cel mult MAX_ALTERNATIVES), iar secvența cea mai probabilă este
+aleasă cu Viterbi cu beam (cel mult BEAM stări per cuvânt) peste un model de
+bigrame. Costul per cuvânt este mărginit (BEAM x MAX_ALTERNATIVES scoruri),
+deci timpul total este liniar în lungimea textului.
+
+Modelul de bigrame este învățat dintr-un corpus cu diacritice corecte și
+salvat compact: cheile sunt hash-uri pe 64 de biți sortate, iar log-probabilitățile
+sunt cuantizate pe un octet. Fără model, rezultatul este cel al add_diacritics.
+
+Generare model:
+    python -m diacritice_rom.lattice corpus.txt [bigrams.bin] [--min-count 2]
+"""
+
+import argparse
+import hashlib
+import math
+import os
+import re
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from functools import lru_cache
+
+from . import core
+from .index import fold_diacritics
+from .normalize import normalize_text
+
+MAGIC = b"DIAROMBG"
+FORMAT_VERSION = 1
+
+# Modelul implicit; variabila de mediu DIACRITICE_ROM_BIGRAMS permite folosirea altui fișier
+MODEL_PATH = os.environ.get("DIACRITICE_ROM_BIGRAMS") or os.path.join(os.path.dirname(__file__), "bigrams.bin")
+
+# Variantele păstrate pentru un cuvânt și stările păstrate la fiecare pas Viterbi
+MAX_ALTERNATIVES = 4
+BEAM = 4
+
+# Log-probabilitățile (logaritm natural) sunt salvate ca -logp / QUANT_STEP, pe un octet
+QUANT_STEP = 0.1
+_MAX_QUANT = 255
+
+# Backoff simplu (stupid backoff): bigramă nevăzută → log(0.4) + unigrama
+_BACKOFF = math.log(0.4)
+
+# Începutul de propoziție
+_START = "<s>"
+_SENTENCE_END = re.compile(r"[.!?\n]")
+
+# magic, versiune, număr de unigrame, număr de bigrame, octeți de variante, pasul de cuantizare
+_HEADER = struct.Struct("<8sIIIIf")
+
+_MODEL = None
+_MODEL_LOADED = False
+_MODEL_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=65536)
+def _hash(text):
+    """Hash stabil pe 64 de biți (același între procese și versiuni de Python)"""
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _bigram_hash(previous, word):
+    return _hash(previous + "\0" + word)
+
+
+def _quantize(log_prob):
+    return min(_MAX_QUANT, int(round(-log_prob / QUANT_STEP)))
+
+
+def _sorted_table(scores):
+    """Tablourile (chei sortate, scoruri cuantizate) pentru un dict hash → log-probabilitate"""
+    keys = array("Q")
+    values = bytearray()
+    for key in sorted(scores):
+        keys.append(key)
+        values.append(_quantize(scores[key]))
+    return keys, bytes(values)
+
+
+def _sentences(text):
+    """Cuvintele (lowercase, normalizate) din text, grupate pe propoziții"""
+    parts = core._split_words(normalize_text(text))
+    sentence = []
+    for i in range(1, len(parts), 2):
+        if sentence and _SENTENCE_END.search(parts[i - 1]):
+            yield sentence
+            sentence = []
+        sentence.append(parts[i].lower())
+    if sentence:
+        yield sentence
+
+
+class BigramModel:
+    """
+    Model de bigrame compact: unigrame și bigrame ca hash-uri sortate cu
+    log-probabilități cuantizate, plus variantele cu diacritice ale formelor ambigue.
+    """
+
+    __slots__ = ("_unigram_keys", "_unigram_scores", "_bigram_keys", "_bigram_scores", "alternatives")
+
+    def __init__(self, unigram_keys, unigram_scores, bigram_keys, bigram_scores, alternatives):
+        self._unigram_keys = unigram_keys
+        self._unigram_scores = unigram_scores
+        self._bigram_keys = bigram_keys
+        self._bigram_scores = bigram_scores
+        self.alternatives = alternatives
+
+    @classmethod
+    def train(cls, texts, min_count=1):
+        """
+        Învață modelul din texte cu diacritice corecte.
+
+        Args:
+            texts: Iterabil de str (de exemplu un fișier deschis în mod text)
+            min_count: Bigramele mai rare de atât nu sunt păstrate
+        """
+        unigrams = Counter()
+        bigrams = Counter()
+        for text in texts:
+            for sentence in _sentences(text):
+                unigrams.update(sentence)
+                bigrams.update(zip([_START] + sentence, sentence))
+                unigrams[_START] += 1
+
+        total = sum(unigrams.values()) or 1
+        unigram_scores = {_hash(word): math.log(count / total) for word, count in unigrams.items()}
+        bigram_scores = {
+            _bigram_hash(previous, word): math.log(count / unigrams[previous])
+            for (previous, word), count in bigrams.items()
+            if count >= min_count
+        }
+
+        # Formele fără diacritice care corespund mai multor cuvinte din corpus
+        groups = {}
+        for word, _ in unigrams.most_common():
+            if word != _START:
+                groups.setdefault(fold_diacritics(word), []).append(word)
+        alternatives = {
+            folded: words[:MAX_ALTERNATIVES] for folded, words in groups.items() if len(words) > 1
+        }
+
+        return cls(*_sorted_table(unigram_scores), *_sorted_table(bigram_scores), alternatives)
+
+    def write(self, path):
+        """Salvează modelul în format binar; returnează calea fișierului"""
+        blob = "\n".join(
+            "\t".join([folded] + words) for folded, words in self.alternatives.items()
+        ).encode("utf-8")
+        keys = [self._unigram_keys, self._bigram_keys]
+        if sys.byteorder == "big":
+            keys = [array("Q", k) for k in keys]
+            for k in keys:
+                k.byteswap()
+
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(
+                MAGIC, FORMAT_VERSION, len(self._unigram_keys), len(self._bigram_keys), len(blob), QUANT_STEP
+            ))
+            f.write(keys[0].tobytes())
+            f.write(self._unigram_scores)
+            f.write(keys[1].tobytes())
+            f.write(self._bigram_scores)
+            f.write(blob)
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        """Încarcă un model salvat cu write()"""
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, unigram_count, bigram_count, blob_size, step = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != FORMAT_VERSION or abs(step - QUANT_STEP) > 1e-6:
+            raise ValueError(f"{path} nu este un model de bigrame compatibil")
+
+        position = _HEADER.size
+        sections = []
+        for count in (unigram_count, bigram_count):
+            keys = array("Q")
+            keys.frombytes(data[position:position + 8 * count])
+            if sys.byteorder == "big":
+                keys.byteswap()
+            position += 8 * count
+            sections += [keys, data[position:position + count]]
+            position += count
+
+        alternatives = {}
+        for line in data[position:position + blob_size].decode("utf-8").splitlines():
+            folded, *words = line.split("\t")
+            alternatives[folded] = words
+        return cls(*sections, alternatives)
+
+    def __len__(self):
+        return len(self._bigram_keys)
+
+    @staticmethod
+    def _find(keys, scores, key):
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            return -scores[i] * QUANT_STEP
+        return None
+
+    def log_prob(self, previous, word):
+        """log P(word | previous), cu backoff la unigramă"""
+        score = self._find(self._bigram_keys, self._bigram_scores, _bigram_hash(previous, word))
+        if score is not None:
+            return score
+        unigram = self._find(self._unigram_keys, self._unigram_scores, _hash(word))
+        if unigram is None:
+            unigram = -_MAX_QUANT * QUANT_STEP
+        return _BACKOFF + unigram
+
+
+def get_model():
+    """Modelul implicit (MODEL_PATH), încărcat la primul apel; None dacă nu există"""
+    global _MODEL, _MODEL_LOADED
+    if not _MODEL_LOADED:
+        with _MODEL_LOCK:
+            if not _MODEL_LOADED:
+                _MODEL = BigramModel.load(MODEL_PATH) if os.path.exists(MODEL_PATH) else None
+                _MODEL_LOADED = True
+    return _MODEL
+
+
+def _candidates(corrected, alternatives):
+    """Variantele (lowercase) pentru un cuvânt ambiguu; prima este rezoluția obișnuită"""
+    default = corrected.lower()
+    candidates = [default] + [alt for alt in alternatives if alt != default]
+    return candidates[:MAX_ALTERNATIVES]
+
+
+def _viterbi(lattice, starts, model, beam):
+    """
+    Cea mai probabilă secvență prin lattice (listă de liste de variante).
+    starts[i] este True dacă poziția i începe o propoziție. Returnează
+    indexul variantei alese pentru fiecare poziție.
+    """
+    # Fiecare stare: (scor, variantă, indexul stării anterioare)
+    previous = [(0.0, _START, -1)]
+    history = []
+    for candidates, start in zip(lattice, starts):
+        if len(candidates) == 1 and len(previous) == 1:
+            # Toate drumurile trec prin acest cuvânt: scorul nu mai schimbă alegerea
+            states = [(0.0, candidates[0], 0)]
+        else:
+            states = []
+            for candidate in candidates:
+                best = None
+                for j, (score, word, _) in enumerate(previous):
+                    total = score + model.log_prob(_START if start else word, candidate)
+                    if best is None or total > best[0]:
+                        best = (total, candidate, j)
+                states.append(best)
+            # La scor egal rămâne prima variantă (rezoluția obișnuită)
+            order = sorted(range(len(states)), key=lambda k: -states[k][0])[:beam]
+            states = [states[k] for k in sorted(order)]
+        history.append(states)
+        previous = states
+
+    choice = []
+    best = max(range(len(previous)), key=lambda k: (previous[k][0], -k))
+    for position in range(len(history) - 1, -1, -1):
+        state = history[position][best]
+        choice.append(lattice[position].index(state[1]))
+        best = state[2]
+    choice.reverse()
+    return choice
+
+
+def add_diacritics_lattice(text: str, similarity_threshold: float = 0.8, model=None, beam: int = BEAM) -> str:
+    """
+    Ca add_diacritics, dar alege între formele ambigue (fata/fată, casa/casă)
+    după context, folosind modelul de bigrame.
+
+    Args:
+        text: Textul de corectat
+        similarity_threshold: Pragul de similaritate, ca la add_diacritics
+        model: Un BigramModel (implicit modelul din MODEL_PATH)
+        beam: Numărul maxim de stări păstrate la fiecare cuvânt
+
+    Returns:
+        Textul corectat cu diacritice
+    """
+    if beam < 1:
+        raise ValueError("beam trebuie să fie >= 1")
+    model = get_model() if model is None else model
+    if model is None:
+        return core.add_diacritics(text, similarity_threshold)
+
+    # Ca în add_diacritics, ş/ţ cu sedilă și formele descompuse sunt normalizate întâi
+    parts = core._split_words(normalize_text(text))
+    words = parts[1::2]
+    alternatives = model.alternatives
+    ambiguous = {}
+    for i, word in enumerate(words):
+        corrected, kind, _ = core._resolve_word(word, similarity_threshold)
+        parts[2 * i + 1] = corrected
+        # Cheile variantelor sunt forme fără diacritice; corecturile fuzzy nu sunt ambigue
+        options = alternatives.get(fold_diacritics(word.lower())) if kind != "fuzzy" else None
+        if options:
+            ambiguous[i] = _candidates(corrected, options)
+
+    def starts_sentence(i):
+        return i == 0 or bool(_SENTENCE_END.search(parts[2 * i]))
+
+    # Stările Viterbi se unesc la fiecare cuvânt neambiguu, deci fiecare șir de
+    # cuvinte ambigue se decodează separat, între vecinii lui ficși
+    positions = sorted(ambiguous)
+    run_start = 0
+    while run_start < len(positions):
+        run_end = run_start
+        while run_end + 1 < len(positions) and positions[run_end + 1] == positions[run_end] + 1:
+            run_end += 1
+        first, last = positions[run_start], positions[run_end]
+
+        indices = list(range(first, last + 1))
+        if first > 0 and not starts_sentence(first):
+            indices.insert(0, first - 1)
+        if last + 1 < len(words) and not starts_sentence(last + 1):
+            indices.append(last + 1)
+        lattice = [ambiguous.get(i) or [parts[2 * i + 1].lower()] for i in indices]
+        starts = [starts_sentence(i) for i in indices]
+        starts[0] = True
+
+        for i, k in zip(indices, _viterbi(lattice, starts, model, beam)):
+            if k:
+                parts[2 * i + 1] = core._preserve_casing(words[i], ambiguous[i][k])
+        run_start = run_end + 1
+    return "".join(parts)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m diacritice_rom.lattice", description="Învață modelul de bigrame")
+    parser.add_argument("corpus", help="fișier text cu diacritice corecte (UTF-8)")
+    parser.add_argument("output", nargs="?", default=MODEL_PATH, help="fișierul modelului")
+    parser.add_argument("--min-count", type=int, default=1, help="frecvența minimă a unei bigrame păstrate")
+    args = parser.parse_args(argv)
+    with open(args.corpus, "r", encoding="utf-8") as f:
+        model = BigramModel.train(f, args.min_count)
+    model.write(args.output)
+    print(f"✅ Model de bigrame salvat în {args.output} ({len(model)} bigrame, {len(model.alternatives)} forme ambigue)")
+
+
+if __name__ == "__main__":
+    main()
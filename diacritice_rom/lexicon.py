@@ -0,0 +1,281 @@
+"""
+Încărcarea dicționarului și formatul binar precompilat.
+
+Dicționarul precompilat (dict.bin) conține intrările, indexul după cheia fără
+diacritice și indexul de ștergeri, gata construite. Antetul păstrează versiunea
+formatului și suma SHA-256 a fișierului JSON din care a fost generat; dacă JSON-ul
+s-a schimbat între timp, fișierul binar este ignorat.
+
+Generare:
+    python -m diacritice_rom.lexicon [dict.json] [dict.bin]
+"""
+
+import hashlib
+import json
+import os
+import struct
+import sys
+from array import array
+
+from .index import DeleteIndex, LengthBuckets, build_folded_index, build_signatures, char_signature, fold_diacritics
+from .vectorized import make_scorer
+
+MAGIC = b"DIAROMLX"
+FORMAT_VERSION = 1
+
+# magic, versiune, sha256 JSON, distanța indexului de ștergeri (-1 = fără index)
+_HEADER = struct.Struct("<8sI32si")
+_BLOB_SIZE = struct.Struct("<Q")
+
+
+class Lexicon:
+    """
+    Dicționarul împreună cu indexurile construite peste el.
+
+    Nu este modificat după construire, deci poate fi împărțit între thread-uri și
+    instanțe Corrector. Indexurile construite la prima folosire sunt deterministe:
+    dacă două thread-uri le construiesc simultan, rezultatul este același.
+    """
+
+    __slots__ = ("entries", "folded", "delete_index", "_length_buckets", "_scorer", "_signatures", "_signature_cache")
+
+    def __init__(self, entries, max_edit_distance=2, folded=None, delete_index=None):
+        self.entries = entries
+        self.folded = build_folded_index(entries) if folded is None else folded
+        if delete_index is None and max_edit_distance is not None:
+            delete_index = DeleteIndex(entries, max_edit_distance)
+        self.delete_index = delete_index
+        self._length_buckets = None
+        self._scorer = None
+        self._signatures = None
+        self._signature_cache = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    @property
+    def length_buckets(self):
+        """Gălețile (primă literă, lungime) pentru scanarea completă, construite la prima folosire"""
+        if self._length_buckets is None:
+            self._length_buckets = LengthBuckets(self.entries)
+        return self._length_buckets
+
+    @property
+    def scorer(self):
+        """Pre-filtrul LCS pentru scanarea completă (vectorizat dacă NumPy este instalat)"""
+        if self._scorer is None:
+            self._scorer = make_scorer(self.entries, buckets=self._length_buckets, signatures=self.signatures)
+        return self._scorer
+
+    @property
+    def signatures(self):
+        """Semnăturile de caractere ale cheilor (vezi index.char_signature), calculate la prima folosire"""
+        if self._signatures is None:
+            self._signatures = build_signatures(self.entries)
+            self._signature_cache = self._signatures
+        return self._signatures
+
+    def signature(self, key):
+        """
+        Semnătura unei chei. Tabelul complet este construit doar de scanarea
+        completă; căutarea prin indexul de ștergeri calculează (și memorează)
+        doar semnăturile candidaților ei, ca un dicționar mapat să nu fie citit integral.
+        """
+        try:
+            return self._signature_cache[key]
+        except KeyError:
+            signature = self._signature_cache[key] = char_signature(key.lower())
+            return signature
+
+    def lookup(self, word_lower):
+        """
+        Caută cuvântul direct în dicționar, apoi după forma fără diacritice.
+        Returnează None dacă nu există match exact.
+        """
+        entries = self.entries
+        corrected = entries.get(word_lower)
+        if corrected is not None:
+            return corrected
+
+        folded = fold_diacritics(word_lower)
+        if folded != word_lower:
+            corrected = entries.get(folded)
+            if corrected is not None:
+                return corrected
+        return self.folded.get(folded)
+
+
+def _file_digest(path):
+    """Suma SHA-256 a unui fișier"""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+def compiled_path(json_path):
+    """Calea fișierului precompilat corespunzător unui dicționar JSON"""
+    return os.path.splitext(json_path)[0] + ".bin"
+
+
+def _pack_strings(strings):
+    for s in strings:
+        if "\n" in s:
+            raise ValueError(f"Cheile și valorile nu pot conține linii noi: {s!r}")
+    return "\n".join(strings).encode("utf-8")
+
+
+def _unpack_strings(blob, count):
+    if count == 0:
+        return []
+    return blob.decode("utf-8").split("\n")
+
+
+def _pack_array(values):
+    values = array("I", values)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def _unpack_array(blob):
+    values = array("I")
+    values.frombytes(blob)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def compile_lexicon(json_path, out_path=None, max_edit_distance=2):
+    """
+    Generează dicționarul precompilat din fișierul JSON.
+
+    Returns:
+        Calea fișierului generat
+    """
+    if out_path is None:
+        out_path = compiled_path(json_path)
+    with open(json_path, "rb") as f:
+        source = f.read()
+    lexicon = Lexicon(json.loads(source.decode("utf-8")), max_edit_distance)
+    return write_compiled(lexicon, out_path, hashlib.sha256(source).digest())
+
+
+def write_compiled(lexicon, out_path, digest):
+    """
+    Scrie un dicționar deja construit în formatul precompilat; digest este
+    suma SHA-256 a fișierului JSON corespunzător.
+
+    Returns:
+        Calea fișierului generat
+    """
+    if lexicon.delete_index is not None:
+        keys, variants, offsets, postings = lexicon.delete_index.to_arrays()
+    else:
+        variants, offsets, postings = [], [], []
+
+    blobs = [
+        _pack_array([len(lexicon.entries), len(lexicon.folded), len(variants)]),
+        _pack_strings(lexicon.entries.keys()),
+        _pack_strings(lexicon.entries.values()),
+        _pack_strings(lexicon.folded.keys()),
+        _pack_strings(lexicon.folded.values()),
+        _pack_strings(variants),
+        _pack_array(offsets),
+        _pack_array(postings),
+    ]
+    distance = -1 if lexicon.delete_index is None else lexicon.delete_index.max_distance
+
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, digest, distance))
+        for blob in blobs:
+            f.write(_BLOB_SIZE.pack(len(blob)))
+            f.write(blob)
+    os.replace(tmp_path, out_path)
+    return out_path
+
+
+def load_compiled(path, json_path=None):
+    """
+    Încarcă dicționarul precompilat.
+
+    Returnează None dacă fișierul lipsește, are alt format sau nu mai corespunde
+    fișierului JSON sursă (când acesta există).
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if len(data) < _HEADER.size:
+        return None
+
+    magic, version, digest, distance = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        return None
+    if json_path is not None and os.path.exists(json_path) and _file_digest(json_path) != digest:
+        return None
+
+    blobs = []
+    offset = _HEADER.size
+    while offset < len(data):
+        (size,) = _BLOB_SIZE.unpack_from(data, offset)
+        offset += _BLOB_SIZE.size
+        blobs.append(data[offset:offset + size])
+        offset += size
+    if len(blobs) != 8:
+        return None
+
+    n_entries, n_folded, n_variants = _unpack_array(blobs[0])
+    keys = _unpack_strings(blobs[1], n_entries)
+    entries = dict(zip(keys, _unpack_strings(blobs[2], n_entries)))
+    folded = dict(zip(_unpack_strings(blobs[3], n_folded), _unpack_strings(blobs[4], n_folded)))
+
+    delete_index = None
+    if distance >= 0:
+        delete_index = DeleteIndex.from_arrays(
+            distance,
+            keys,
+            _unpack_strings(blobs[5], n_variants),
+            _unpack_array(blobs[6]),
+            _unpack_array(blobs[7]),
+        )
+    return Lexicon(entries, None, folded=folded, delete_index=delete_index)
+
+
+def load_lexicon(path, max_edit_distance=2):
+    """
+    Încarcă dicționarul, preferând varianta precompilată dacă este la zi.
+    Fișierele .lex sunt deschise mapat în memorie (vezi modulul mapped).
+    Un fișier JSON lipsă înseamnă un dicționar gol.
+    """
+    if path.endswith(".lex"):
+        from .mapped import open_mapped
+
+        lexicon = open_mapped(path)
+    else:
+        lexicon = load_compiled(compiled_path(path), path)
+
+    if lexicon is not None:
+        index = lexicon.delete_index
+        if (index.max_distance if index is not None else None) == max_edit_distance:
+            return lexicon
+        return Lexicon(lexicon.entries, max_edit_distance, folded=lexicon.folded)
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+    except FileNotFoundError:
+        entries = {}
+    return Lexicon(entries, max_edit_distance)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    json_path = argv[0] if argv else os.path.join(os.path.dirname(__file__), "dict.json")
+    out_path = argv[1] if len(argv) > 1 else None
+    out_path = compile_lexicon(json_path, out_path)
+    print(f"✅ Dicționar precompilat salvat în {out_path}")
+
+
+if __name__ == "__main__":
+    main()
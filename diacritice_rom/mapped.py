@@ -0,0 +1,265 @@
+"""
+Dicționar pe disc, mapat în memorie (mmap) și interogat direct din fișier.
+
+Toate procesele care deschid același fișier .lex împart o singură copie din
+page cache-ul sistemului, iar deschiderea nu depinde de numărul de intrări.
+Fișierul conține tabele de șiruri sortate (offset-uri + octeți UTF-8) pentru
+chei, valori, indexul fără diacritice și indexul de ștergeri; căutarea se face
+prin căutare binară.
+
+Generare:
+    python -m diacritice_rom.mapped [dict.json] [dict.lex]
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+
+from .index import _deletes
+from .lexicon import Lexicon
+
+MAGIC = b"DIAROMMM"
+FORMAT_VERSION = 1
+MAPPED_SUFFIX = ".lex"
+
+# magic, versiune, distanța indexului de ștergeri (-1 = fără index), număr de secțiuni
+_HEADER = struct.Struct("<8sIiI")
+_SECTION = struct.Struct("<QQ")
+_SECTION_COUNT = 13
+_ALIGN = 8
+
+
+def _uint_view(buffer):
+    """Tablou uint32 peste o porțiune din fișier (fără copiere pe little-endian)"""
+    if sys.byteorder == "little":
+        return buffer.cast("I")
+    values = array("I", bytes(buffer))
+    values.byteswap()
+    return values
+
+
+class _StringTable:
+    """Tabel de șiruri UTF-8 sortate după octeți, adresat prin offset-uri"""
+
+    __slots__ = ("_offsets", "_blob")
+
+    def __init__(self, offsets, blob):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def raw(self, i):
+        return bytes(self._blob[self._offsets[i]:self._offsets[i + 1]])
+
+    def text(self, i):
+        return self.raw(i).decode("utf-8")
+
+    def find(self, key):
+        """Returnează poziția șirului (dat ca bytes) sau -1 dacă lipsește"""
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            current = self.raw(mid)
+            if current < key:
+                lo = mid + 1
+            elif current > key:
+                hi = mid
+            else:
+                return mid
+        return -1
+
+
+class MappedDict(Mapping):
+    """
+    Dicționar read-only peste două tabele paralele (chei sortate și valori).
+    Dacă order este dat, iterarea urmează ordinea originală a dicționarului.
+    """
+
+    __slots__ = ("_keys", "_values", "_order")
+
+    def __init__(self, keys, values, order=None):
+        self._keys = keys
+        self._values = values
+        self._order = order
+
+    def __getitem__(self, key):
+        i = self._keys.find(key.encode("utf-8"))
+        if i < 0:
+            raise KeyError(key)
+        return self._values.text(i)
+
+    def __contains__(self, key):
+        return self._keys.find(key.encode("utf-8")) >= 0
+
+    def __iter__(self):
+        positions = range(len(self._keys)) if self._order is None else self._order
+        for i in positions:
+            yield self._keys.text(i)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def key_at(self, position):
+        """Cheia aflată pe o poziție din ordinea originală"""
+        return self._keys.text(self._order[position])
+
+
+class MappedDeleteIndex:
+    """
+    Indexul de ștergeri (vezi index.DeleteIndex) citit direct din fișierul mapat.
+    """
+
+    __slots__ = ("max_distance", "_entries", "_variants", "_offsets", "_postings")
+
+    def __init__(self, max_distance, entries, variants, offsets, postings):
+        self.max_distance = max_distance
+        self._entries = entries
+        self._variants = variants
+        self._offsets = offsets
+        self._postings = postings
+
+    def __len__(self):
+        return len(self._entries)
+
+    def candidates(self, word):
+        """
+        Returnează cheile aflate la cel mult max_distance ștergeri de cuvânt,
+        în ordinea în care apar în dicționar.
+        """
+        offsets = self._offsets
+        positions = set()
+        for variant in _deletes(word, self.max_distance):
+            slot = self._variants.find(variant.encode("utf-8"))
+            if slot >= 0:
+                positions.update(self._postings[offsets[slot]:offsets[slot + 1]])
+        return [self._entries.key_at(position) for position in sorted(positions)]
+
+
+def _string_sections(strings):
+    """Offset-urile și octeții pentru un tabel de șiruri"""
+    offsets = array("I", [0])
+    blob = bytearray()
+    for s in strings:
+        blob += s
+        offsets.append(len(blob))
+    return offsets, bytes(blob)
+
+
+def _sorted_table(mapping):
+    """Secțiunile (chei, valori) pentru un dicționar, sortat după octeții cheilor"""
+    pairs = sorted((key.encode("utf-8"), value.encode("utf-8")) for key, value in mapping.items())
+    key_offsets, key_blob = _string_sections(key for key, _ in pairs)
+    value_offsets, value_blob = _string_sections(value for _, value in pairs)
+    return [key_offsets, key_blob, value_offsets, value_blob]
+
+
+def write_mapped(lexicon, path):
+    """
+    Scrie dicționarul (cu indexurile sale) în formatul mapat.
+
+    Returns:
+        Calea fișierului generat
+    """
+    entries = lexicon.entries
+    keys = list(entries)
+    # order[poziție originală] = poziția cheii în tabelul sortat
+    order = array("I", [0]) * len(keys)
+    for rank, position in enumerate(sorted(range(len(keys)), key=lambda i: keys[i].encode("utf-8"))):
+        order[position] = rank
+
+    index = lexicon.delete_index
+    variants = []
+    variant_offsets = array("I", [0])
+    postings = array("I")
+    if index is not None:
+        _, variant_list, offsets, flat = index.to_arrays()
+        for slot in sorted(range(len(variant_list)), key=lambda i: variant_list[i].encode("utf-8")):
+            variants.append(variant_list[slot].encode("utf-8"))
+            postings.extend(flat[offsets[slot]:offsets[slot + 1]])
+            variant_offsets.append(len(postings))
+    variant_string_offsets, variant_blob = _string_sections(variants)
+
+    sections = _sorted_table(entries)
+    sections.append(order)
+    sections += _sorted_table(lexicon.folded)
+    sections += [variant_string_offsets, variant_blob, variant_offsets, postings]
+
+    payloads = []
+    for section in sections:
+        if isinstance(section, array):
+            if sys.byteorder == "big":
+                section = array("I", section)
+                section.byteswap()
+            section = section.tobytes()
+        payloads.append(section)
+
+    distance = -1 if index is None else index.max_distance
+    position = _HEADER.size + _SECTION.size * len(payloads)
+    table = []
+    for payload in payloads:
+        position += -position % _ALIGN
+        table.append((position, len(payload)))
+        position += len(payload)
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, distance, len(payloads)))
+        for offset, size in table:
+            f.write(_SECTION.pack(offset, size))
+        for (offset, _), payload in zip(table, payloads):
+            f.write(b"\0" * (offset - f.tell()))
+            f.write(payload)
+    os.replace(tmp_path, path)
+    return path
+
+
+def open_mapped(path):
+    """
+    Deschide un dicționar în format mapat. Returnează un Lexicon ale cărui
+    componente citesc direct din fișier.
+    """
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, distance, count = _HEADER.unpack_from(mm)
+    if magic != MAGIC or version != FORMAT_VERSION or count != _SECTION_COUNT:
+        mm.close()
+        raise ValueError(f"{path} nu este un dicționar mapat compatibil")
+
+    view = memoryview(mm)
+    sections = []
+    for i in range(count):
+        offset, size = _SECTION.unpack_from(mm, _HEADER.size + i * _SECTION.size)
+        sections.append(view[offset:offset + size])
+
+    def table(i):
+        return _StringTable(_uint_view(sections[i]), sections[i + 1])
+
+    entries = MappedDict(table(0), table(2), _uint_view(sections[4]))
+    folded = MappedDict(table(5), table(7))
+    delete_index = None
+    if distance >= 0:
+        delete_index = MappedDeleteIndex(
+            distance, entries, table(9), _uint_view(sections[11]), _uint_view(sections[12])
+        )
+    return Lexicon(entries, None, folded=folded, delete_index=delete_index)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    json_path = argv[0] if argv else os.path.join(os.path.dirname(__file__), "dict.json")
+    out_path = argv[1] if len(argv) > 1 else os.path.splitext(json_path)[0] + MAPPED_SUFFIX
+    with open(json_path, "r", encoding="utf-8") as f:
+        lexicon = Lexicon(json.load(f))
+    write_mapped(lexicon, out_path)
+    print(f"✅ Dicționar mapat salvat în {out_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Normalizarea diacriticelor românești înainte de corectare.
+
+Textele din unelte Windows mai vechi folosesc ş/ţ cu sedilă (U+015F/U+0163),
+iar unele surse vin descompuse (NFD: literă + semn diacritic combinat).
+Cheile dicționarului sunt în forma standard, cu virgulă dedesubt (ș/ț) și
+compuse (NFC), așa că aceste texte ar rata căutarea exactă și ar ajunge la
+căutarea fuzzy, mult mai lentă.
+
+normalize_text aduce textul la forma standard doar cu operații în C: o
+căutare cu o expresie regulată precompilată și, doar dacă ea găsește ceva,
+câteva str.replace pentru perechile românești; restul textului rămâne
+neschimbat. str.replace este folosit în locul lui str.translate: pe texte cu
+caractere non-ASCII, translate caută fiecare caracter în tabel și este de
+zeci de ori mai lent.
+"""
+
+import re
+
+# Convențiile de scriere a lui ș/ț în textul rezultat
+CONVENTIONS = ("comma", "cedilla")
+
+_CEDILLA_TO_COMMA = (("ş", "ș"), ("ţ", "ț"), ("Ş", "Ș"), ("Ţ", "Ț"))
+_COMMA_TO_CEDILLA = tuple((comma, cedilla) for cedilla, comma in _CEDILLA_TO_COMMA)
+
+# Literă + semn combinat (breve, circumflex, virgulă dedesubt, sedilă) -> litera compusă.
+# Sedila este compusă direct în forma cu virgulă.
+_COMPOSED = (
+    ("a\u0306", "ă"), ("A\u0306", "Ă"),
+    ("a\u0302", "â"), ("A\u0302", "Â"),
+    ("i\u0302", "î"), ("I\u0302", "Î"),
+    ("s\u0326", "ș"), ("S\u0326", "Ș"), ("s\u0327", "ș"), ("S\u0327", "Ș"),
+    ("t\u0326", "ț"), ("T\u0326", "Ț"), ("t\u0327", "ț"), ("T\u0327", "Ț"),
+)
+
+# Orice caracter care trebuie normalizat; textul fără ele este returnat ca atare
+_NONSTANDARD_RE = re.compile("[şţŞŢ\u0302\u0306\u0326\u0327]")
+
+
+def _replace_all(text, pairs):
+    for old, new in pairs:
+        text = text.replace(old, new)
+    return text
+
+
+def normalize_text(text: str) -> str:
+    """
+    Aduce diacriticele românești la forma standard: ş/ţ -> ș/ț, a + U+0306 -> ă etc.
+    Cazul obișnuit (text deja standard) costă o singură căutare, fără copie.
+    """
+    if text.isascii() or _NONSTANDARD_RE.search(text) is None:
+        return text
+    return _replace_all(_replace_all(text, _COMPOSED), _CEDILLA_TO_COMMA)
+
+
+def apply_convention(text: str, convention: str = "comma") -> str:
+    """
+    Scrie ș/ț în convenția cerută: "comma" (standard) sau "cedilla" (ş/ţ,
+    pentru sisteme vechi). Textul trebuie să fie deja normalizat.
+    """
+    if convention == "comma":
+        return text
+    if convention == "cedilla":
+        return _replace_all(text, _COMMA_TO_CEDILLA)
+    raise ValueError(f"convenție necunoscută: {convention!r} (se acceptă {', '.join(CONVENTIONS)})")
@@ -0,0 +1,150 @@
+"""
+Dicționare suplimentare (overlay) puse în fața dicționarului de bază.
+
+Un overlay este un Lexicon mic (termeni de domeniu, nume proprii) cu
+indexurile lui proprii. LayeredLexicon combină overlay-urile cu dicționarul
+de bază fără să reconstruiască indexurile acestuia: căutarea exactă încearcă
+întâi overlay-urile, iar candidații fuzzy sunt reuniți din toate straturile.
+La aceeași cheie câștigă overlay-ul cel mai recent.
+"""
+
+import json
+from collections import ChainMap
+
+from .index import char_signature, fold_diacritics
+from .lexicon import Lexicon
+
+
+def load_overlay(source, max_edit_distance=2):
+    """
+    Construiește un overlay dintr-un dict (formă → cuvânt) sau din calea
+    unui fișier JSON cu același format ca dict.json.
+    """
+    if isinstance(source, Lexicon):
+        return source
+    if isinstance(source, str):
+        with open(source, "r", encoding="utf-8") as f:
+            source = json.load(f)
+    return Lexicon({key.lower(): value for key, value in source.items()}, max_edit_distance)
+
+
+def _merge_candidates(lists):
+    """Reuniunea listelor de candidați, fără duplicate, în ordinea straturilor"""
+    if len(lists) == 1:
+        return lists[0]
+    seen = set()
+    merged = []
+    for candidates in lists:
+        for key in candidates:
+            if key not in seen:
+                seen.add(key)
+                merged.append(key)
+    return merged
+
+
+class _LayeredDeleteIndex:
+    """Indexurile de ștergeri ale tuturor straturilor, interogate împreună"""
+
+    __slots__ = ("max_distance", "_indexes")
+
+    def __init__(self, indexes):
+        self.max_distance = max(index.max_distance for index in indexes)
+        self._indexes = indexes
+
+    def __len__(self):
+        return sum(len(index) for index in self._indexes)
+
+    def candidates(self, word):
+        """Candidații din overlay-uri, apoi cei din dicționarul de bază"""
+        return _merge_candidates([index.candidates(word) for index in self._indexes])
+
+
+class _LayeredScorer:
+    """Pre-filtrele pentru scanarea completă ale tuturor straturilor"""
+
+    __slots__ = ("_scorers",)
+
+    def __init__(self, scorers):
+        self._scorers = scorers
+
+    def candidates(self, word, threshold):
+        return _merge_candidates([scorer.candidates(word, threshold) for scorer in self._scorers])
+
+
+class LayeredLexicon:
+    """
+    Dicționarul de bază cu overlay-urile în față (primul overlay are prioritatea cea mai mare).
+    Expune aceeași interfață ca Lexicon, deci poate fi folosit direct de core.
+    """
+
+    __slots__ = ("base", "overlays", "entries", "folded", "delete_index", "_scorer", "_signatures", "_signature_cache")
+
+    def __init__(self, base, overlays):
+        layers = tuple(overlays) + (base,)
+        self.base = base
+        self.overlays = tuple(overlays)
+        self.entries = ChainMap(*(layer.entries for layer in layers))
+        self.folded = ChainMap(*(layer.folded for layer in layers))
+        if any(layer.delete_index is None for layer in layers):
+            self.delete_index = None
+        else:
+            self.delete_index = _LayeredDeleteIndex([layer.delete_index for layer in layers])
+        self._scorer = None
+        self._signatures = None
+        self._signature_cache = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    @property
+    def layers(self):
+        return self.overlays + (self.base,)
+
+    @property
+    def scorer(self):
+        if self._scorer is None:
+            self._scorer = _LayeredScorer([layer.scorer for layer in self.layers])
+        return self._scorer
+
+    @property
+    def signatures(self):
+        if self._signatures is None:
+            self._signatures = ChainMap(*(layer.signatures for layer in self.layers))
+            self._signature_cache = self._signatures
+        return self._signatures
+
+    def signature(self, key):
+        """Semnătura unei chei (vezi Lexicon.signature)"""
+        try:
+            return self._signature_cache[key]
+        except KeyError:
+            signature = self._signature_cache[key] = char_signature(key.lower())
+            return signature
+
+    def lookup(self, word_lower):
+        """Căutarea exactă, întâi în overlay-uri"""
+        for layer in self.overlays:
+            corrected = layer.lookup(word_lower)
+            if corrected is not None:
+                return corrected
+        return self.base.lookup(word_lower)
+
+
+def layered(base, overlays):
+    """Dicționarul de folosit: base singur dacă nu există overlay-uri"""
+    return LayeredLexicon(base, overlays) if overlays else base
+
+
+def may_affect(layer, word_lower, threshold, full_scan=False):
+    """
+    Dacă adăugarea sau eliminarea stratului poate schimba rezoluția unui cuvânt
+    (match exact nou sau un candidat fuzzy în plus). full_scan indică faptul că
+    dicționarul nu are index de ștergeri, deci candidații vin din pre-filtrul LCS.
+    """
+    if layer.lookup(word_lower) is not None:
+        return True
+    # Ca în core, candidații fuzzy sunt căutați după forma fără diacritice
+    word_lower = fold_diacritics(word_lower)
+    if full_scan or layer.delete_index is None:
+        return bool(layer.scorer.candidates(word_lower, threshold))
+    return bool(layer.delete_index.candidates(word_lower))
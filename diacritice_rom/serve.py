@@ -0,0 +1,336 @@
+"""
+Serviciu local de corectare, pentru aplicații care nu sunt scrise în Python.
+
+Dicționarul este încărcat o singură dată; cererile concurente sunt grupate în
+micro-loturi și corectate pe un pool de procese. Două interfețe:
+
+HTTP (doar pe localhost implicit):
+    POST /correct   {"text": "..."} sau {"texts": ["...", ...]}, opțional "similarity_threshold"
+    GET  /stats     latențe (p50/p90/p99/max) și dimensiunea loturilor
+    GET  /health
+
+JSON-lines pe stdin/stdout (--stdio): câte o cerere JSON pe linie, cu același
+format; câmpul opțional "id" este copiat în răspuns, iar răspunsurile sunt
+scrise în ordinea cererilor.
+
+Utilizare:
+    python -m diacritice_rom.serve --port 8765 --workers 4
+    python -m diacritice_rom.serve --stdio
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from . import core
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Dimensiunea maximă a unui corp de cerere HTTP (octeți)
+MAX_BODY = 16 * 1024 * 1024
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large"}
+
+
+def _correct_many(items):
+    """Corectează un micro-lot de perechi (text, prag) într-un proces worker"""
+    return [core.add_diacritics(text, threshold) for text, threshold in items]
+
+
+class LatencyStats:
+    """
+    Latențele ultimelor cereri (fereastră mărginită) și dimensiunile loturilor.
+    """
+
+    def __init__(self, window=10000):
+        self._latencies = deque(maxlen=window)
+        self._batch_sizes = deque(maxlen=window)
+        self.requests = 0
+        self.batches = 0
+
+    def record_request(self, seconds):
+        self._latencies.append(seconds)
+        self.requests += 1
+
+    def record_batch(self, size):
+        self._batch_sizes.append(size)
+        self.batches += 1
+
+    def snapshot(self):
+        """Statisticile curente, în milisecunde"""
+        latencies = sorted(self._latencies)
+
+        def percentile(p):
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000
+
+        sizes = self._batch_sizes
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "latency_ms": {
+                "p50": percentile(50),
+                "p90": percentile(90),
+                "p99": percentile(99),
+                "max": latencies[-1] * 1000 if latencies else 0.0,
+            },
+            "mean_batch_size": sum(sizes) / len(sizes) if sizes else 0.0,
+        }
+
+
+class MicroBatcher:
+    """
+    Adună cererile concurente în loturi de cel mult max_batch texte, așteptând
+    cel mult max_delay secunde după prima cerere, și le trimite executorului.
+    """
+
+    def __init__(self, executor, max_batch=64, max_delay=0.002, stats=None):
+        self._executor = executor
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._queue = asyncio.Queue()
+        self._task = None
+        self.stats = stats if stats is not None else LatencyStats()
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def correct(self, text, threshold=0.8):
+        """Corectează un text, împreună cu celelalte cereri din același lot"""
+        future = asyncio.get_running_loop().create_future()
+        start = time.perf_counter()
+        await self._queue.put((text, threshold, future))
+        result = await future
+        self.stats.record_request(time.perf_counter() - start)
+        return result
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._max_delay
+            while len(batch) < self._max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            self.stats.record_batch(len(batch))
+            items = [(text, threshold) for text, threshold, _ in batch]
+            try:
+                results = await loop.run_in_executor(self._executor, _correct_many, items)
+            except Exception as exc:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+
+def _parse_request(payload):
+    """Validează o cerere; returnează (texte, prag, este_lot)"""
+    if not isinstance(payload, dict):
+        raise ValueError("cererea trebuie să fie un obiect JSON")
+    threshold = payload.get("similarity_threshold", 0.8)
+    if not isinstance(threshold, (int, float)):
+        raise ValueError("similarity_threshold trebuie să fie un număr")
+    if "texts" in payload:
+        texts = payload["texts"]
+        if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+            raise ValueError("texts trebuie să fie o listă de șiruri")
+        return texts, float(threshold), True
+    text = payload.get("text")
+    if not isinstance(text, str):
+        raise ValueError("lipsește câmpul text")
+    return [text], float(threshold), False
+
+
+async def _handle_payload(batcher, payload):
+    """Execută o cerere deja decodată și construiește răspunsul"""
+    texts, threshold, is_batch = _parse_request(payload)
+    results = await asyncio.gather(*(batcher.correct(text, threshold) for text in texts))
+    response = {"texts": list(results)} if is_batch else {"text": results[0]}
+    if "id" in payload:
+        response["id"] = payload["id"]
+    return response
+
+
+async def _write_http(writer, status, body, keep_alive):
+    data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(data)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    writer.write(head.encode("ascii") + data)
+    await writer.drain()
+
+
+async def _handle_http(batcher, reader, writer):
+    """Servește cererile HTTP de pe o conexiune (cu keep-alive)"""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            try:
+                method, path, version = request_line.decode("latin-1").split()
+            except ValueError:
+                await _write_http(writer, 400, {"error": "cerere invalidă"}, False)
+                break
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            connection = headers.get("connection", "").lower()
+            keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+            try:
+                length = int(headers.get("content-length") or 0)
+            except ValueError:
+                await _write_http(writer, 400, {"error": "Content-Length invalid"}, False)
+                break
+            if length > MAX_BODY:
+                await _write_http(writer, 413, {"error": "cerere prea mare"}, False)
+                break
+            body = await reader.readexactly(length) if length else b""
+
+            if path == "/correct":
+                if method != "POST":
+                    status, response = 405, {"error": "folosiți POST"}
+                else:
+                    try:
+                        status, response = 200, await _handle_payload(batcher, json.loads(body))
+                    except ValueError as exc:
+                        status, response = 400, {"error": str(exc)}
+            elif path == "/stats":
+                status, response = 200, batcher.stats.snapshot()
+            elif path == "/health":
+                status, response = 200, {"status": "ok"}
+            else:
+                status, response = 404, {"error": "resursă inexistentă"}
+
+            await _write_http(writer, status, response, keep_alive)
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_http_server(batcher, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """Pornește serverul HTTP (asyncio.Server) pentru un batcher deja pornit"""
+    return await asyncio.start_server(lambda r, w: _handle_http(batcher, r, w), host, port)
+
+
+async def _stdio_response(batcher, line):
+    try:
+        return await _handle_payload(batcher, json.loads(line))
+    except ValueError as exc:
+        return {"error": str(exc)}
+
+
+async def serve_stdio(batcher, infile=None, outfile=None):
+    """
+    Citește cereri JSON-lines din infile și scrie răspunsurile în outfile,
+    în ordinea cererilor. Cererile sunt procesate concurent.
+    """
+    infile = sys.stdin if infile is None else infile
+    outfile = sys.stdout if outfile is None else outfile
+    loop = asyncio.get_running_loop()
+    pending = asyncio.Queue()
+
+    async def writer():
+        while True:
+            task = await pending.get()
+            if task is None:
+                break
+            outfile.write(json.dumps(await task, ensure_ascii=False) + "\n")
+            outfile.flush()
+
+    writer_task = loop.create_task(writer())
+    while True:
+        # Citirea blocantă din stdin rulează pe un thread, ca să funcționeze pe orice platformă
+        line = await loop.run_in_executor(None, infile.readline)
+        if not line:
+            break
+        if line.strip():
+            await pending.put(loop.create_task(_stdio_response(batcher, line)))
+    await pending.put(None)
+    await writer_task
+
+
+def make_executor(workers):
+    """
+    Pool-ul de procese pentru corectare. Dicționarul se încarcă înainte,
+    ca procesele create prin fork să-l moștenească. workers=0 corectează
+    pe un singur thread, în procesul curent.
+    """
+    core._get_lexicon()
+    if workers == 0:
+        return ThreadPoolExecutor(max_workers=1)
+    if "fork" in multiprocessing.get_all_start_methods():
+        return ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork"))
+    return ProcessPoolExecutor(workers)
+
+
+async def _main_async(args):
+    with make_executor(args.workers) as executor:
+        batcher = MicroBatcher(executor, args.max_batch, args.max_delay_ms / 1000)
+        batcher.start()
+        try:
+            if args.stdio:
+                await serve_stdio(batcher)
+            else:
+                server = await start_http_server(batcher, args.host, args.port)
+                address = server.sockets[0].getsockname()
+                print(f"diacritice_rom: ascult pe http://{address[0]}:{address[1]}", file=sys.stderr)
+                async with server:
+                    await server.serve_forever()
+        finally:
+            await batcher.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m diacritice_rom.serve", description="Serviciu local de corectare a diacriticelor")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="adresa de ascultare (implicit 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--stdio", action="store_true", help="JSON-lines pe stdin/stdout în loc de HTTP")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(), help="procese worker (0 = în procesul curent)")
+    parser.add_argument("--max-batch", type=int, default=64, help="texte maxime într-un micro-lot")
+    parser.add_argument("--max-delay-ms", type=float, default=2.0, help="așteptarea maximă pentru completarea unui lot")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_main_async(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Contoare și cronometre opționale pentru corectare: de ce a fost lent un apel.
+"""
+
+import heapq
+import threading
+
+# Câte dintre cele mai lente cuvinte sunt păstrate
+SLOWEST_TOKENS = 20
+
+
+class Stats:
+    """
+    Statisticile colectate de core când sunt activate (enable_stats sau profile).
+
+    Timpii sunt în secunde. Dacă parent este dat, fiecare înregistrare este
+    transmisă și lui (un profil per apel alimentează și statisticile globale).
+    """
+
+    _COUNTERS = (
+        "texts", "words", "exact_hits", "fuzzy_attempts", "fuzzy_successes", "fuzzy_misses",
+        "fuzzy_lookups", "candidates", "candidates_scored", "max_candidates_scored", "budget_skips",
+    )
+    _TIMERS = ("load", "tokenize", "exact", "fuzzy")
+
+    def __init__(self, slowest=SLOWEST_TOKENS, parent=None):
+        self._slowest_size = slowest
+        self._parent = parent
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Readuce toate contoarele la zero"""
+        with self._lock:
+            for name in self._COUNTERS:
+                setattr(self, name, 0)
+            self.seconds = dict.fromkeys(self._TIMERS, 0.0)
+            self._slowest = []
+
+    def record_load(self, seconds):
+        with self._lock:
+            self.seconds["load"] += seconds
+        if self._parent is not None:
+            self._parent.record_load(seconds)
+
+    def record_tokenize(self, seconds, words):
+        with self._lock:
+            self.texts += 1
+            self.words += words
+            self.seconds["tokenize"] += seconds
+        if self._parent is not None:
+            self._parent.record_tokenize(seconds, words)
+
+    def record_lookup(self, candidates, scored):
+        """O căutare fuzzy necache-uită: candidații găsiți și câți au fost evaluați"""
+        with self._lock:
+            self.fuzzy_lookups += 1
+            self.candidates += candidates
+            self.candidates_scored += scored
+            if scored > self.max_candidates_scored:
+                self.max_candidates_scored = scored
+        if self._parent is not None:
+            self._parent.record_lookup(candidates, scored)
+
+    def record_word(self, word, kind, exact_seconds, fuzzy_seconds):
+        """Un cuvânt rezolvat; fuzzy_seconds este None dacă nu a fost căutat fuzzy"""
+        total = exact_seconds + (fuzzy_seconds or 0.0)
+        with self._lock:
+            self.seconds["exact"] += exact_seconds
+            if kind == "exact":
+                self.exact_hits += 1
+            elif kind == "skipped":
+                self.budget_skips += 1
+            else:
+                self.fuzzy_attempts += 1
+                self.seconds["fuzzy"] += fuzzy_seconds
+                if kind == "fuzzy":
+                    self.fuzzy_successes += 1
+                else:
+                    self.fuzzy_misses += 1
+            if self._slowest_size:
+                item = (total, word, kind)
+                if len(self._slowest) < self._slowest_size:
+                    heapq.heappush(self._slowest, item)
+                elif total > self._slowest[0][0]:
+                    heapq.heapreplace(self._slowest, item)
+        if self._parent is not None:
+            self._parent.record_word(word, kind, exact_seconds, fuzzy_seconds)
+
+    def as_dict(self):
+        """Instantaneu al statisticilor, gata de trimis unui sistem de metrici"""
+        with self._lock:
+            result = {name: getattr(self, name) for name in self._COUNTERS}
+            result["fuzzy_cache_hits"] = max(0, self.fuzzy_attempts - self.fuzzy_lookups)
+            result["candidates_per_lookup"] = (
+                self.candidates_scored / self.fuzzy_lookups if self.fuzzy_lookups else 0.0
+            )
+            result["seconds"] = dict(self.seconds)
+            result["slowest"] = [
+                {"word": word, "type": kind, "ms": seconds * 1000}
+                for seconds, word, kind in sorted(self._slowest, reverse=True)
+            ]
+        return result
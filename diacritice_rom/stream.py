@@ -0,0 +1,76 @@
+"""
+Corectare incrementală pentru texte mari: fișiere, stream-uri și iteratori de bucăți de text.
+"""
+
+from .core import add_diacritics
+
+# Dimensiunea implicită a bucăților citite din fișiere (caractere)
+CHUNK_SIZE = 64 * 1024
+
+# Un "cuvânt" mai lung de atât nu poate avea match; e emis neschimbat pentru a mărgini memoria
+MAX_PENDING = 64 * 1024
+
+
+def _word_aligned(chunks):
+    """
+    Regrupează bucățile de text astfel încât niciun cuvânt să nu fie tăiat.
+    Produce perechi (text, de_corectat); textele de_corectat=False sunt șiruri
+    fără spații mai lungi de MAX_PENDING, emise neschimbate.
+    """
+    pending = ""
+    for chunk in chunks:
+        if not chunk:
+            continue
+        text = pending + chunk
+
+        # Ultimul cuvânt poate continua în bucata următoare
+        end = len(text)
+        while end > 0 and not text[end - 1].isspace():
+            end -= 1
+
+        if end == 0:
+            if len(text) > MAX_PENDING:
+                yield text, False
+                text = ""
+            pending = text
+            continue
+
+        pending = text[end:]
+        yield text[:end], True
+
+    if pending:
+        yield pending, True
+
+
+def iter_add_diacritics(chunks, similarity_threshold: float = 0.8):
+    """
+    Corectează textul primit pe bucăți și returnează bucățile corectate.
+
+    Cuvintele tăiate între două bucăți sunt reunite înainte de corectare, iar
+    spațiile și liniile noi sunt păstrate exact. Memoria folosită nu depinde
+    de lungimea totală a textului.
+
+    Args:
+        chunks: Iterabil de str (de exemplu un fișier deschis în mod text)
+        similarity_threshold: Pragul de similaritate, ca la add_diacritics
+
+    Yields:
+        Bucăți de text corectat
+    """
+    for text, correctable in _word_aligned(chunks):
+        yield add_diacritics(text, similarity_threshold) if correctable else text
+
+
+def correct_stream(infile, outfile, similarity_threshold: float = 0.8, chunk_size: int = CHUNK_SIZE) -> None:
+    """
+    Citește textul din infile pe bucăți și scrie varianta corectată în outfile.
+
+    Args:
+        infile: Fișier deschis pentru citire în mod text
+        outfile: Fișier deschis pentru scriere în mod text
+        similarity_threshold: Pragul de similaritate, ca la add_diacritics
+        chunk_size: Numărul de caractere citite odată
+    """
+    chunks = iter(lambda: infile.read(chunk_size), "")
+    for corrected in iter_add_diacritics(chunks, similarity_threshold):
+        outfile.write(corrected)
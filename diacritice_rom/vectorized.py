@@ -0,0 +1,222 @@
+"""
+Pre-filtru vectorizat pentru scanarea fuzzy completă.
+
+Raportul SequenceMatcher.ratio() este 2*M/(la+lb), iar blocurile găsite de
+SequenceMatcher formează o subsecvență comună, deci M <= LCS. Calculând LCS
+pentru toate cheile odată (algoritmul bit-paralel al lui Hyyrö, pe coloane de
+coduri Unicode în tablouri NumPy) obținem o margine superioară exactă a
+scorului; doar candidații care o pot atinge mai sunt evaluați cu SequenceMatcher,
+așa că rezultatul este identic cu scanarea completă.
+
+Înaintea LCS, semnăturile de caractere (index.char_signature) elimină ieftin
+cheile care nu au destule caractere comune cu cuvântul.
+
+NumPy este opțional: fără el se folosește aceeași margine calculată cu
+întregi Python, doar pentru gălețile (primă literă, lungime) relevante.
+"""
+
+from .index import LengthBuckets, build_signatures, char_signature, common_chars_bound, fold_diacritics
+
+# NumPy se importă doar la construirea scorer-ului, ca importul pachetului să rămână rapid
+np = None
+_NUMPY_CHECKED = False
+
+# Bonusurile maxime adăugate de _score_candidate (prefix + lungime), doar pentru scoruri >= 0.7
+_BONUS_FLOOR = 0.7
+_MAX_BONUS = 0.08
+_EPSILON = 1e-9
+
+# Lungimea maximă a cheilor/cuvintelor reprezentabile pe 64 de biți
+_WORD_BITS = 64
+
+
+def _load_numpy():
+    """Importă NumPy la prima nevoie; returnează None dacă nu este instalat"""
+    global np, _NUMPY_CHECKED
+    if not _NUMPY_CHECKED:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover - depinde de mediu
+            numpy = None
+        np = numpy
+        _NUMPY_CHECKED = True
+    return np
+
+
+def _score_bound(ratio_bound):
+    """Scorul maxim (cu bonusuri) pe care îl poate obține un candidat"""
+    if ratio_bound >= _BONUS_FLOOR:
+        return ratio_bound + _MAX_BONUS
+    return ratio_bound
+
+
+def _query_masks(word):
+    """Pentru fiecare caracter, masca pozițiilor sale în cuvânt"""
+    masks = {}
+    for i, ch in enumerate(word):
+        masks[ch] = masks.get(ch, 0) | (1 << i)
+    return masks
+
+
+def _lcs_length(masks, full, length, key):
+    """Lungimea celei mai lungi subsecvențe comune (bit-paralel, întregi Python)"""
+    v = full
+    for ch in key:
+        u = v & masks.get(ch, 0)
+        v = ((v + u) | (v - u)) & full
+    return length - bin(v).count("1")
+
+
+class PythonScorer:
+    """
+    Varianta fără NumPy: marginea LCS calculată pentru cheile din gălețile valide.
+    """
+
+    __slots__ = ("_buckets", "_signatures")
+
+    def __init__(self, entries, buckets=None, signatures=None):
+        self._buckets = LengthBuckets(entries) if buckets is None else buckets
+        self._signatures = build_signatures(entries) if signatures is None else signatures
+
+    def candidates(self, word, threshold):
+        """
+        Returnează, în ordinea dicționarului, cheile care pot trece validarea
+        și pot atinge pragul de similaritate.
+        """
+        word_lower = word.lower()
+        length = len(word_lower)
+        masks = _query_masks(word_lower)
+        full = (1 << length) - 1
+        query = char_signature(word_lower)
+        signatures = self._signatures
+
+        result = []
+        for key in self._buckets.candidates(word):
+            key_lower = key.lower()
+            total = length + len(key_lower)
+            if not total:
+                result.append(key)
+                continue
+            common = common_chars_bound(query, length, signatures[key])
+            if _score_bound(2.0 * common / total) + _EPSILON < threshold:
+                continue
+            ratio_bound = 2.0 * _lcs_length(masks, full, length, key_lower) / total
+            if _score_bound(ratio_bound) + _EPSILON >= threshold:
+                result.append(key)
+        return result
+
+
+class VectorizedScorer:
+    """
+    Dicționarul împachetat în coloane de coduri Unicode (W x N) și evaluat
+    vectorizat: marginea LCS, lungimea și prima literă a corecturii pentru
+    toate cheile odată.
+    """
+
+    def __init__(self, entries, max_length_diff=3, signatures=None):
+        if _load_numpy() is None:
+            raise ImportError("VectorizedScorer necesită numpy")
+        self.max_length_diff = max_length_diff
+        self._fallback = None
+        self._entries = entries
+        self._keys = list(entries)
+
+        lowered = [key.lower() for key in self._keys]
+        width = min(max((len(key) for key in lowered), default=0), _WORD_BITS)
+        self._width = width
+        self._key_lengths = np.array([len(key) for key in lowered], dtype=np.int64)
+        # Cheile prea lungi pentru tabel nu sunt filtrate după LCS (rămân candidate)
+        self._overflow = self._key_lengths > width
+
+        max_code = max((ord(ch) for key in lowered for ch in key), default=0)
+        self._table_size = max_code + 1
+        dtype = np.uint16 if max_code < 1 << 16 else np.uint32
+        codes = np.zeros((width, len(lowered)), dtype=dtype)
+        for column, key in enumerate(lowered):
+            for row, ch in enumerate(key[:width]):
+                codes[row, column] = ord(ch)
+        self._codes = codes
+
+        # Prima literă a corecturii, fără diacritice (ca în LengthBuckets): id numeric;
+        # -1 pentru corecturi goale
+        self._first_ids = {}
+        first = []
+        for key in self._keys:
+            value = entries[key]
+            if value:
+                first.append(self._first_ids.setdefault(fold_diacritics(value[0].lower()), len(self._first_ids)))
+            else:
+                first.append(-1)
+        self._target_first = np.array(first, dtype=np.int64)
+        self._target_lengths = np.array([len(entries[key]) for key in self._keys], dtype=np.int64)
+
+        if signatures is None:
+            signatures = build_signatures(entries)
+        self._signatures = np.array([signatures[key] for key in self._keys], dtype=np.uint64)
+
+    def _popcount(self, values):
+        bitwise_count = getattr(np, "bitwise_count", None)
+        if bitwise_count is not None:
+            return bitwise_count(values).astype(np.int64)
+        bits = np.unpackbits(values.view(np.uint8).reshape(len(values), 8), axis=1)
+        return bits.sum(axis=1, dtype=np.int64)
+
+    def lcs_lengths(self, word_lower, positions=None):
+        """LCS dintre cuvânt și fiecare cheie (sau doar cheile de pe pozițiile date)"""
+        length = len(word_lower)
+        full = np.uint64((1 << length) - 1)
+        table = np.zeros(self._table_size, dtype=np.uint64)
+        for i, ch in enumerate(word_lower):
+            code = ord(ch)
+            if 0 < code < self._table_size:
+                table[code] |= np.uint64(1 << i)
+
+        codes = self._codes if positions is None else self._codes[:, positions]
+        v = np.full(codes.shape[1], full, dtype=np.uint64)
+        for row in codes:
+            u = v & table[row]
+            v = ((v + u) | (v - u)) & full
+        return length - self._popcount(v)
+
+    def candidates(self, word, threshold):
+        """
+        Returnează, în ordinea dicționarului, cheile care pot trece validarea
+        și pot atinge pragul de similaritate.
+        """
+        word_lower = word.lower()
+        length = len(word_lower)
+        if length > _WORD_BITS:
+            # Cuvântul nu încape pe 64 de biți: aceeași margine, cu întregi Python
+            if self._fallback is None:
+                self._fallback = PythonScorer(self._entries)
+            return self._fallback.candidates(word, threshold)
+
+        first_id = self._first_ids.get(fold_diacritics(word[0].lower()), -2) if word else -2
+        valid = np.abs(self._target_lengths - len(word)) <= self.max_length_diff
+        valid &= (self._target_first == first_id) | (self._target_first == -1)
+
+        # Marginea din semnături (caractere comune), pentru toate cheile
+        query = char_signature(word_lower)
+        collisions = length - bin(query).count("1")
+        common = self._popcount(self._signatures & np.uint64(query)) + collisions
+        valid &= self._within(common, self._key_lengths + length, threshold)
+
+        # Marginea LCS, mai strânsă, doar pentru cheile rămase
+        positions = np.flatnonzero(valid)
+        totals = self._key_lengths[positions] + length
+        keep = self._within(self.lcs_lengths(word_lower, positions), totals, threshold)
+        keep |= self._overflow[positions]
+        return [self._keys[position] for position in positions[keep]]
+
+    def _within(self, common, totals, threshold):
+        """Cheile al căror scor maxim (din numărul de caractere comune) poate atinge pragul"""
+        ratio_bound = np.where(totals > 0, 2.0 * common / np.maximum(totals, 1), 1.0)
+        score_bound = np.where(ratio_bound >= _BONUS_FLOOR, ratio_bound + _MAX_BONUS, ratio_bound)
+        return score_bound + _EPSILON >= threshold
+
+
+def make_scorer(entries, buckets=None, signatures=None):
+    """Scorer-ul vectorizat dacă NumPy este instalat, altfel varianta Python"""
+    if _load_numpy() is not None:
+        return VectorizedScorer(entries, signatures=signatures)
+    return PythonScorer(entries, buckets, signatures)
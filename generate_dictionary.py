@@ -5,12 +5,14 @@ Generator de dicționar complet românesc
 Creează o bază de date cu toate cuvintele românești și variantele lor greșite
 """
 
-import json
-import re
+import os
+import tempfile
+
+from diacritice_rom.build import build
 
 def generate_romanian_dictionary():
     """
-    Generează un dicționar complet cu cuvinte românești și variantele lor
+    Returnează cuvintele de bază: formă fără diacritice → cuvântul corect
     """
     
     # Dicționar de bază cu cuvinte corecte
@@ -114,102 +116,32 @@ def generate_romanian_dictionary():
         "cald": "cald"
     }
     
-    # Dicționar extins cu variante
-    extended_dict = {}
-    
-    for base_word, correct_word in base_words.items():
-        # Adaugă cuvântul de bază
-        extended_dict[base_word] = correct_word
-        
-        # Generează variante cu erori comune
-        variants = generate_word_variants(base_word, correct_word)
-        for variant, corrected in variants.items():
-            extended_dict[variant] = corrected
-    
-    return extended_dict
-
-def generate_word_variants(base_word, correct_word):
-    """
-    Generează variante cu erori comune pentru un cuvânt
-    """
-    variants = {}
-    
-    # Variante cu litere lipsă
-    if len(base_word) > 3:
-        for i in range(1, len(base_word) - 1):
-            variant = base_word[:i] + base_word[i+1:]
-            if variant not in variants:
-                variants[variant] = correct_word
-    
-    # Variante cu litere adăugate
-    vowels = "aeiouăâîșț"
-    for i in range(len(base_word) + 1):
-        for vowel in vowels:
-            variant = base_word[:i] + vowel + base_word[i:]
-            if variant not in variants:
-                variants[variant] = correct_word
-    
-    # Variante cu litere înlocuite
-    common_replacements = {
-        'a': ['ă', 'â'],
-        'i': ['î'],
-        's': ['ș'],
-        't': ['ț'],
-        'ă': ['a'],
-        'â': ['a'],
-        'î': ['i'],
-        'ș': ['s'],
-        'ț': ['t']
-    }
-    
-    for i, char in enumerate(base_word):
-        if char in common_replacements:
-            for replacement in common_replacements[char]:
-                variant = base_word[:i] + replacement + base_word[i+1:]
-                if variant not in variants:
-                    variants[variant] = correct_word
-    
-    # Variante cu litere inversate
-    if len(base_word) > 2:
-        for i in range(len(base_word) - 1):
-            variant = base_word[:i] + base_word[i+1] + base_word[i] + base_word[i+2:]
-            if variant not in variants:
-                variants[variant] = correct_word
-    
-    return variants
+    return base_words
 
-def save_dictionary(dictionary, filename="romanian_dict_complete.json"):
+def write_word_list(base_words, filename):
     """
-    Salvează dicționarul în fișier JSON
+    Scrie cuvintele de bază ca listă TSV (formă<TAB>cuvânt) pentru diacritice_rom.build
     """
     with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(dictionary, f, ensure_ascii=False, indent=2)
-    
-    print(f"✅ Dicționar salvat în {filename}")
-    print(f"📊 Total cuvinte: {len(dictionary)}")
+        for base_word, correct_word in base_words.items():
+            f.write(f"{base_word}\t{correct_word}\n")
 
 def main():
     print("🔧 Generare dicționar românesc complet...")
     
-    # Generează dicționarul
-    dictionary = generate_romanian_dictionary()
+    base_words = generate_romanian_dictionary()
     
-    # Salvează dicționarul complet
-    save_dictionary(dictionary, "diacritice_rom/romanian_dict_complete.json")
-    
-    # Salvează și o versiune optimizată pentru producție
-    production_dict = {k: v for k, v in dictionary.items() if len(k) >= 2}
-    save_dictionary(production_dict, "diacritice_rom/dict.json")
+    # Variantele sunt generate de pipeline-ul de construire (în paralel, cu
+    # coliziuni rezolvate determinist); rezultă dict.json și dict.bin
+    with tempfile.TemporaryDirectory() as tmp:
+        word_list = os.path.join(tmp, "cuvinte.tsv")
+        write_word_list(base_words, word_list)
+        result = build(word_list, "diacritice_rom/dict.json", cache_dir=os.path.join(tmp, "cache"))
     
+    print(f"✅ Dicționar salvat în {', '.join(result['files'])}")
     print("\n🎯 Dicționarul a fost generat cu succes!")
-    print(f"📝 Cuvinte de bază: {len(dictionary)}")
-    print(f"🚀 Variante generate: {len(dictionary) - len(dictionary)}")
-    
-    # Afișează câteva exemple
-    print("\n📋 Exemple de variante:")
-    examples = list(dictionary.items())[:10]
-    for variant, correct in examples:
-        print(f"  '{variant}' → '{correct}'")
+    print(f"📝 Cuvinte de bază: {len(base_words)}")
+    print(f"🚀 Variante generate: {result['entries'] - len(base_words)}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,9 @@
+from diacritice_rom import add_diacritics, add_diacritics_batch
+from diacritice_rom.batch import MIN_PARALLEL_BATCH
+
+
+def test_batch_preserves_order():
+    texts = ["Romania este o tara frumoasa", "Mama si tata", "mashina Ionescu"] * MIN_PARALLEL_BATCH
+    expected = [add_diacritics(text) for text in texts]
+    assert add_diacritics_batch(texts, workers=2, chunksize=7) == expected
+    assert add_diacritics_batch(texts[:3], workers=2) == expected[:3]
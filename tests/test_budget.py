@@ -0,0 +1,43 @@
+import time
+
+from diacritice_rom import add_diacritics, clear_cache, get_correction_details, profile
+
+
+def test_exhausted_budget_keeps_exact_matches_only():
+    clear_cache()
+    details = get_correction_details("Romania mashina tara Ionescu", budget_ms=0)
+    assert details["corrected_text"] == "România mashina țară Ionescu"
+    assert details["skipped"] == [1, 3]
+    assert [c["type"] for c in details["corrections"]] == ["exact", "skipped", "exact", "skipped"]
+    assert details["total_corrected"] == 2
+
+
+def test_generous_budget_changes_nothing():
+    text = "Romania are o mashina noua Ionescu"
+    assert add_diacritics(text, budget_ms=10000) == add_diacritics(text)
+    assert get_correction_details(text, budget_ms=10000)["skipped"] == []
+
+
+def test_budget_bounds_latency():
+    # Cuvinte necunoscute distincte: fiecare ar cere o căutare fuzzy
+    text = " ".join(f"zqx{i}wv" for i in range(3000))
+    clear_cache()
+    with profile() as stats:
+        start = time.perf_counter()
+        details = get_correction_details(text, budget_ms=5)
+        elapsed = time.perf_counter() - start
+    assert details["skipped"]
+    assert stats.as_dict()["budget_skips"] == len(details["skipped"])
+    clear_cache()
+    start = time.perf_counter()
+    add_diacritics(text)
+    assert elapsed < time.perf_counter() - start
+
+
+def test_no_alternatives_after_the_budget():
+    clear_cache()
+    details = get_correction_details("Romania mashina tara Ionescu", alternatives=2, budget_ms=0)
+    assert [c["alternatives"] for c in details["corrections"]] == [[], [], [], []]
+    with profile() as stats:
+        get_correction_details("mashina " * 50, alternatives=2, budget_ms=0)
+    assert stats.candidates_scored == 0
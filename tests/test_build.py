@@ -0,0 +1,91 @@
+import json
+import os
+
+from diacritice_rom.build import build
+from diacritice_rom.lexicon import load_lexicon
+from diacritice_rom.mapped import open_mapped
+
+
+def _write_source(path, lines):
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_real_word_is_not_overwritten_by_variant(tmp_path):
+    source = tmp_path / "cuvinte.txt"
+    # "merge" fără o literă dă varianta "merg", care e și un cuvânt real
+    _write_source(source, ["# comentariu", "merge", "merg", "soare\t50", "sare\t10", "șarpe"])
+    out = tmp_path / "dict.json"
+    build(str(source), str(out), jobs=1, cache_dir=str(tmp_path / "cache"))
+
+    entries = json.loads(out.read_text(encoding="utf-8"))
+    assert entries["merge"] == "merge" and entries["merg"] == "merg"
+    assert entries["sare"] == "sare"
+    assert entries["sarpe"] == "șarpe"
+    # Coliziune între variante: câștigă frecvența mai mare
+    assert entries["sore"] == "soare"
+    assert load_lexicon(str(out)).lookup("sarpe") == "șarpe"
+
+
+def test_result_does_not_depend_on_order_or_jobs(tmp_path, monkeypatch):
+    import diacritice_rom.build as build_module
+
+    monkeypatch.setattr(build_module, "CHUNK_LINES", 2)
+    words = ["țară", "casă", "școală", "zăpadă", "soare", "sare", "masă", "mască"]
+    outputs = []
+    for name, lines, jobs in [("a", words, 1), ("b", words[::-1], 2)]:
+        source = tmp_path / f"{name}.txt"
+        _write_source(source, lines)
+        out = tmp_path / f"{name}.json"
+        build(str(source), str(out), jobs=jobs, cache_dir=str(tmp_path / f"cache-{name}"))
+        outputs.append(out.read_text(encoding="utf-8"))
+    assert outputs[0] == outputs[1]
+
+
+def test_incremental_rebuild_reuses_unchanged_chunks(tmp_path, monkeypatch):
+    import diacritice_rom.build as build_module
+
+    monkeypatch.setattr(build_module, "CHUNK_LINES", 2)
+    monkeypatch.setattr(build_module, "MAX_CHUNK_LINES", 2)
+    words = ["țară", "casă", "școală", "zăpadă", "soare", "sare"]
+    source = tmp_path / "cuvinte.txt"
+    cache = str(tmp_path / "cache")
+    out = str(tmp_path / "dict.json")
+
+    _write_source(source, words)
+    first = build(str(source), out, jobs=1, cache_dir=cache)
+    assert first["reused"] == 0
+
+    _write_source(source, words + ["masă"])
+    second = build(str(source), out, jobs=1, cache_dir=cache)
+    assert second["reused"] == first["chunks"]
+    assert json.loads(open(out, encoding="utf-8").read())["masa"] == "masă"
+
+
+def test_writes_mapped_artifact(tmp_path):
+    source = tmp_path / "lexicon.tsv"
+    _write_source(source, ["tara\tțară", "casa\tcasă\t3"])
+    out = build(str(source), str(tmp_path / "dict.lex"), variants=False, jobs=1)["files"][0]
+
+    mapped = open_mapped(out)
+    assert dict(mapped.entries.items()) == {"casa": "casă", "tara": "țară"}
+
+
+def test_rebuild_keeps_foreign_files_in_cache_dir(tmp_path, monkeypatch):
+    import diacritice_rom.build as build_module
+
+    monkeypatch.setattr(build_module, "CHUNK_LINES", 2)
+    monkeypatch.setattr(build_module, "MAX_CHUNK_LINES", 2)
+    source = tmp_path / "cuvinte.tsv"
+    notes = tmp_path / "notite.tsv"
+    notes.write_text("nu\tse\tșterge\n", encoding="utf-8")
+    out = str(tmp_path / "dict.json")
+
+    _write_source(source, ["țară", "casă", "școală", "zăpadă"])
+    build(str(source), out, jobs=1, cache_dir=str(tmp_path))
+    _write_source(source, ["soare", "sare"])
+    build(str(source), out, jobs=1, cache_dir=str(tmp_path))
+
+    assert notes.read_text(encoding="utf-8") == "nu\tse\tșterge\n"
+    assert source.exists()
+    chunks = [name for name in os.listdir(tmp_path) if build_module._CHUNK_NAME_RE.fullmatch(name)]
+    assert len(chunks) == 1
@@ -0,0 +1,26 @@
+import pytest
+
+from diacritice_rom import add_diacritics, cache_info, clear_cache, get_correction_details
+from diacritice_rom.cache import ResolutionCache
+
+
+def test_lru_eviction():
+    cache = ResolutionCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.info() == (1, 1, 1, 2, 2)
+    with pytest.raises(ValueError):
+        cache.resize(-1)
+
+
+def test_repeated_unknown_tokens_hit_cache():
+    clear_cache()
+    add_diacritics("Ionescu Ionescu ionescu")
+    details = get_correction_details("Ionescu mashina")
+    info = cache_info()
+    assert info.misses == 2
+    assert info.hits == 3
+    assert details["corrections"][1]["corrected"] == "mașină"
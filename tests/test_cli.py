@@ -0,0 +1,77 @@
+import json
+import os
+import stat
+
+import pytest
+
+from diacritice_rom.cli import main
+
+
+def test_output_dir_and_details(tmp_path, capsys):
+    source = tmp_path / "in"
+    (source / "sub").mkdir(parents=True)
+    (source / "a.txt").write_text("Romania este o tara frumoasa\r\n", encoding="utf-8")
+    (source / "sub" / "b.txt").write_text("mashina, Ionescu\n", encoding="utf-8")
+    (source / "skip.md").write_text("tara", encoding="utf-8")
+
+    out = tmp_path / "out"
+    assert main([str(source), "-o", str(out), "-j", "2", "--details"]) == 0
+
+    assert (out / "a.txt").read_bytes() == "România este o țară frumoasă\r\n".encode("utf-8")
+    assert (out / "sub" / "b.txt").read_text(encoding="utf-8") == "mașină, Ionescu\n"
+    assert not (out / "skip.md").exists()
+
+    captured = capsys.readouterr()
+    records = [json.loads(line) for line in captured.out.splitlines()]
+    details = [record for record in records if record["file"] == str(source / "sub" / "b.txt")]
+    assert [(record["chunk"], record["first_word"]) for record in details] == [(0, 0)]
+    assert [c["type"] for c in details[0]["corrections"]] == ["fuzzy", "none"]
+    assert "exacte: 4, fuzzy: 1, neschimbate: 2" in captured.err
+
+
+def test_in_place(tmp_path):
+    path = tmp_path / "text.txt"
+    path.write_text("Mama si tata", encoding="utf-8")
+    os.chmod(path, 0o644)
+    assert main([str(path), "-i", "-q"]) == 0
+    assert path.read_text(encoding="utf-8") == "Mamă și tată"
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+
+
+def test_parallel_stdout_keeps_file_order(tmp_path, capsys):
+    paths = []
+    for i, text in enumerate(["Mama si tata\n", "tara frumoasa\n", "mashina\n"]):
+        paths.append(tmp_path / f"{i}.txt")
+        paths[-1].write_text(text, encoding="utf-8")
+    assert main([str(path) for path in paths] + ["-j", "3", "-q"]) == 0
+    assert capsys.readouterr().out == "Mamă și tată\nțară frumoasă\nmașină\n"
+
+
+def test_duplicate_destinations_are_rejected(tmp_path, capsys):
+    for name in ("d", "e"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "a.txt").write_text("tara", encoding="utf-8")
+    out = tmp_path / "out"
+    inputs = [str(tmp_path / "d" / "a.txt"), str(tmp_path / "e" / "a.txt")]
+    for mode in (["-o", str(out)], ["-o", str(out), "--two-phase"]):
+        with pytest.raises(SystemExit):
+            main(inputs + mode + ["-q"])
+        assert "același fișier" in capsys.readouterr().err
+    assert not out.exists()
+
+
+def test_details_are_written_per_chunk(tmp_path, capsys, monkeypatch):
+    import diacritice_rom.cli as cli_module
+
+    monkeypatch.setattr(cli_module, "CHUNK_SIZE", 16)
+    path = tmp_path / "text.txt"
+    path.write_text("Mama si tata merg la tara cu mashina\n", encoding="utf-8")
+    assert main([str(path), "-o", str(tmp_path / "out"), "-j", "1", "--details", "-q"]) == 0
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(records) > 1
+    assert [record["chunk"] for record in records] == list(range(len(records)))
+    words = [c["corrected"] for record in records for c in record["corrections"]]
+    assert words == ["Mamă", "și", "tată", "merg", "la", "țară", "cu", "mașină"]
+    for previous, record in zip(records, records[1:]):
+        assert record["first_word"] == previous["first_word"] + previous["total_words"]
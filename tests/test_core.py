@@ -4,3 +4,18 @@ def test_basic():
     text = "Romania este o tara frumoasa"
     result = add_diacritics(text)
     assert result == "România este o țară frumoasă"
+
+
+def test_punctuation_and_whitespace_preserved():
+    text = "  Romania, tara!\n\t(Mama si tata) -- \"frumoasa\"...  "
+    result = add_diacritics(text)
+    assert result == "  România, țară!\n\t(Mamă și tată) -- \"frumoasă\"...  "
+
+
+def test_decomposed_words_are_not_split():
+    import unicodedata
+
+    from diacritice_rom.core import _split_words
+
+    text = unicodedata.normalize("NFD", "școală frumoasă, într-o țară")
+    assert _split_words(text)[1::2] == [unicodedata.normalize("NFD", word) for word in ["școală", "frumoasă", "într-o", "țară"]]
@@ -0,0 +1,40 @@
+import os
+import stat
+
+from diacritice_rom import add_diacritics
+from diacritice_rom.cli import main
+from diacritice_rom.corpus import collect_vocabulary, correct_corpus, load_table, resolve_vocabulary, rewrite
+
+TEXT = "Romania este o TARA frumoasa, mashina si Ionescu.\nAm fost la Brasov si la munte."
+
+
+def test_rewrite_matches_add_diacritics():
+    table = resolve_vocabulary(collect_vocabulary([[TEXT]], workers=1), workers=1)
+    assert set(table) == {word.lower() for word in TEXT.replace(",", " ").replace(".", " ").split()}
+    assert rewrite(TEXT, table) == add_diacritics(TEXT)
+
+
+def test_correct_corpus_and_table(tmp_path):
+    sources = [tmp_path / "a.txt", tmp_path / "b.txt"]
+    sources[0].write_text("Mama si tata\r\n", encoding="utf-8")
+    sources[1].write_text(TEXT, encoding="utf-8")
+    destinations = [tmp_path / "out" / "a.txt", tmp_path / "out" / "b.txt"]
+
+    table_path = tmp_path / "rezolutii.tsv"
+    table = correct_corpus(sources, destinations, workers=2, table_path=str(table_path))
+
+    assert destinations[0].read_bytes() == "Mamă și tată\r\n".encode("utf-8")
+    assert destinations[1].read_text(encoding="utf-8") == add_diacritics(TEXT)
+    assert table["si"].corrected == "și"
+    assert table["mashina"].type == "fuzzy"
+    assert load_table(str(table_path)) == table
+
+
+def test_cli_two_phase(tmp_path, capsys):
+    path = tmp_path / "text.txt"
+    path.write_text("Mama si tata", encoding="utf-8")
+    os.chmod(path, 0o644)
+    assert main([str(path), "-i", "--two-phase"]) == 0
+    assert path.read_text(encoding="utf-8") == "Mamă și tată"
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+    assert "exacte: 3" in capsys.readouterr().err
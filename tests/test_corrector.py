@@ -0,0 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from diacritice_rom import Corrector, add_diacritics
+from diacritice_rom import core
+from diacritice_rom.lexicon import Lexicon
+
+
+def test_instances_have_their_own_configuration():
+    shared = core._get_lexicon()
+    strict = Corrector(shared, similarity_threshold=0.95)
+    tenant = Corrector(shared)
+    tenant.add_overlay("locuri", {"brasov": "Brașov"})
+
+    assert strict.add_diacritics("muntti") == "muntti"
+    assert tenant.add_diacritics("muntti") == "munte"
+    assert tenant.add_diacritics("Brasov") == "Brașov"
+    assert add_diacritics("Brasov") == "Brad"
+    assert strict.lexicon is shared and tenant.lexicon is not shared
+
+    details = tenant.get_correction_details("tara")
+    assert details["corrected_text"] == "țară"
+    assert tenant.cache_info().currsize == 1 and strict.cache_info().currsize == 1
+
+
+def test_separate_dictionaries_in_one_process():
+    small = Corrector(Lexicon({"tara": "țară"}))
+    assert small.add_diacritics("tara frumoasa") == "țară frumoasa"
+    assert add_diacritics("tara frumoasa") == "țară frumoasă"
+
+
+def test_shared_instance_across_threads():
+    corrector = Corrector(core._get_lexicon())
+    texts = ["Romania este o tara frumoasa", "mashina si scoala", "Ionescu ionescu"] * 50
+    expected = [add_diacritics(text) for text in texts]
+    with ThreadPoolExecutor(8) as executor:
+        assert list(executor.map(corrector.add_diacritics, texts)) == expected
+
+
+def test_module_settings_read_at_load(monkeypatch):
+    corrector = Corrector()
+    # Ca pentru instanța implicită, setările modulului contează până la prima corectare
+    monkeypatch.setattr(core, "MAX_EDIT_DISTANCE", None)
+    monkeypatch.setattr(core, "RESOLUTION_CACHE_SIZE", 7)
+    assert corrector.add_diacritics("mashina") == "mașină"
+    assert corrector.lexicon.delete_index is None
+    assert corrector.max_edit_distance is None
+    assert corrector.cache_info().maxsize == 7
+    assert Corrector(max_edit_distance=1, cache_size=3).cache_info().maxsize == 3
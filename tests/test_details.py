@@ -0,0 +1,25 @@
+import json
+
+from diacritice_rom import get_correction_details
+
+
+def test_details_are_compact_with_explicit_json():
+    details = get_correction_details("Romania are o mashina noua Ionescu")
+    corrections = details["corrections"]
+    assert details["total_words"] == len(corrections) == 6
+    assert details["total_corrected"] == 3
+
+    fuzzy = corrections[3]
+    assert fuzzy["type"] == "fuzzy"
+    assert fuzzy["corrected"] == "mașină"
+    assert 0.6 <= fuzzy["confidence"] < 1.0
+    assert fuzzy["context"] == ["are", "o", "mashina", "noua", "Ionescu"]
+    assert corrections[0]["context"] == ["Romania", "are", "o"]
+    assert corrections[-1]["type"] == "none"
+    assert dict(corrections[2])["original"] == "o"
+
+    # Forma compactă se serializează explicit; as_list() dă dict-uri care pot fi modificate
+    assert json.loads(corrections.to_json()) == corrections.as_list() == corrections
+    records = corrections.as_list()
+    records[3]["corrected"] = "masina"
+    assert corrections[3]["corrected"] == "mașină"
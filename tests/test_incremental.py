@@ -0,0 +1,32 @@
+import random
+
+import pytest
+
+from diacritice_rom import IncrementalDocument, add_diacritics
+from diacritice_rom.incremental import Change
+
+
+def test_edit_returns_changed_span():
+    doc = IncrementalDocument("Romania este o tara")
+    assert doc.corrected == "România este o țară"
+    assert doc.edit(19, 0, " frumoasa") == [Change(19, 19, " frumoasă")]
+    assert doc.edit(0, 7, "Romania") == []
+    assert doc.corrected == "România este o țară frumoasă"
+    with pytest.raises(ValueError):
+        doc.edit(len(doc), 1)
+
+
+def test_random_edits_match_full_correction():
+    rng = random.Random(7)
+    pieces = ["tara", " ", "mashina, ", "-", "o ", "într-o", "\n", "Romania"]
+    for block_words in (1, 3, 256):
+        text = "Romania este o tara frumoasa. Am o mashina noua in Bucuresti.\n" * 5
+        doc = IncrementalDocument(text, block_words=block_words)
+        corrected = doc.corrected
+        for _ in range(40):
+            offset = rng.randrange(len(doc) + 1)
+            removed = rng.randrange(min(8, len(doc) - offset) + 1)
+            inserted = "".join(rng.choice(pieces) for _ in range(rng.randrange(3)))
+            for change in doc.edit(offset, removed, inserted):
+                corrected = corrected[:change.start] + change.text + corrected[change.end:]
+            assert corrected == doc.corrected == add_diacritics(doc.text)
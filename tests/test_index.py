@@ -0,0 +1,65 @@
+from difflib import SequenceMatcher
+
+from diacritice_rom import core
+from diacritice_rom.index import (
+    DeleteIndex,
+    LengthBuckets,
+    build_folded_index,
+    char_signature,
+    common_chars_bound,
+    fold_diacritics,
+)
+
+
+def test_delete_index_candidates():
+    index = DeleteIndex(["tara", "casa", "scoala"], max_distance=1)
+    assert index.candidates("tra") == ["tara"]
+    assert index.candidates("tarra") == ["tara"]
+    assert index.candidates("xyz") == []
+
+
+def test_index_matches_full_scan():
+    words = ["romnaiaa", "frumoosa", "bucureshti", "mashina", "padurre", "scoalla", "ionescu", "microsoft"]
+    for word in words:
+        assert core._lookup_exact(word) is None
+        assert core._find_best_match(word) == core._scan_best_match(word)
+
+
+def test_folded_lookup():
+    assert fold_diacritics("ȘCOALĂ țară") == "SCOALA tara"
+    assert build_folded_index({"tara": "țară", "țară": "țară", "școală": "școală"}) == {"scoala": "școală"}
+    assert core._lookup_exact("țara") == "țară"
+    assert core._lookup_exact("scoală") == "școală"
+
+
+def test_fuzzy_typos_with_diacritics():
+    # Cheile sunt pliate, deci și cuvântul căutat fuzzy trebuie pliat
+    for word, expected in [("țarra", "țară"), ("școalla", "școală"), ("zazpadă", "zăpadă")]:
+        assert core._lookup_exact(word) is None
+        assert core._find_best_match(word)[0] == expected
+        assert core._scan_best_match(word)[0] == expected
+        assert core._suggest(word, 1)[0].word == expected
+    assert core.add_diacritics("Țarra") == "Țară"
+
+
+def test_length_buckets_keep_only_valid_targets():
+    buckets = LengthBuckets({"tara": "țară", "casa": "casă", "caseta": "casetă", "cal": "cal", "x": ""})
+    assert buckets.candidates("casaa") == ["casa", "caseta", "cal"]
+    assert buckets.candidates("ab") == ["x"]
+    # Prima literă este comparată fără diacritice (validarea exactă rămâne în core)
+    assert buckets.candidates("tzra") == ["tara"]
+
+
+def test_bucket_scan_matches_full_scan():
+    entries = core.DICT
+    for word in ["mashina", "padurre", "scoalla", "ionescu"]:
+        assert core._scan_best_match(word) == core._best_among(word, entries, 0.8, None)
+
+
+def test_signature_bound_never_below_matching_blocks():
+    keys = list(core._get_lexicon().entries)[::7]
+    for word in ["ionescu", "aaaaaaaaa", "țățățăț", "microsoft", "x", "într-o", "bucuresti"]:
+        query = char_signature(word)
+        for key in keys:
+            matched = sum(block.size for block in SequenceMatcher(None, word, key).get_matching_blocks())
+            assert common_chars_bound(query, len(word), char_signature(key)) >= matched
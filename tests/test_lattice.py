@@ -0,0 +1,40 @@
+from diacritice_rom import add_diacritics
+from diacritice_rom.lattice import BigramModel, add_diacritics_lattice
+
+CORPUS = [
+    "Fata este la școală.",
+    "Fata este frumoasă.",
+    "Am văzut o fată frumoasă.",
+    "Este o fată bună.",
+    "Casa este mare.",
+    "Ei au o casă nouă.",
+]
+
+
+def test_context_picks_between_alternatives(tmp_path):
+    model = BigramModel.train(CORPUS)
+    assert sorted(model.alternatives["fata"]) == ["fata", "fată"]
+
+    path = model.write(str(tmp_path / "bigrams.bin"))
+    loaded = BigramModel.load(path)
+    assert loaded.alternatives == model.alternatives
+    assert loaded.log_prob("fata", "este") == model.log_prob("fata", "este")
+
+    text = "Fata este la scoala si o fata frumoasa. Casa este mare"
+    assert add_diacritics(text) == "Fată este la școală și o fată frumoasă. Casă este mare"
+    for beam in (1, 4):
+        assert add_diacritics_lattice(text, model=loaded, beam=beam) == "Fata este la școală și o fată frumoasă. Casa este mare"
+
+
+def test_without_alternatives_matches_add_diacritics():
+    model = BigramModel.train(["Un text fără forme ambigue."])
+    text = "Romania este o tara frumoasa, Ionescu"
+    assert add_diacritics_lattice(text, model=model) == add_diacritics(text)
+
+
+def test_partly_diacritized_words_are_still_ambiguous():
+    model = BigramModel.train(CORPUS + ["Țara este frumoasă.", "Am văzut o țară frumoasă.", "Este o țară mare."])
+    text = "Țara este frumoasă și o țara mare"
+    expected = "Țara este frumoasă și o țară mare"
+    for beam in (1, 4):
+        assert add_diacritics_lattice(text, model=model, beam=beam) == expected
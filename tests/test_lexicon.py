@@ -0,0 +1,36 @@
+import json
+import subprocess
+import sys
+
+from diacritice_rom.lexicon import compile_lexicon, load_compiled, load_lexicon
+
+
+def _write_dict(path, entries):
+    path.write_text(json.dumps(entries, ensure_ascii=False), encoding="utf-8")
+
+
+def test_compiled_roundtrip(tmp_path):
+    source = tmp_path / "dict.json"
+    _write_dict(source, {"tara": "țară", "casa": "casă", "școală": "școală"})
+    out = compile_lexicon(str(source))
+    assert out == str(tmp_path / "dict.bin")
+
+    lexicon = load_compiled(out, str(source))
+    assert lexicon.entries == {"tara": "țară", "casa": "casă", "școală": "școală"}
+    assert lexicon.lookup("scoala") == "școală"
+    assert lexicon.delete_index.candidates("tarra") == ["tara"]
+
+
+def test_stale_compiled_is_ignored(tmp_path):
+    source = tmp_path / "dict.json"
+    _write_dict(source, {"tara": "țară"})
+    compile_lexicon(str(source))
+    _write_dict(source, {"tara": "țară", "casa": "casă"})
+
+    assert load_compiled(str(tmp_path / "dict.bin"), str(source)) is None
+    assert load_lexicon(str(source)).entries == {"tara": "țară", "casa": "casă"}
+
+
+def test_import_does_not_load_dictionary():
+    code = "import diacritice_rom.core as c; assert c._LEXICON is None; c.add_diacritics('tara'); assert c._LEXICON"
+    subprocess.run([sys.executable, "-c", code], check=True)
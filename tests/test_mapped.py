@@ -0,0 +1,40 @@
+import json
+
+from diacritice_rom.lexicon import Lexicon, load_lexicon
+from diacritice_rom.mapped import open_mapped, write_mapped
+
+ENTRIES = {"tara": "țară", "casa": "casă", "școală": "școală", "zapada": "zăpadă", "ara": "ară"}
+
+
+def test_mapped_matches_in_memory(tmp_path):
+    lexicon = Lexicon(ENTRIES)
+    path = write_mapped(lexicon, str(tmp_path / "dict.lex"))
+    mapped = open_mapped(path)
+
+    assert list(mapped.entries) == list(ENTRIES)
+    assert dict(mapped.entries.items()) == ENTRIES
+    assert "casa" in mapped.entries and "cas" not in mapped.entries
+    assert mapped.lookup("scoala") == "școală"
+    assert mapped.lookup("țara") == "țară"
+    for word in ["tarra", "zapda", "ar", "xyz"]:
+        assert mapped.delete_index.candidates(word) == lexicon.delete_index.candidates(word)
+
+
+def test_load_lexicon_opens_mapped_file(tmp_path):
+    source = tmp_path / "dict.json"
+    source.write_text(json.dumps(ENTRIES, ensure_ascii=False), encoding="utf-8")
+    path = write_mapped(Lexicon(ENTRIES), str(tmp_path / "dict.lex"))
+
+    lexicon = load_lexicon(path)
+    assert lexicon.lookup("casa") == "casă"
+    assert load_lexicon(path, max_edit_distance=None).delete_index is None
+
+
+def test_fuzzy_lookup_does_not_read_every_key(tmp_path):
+    from diacritice_rom import core
+
+    mapped = open_mapped(write_mapped(Lexicon(ENTRIES), str(tmp_path / "dict.lex")))
+    assert core._find_best_match("zapadda", 0.8, None, mapped)[0] == "zăpadă"
+    # Doar semnăturile candidaților din indexul de ștergeri sunt calculate
+    assert mapped._signatures is None
+    assert set(mapped._signature_cache) <= set(mapped.delete_index.candidates("zapadda"))
@@ -0,0 +1,48 @@
+import unicodedata
+
+import pytest
+
+from diacritice_rom import Corrector, IncrementalDocument, add_diacritics, get_correction_details
+from diacritice_rom.lattice import BigramModel, add_diacritics_lattice
+from diacritice_rom.normalize import _COMPOSED, apply_convention, normalize_text
+
+STANDARD = "ÎNVĂȚĂMÂNTUL din țară și Școala"
+
+
+def test_normalize_text():
+    assert normalize_text(unicodedata.normalize("NFD", STANDARD)) == STANDARD
+    assert normalize_text("ÎNVĂŢĂMÂNTUL din ţară şi Şcoala") == STANDARD
+    # Forma descompusă cu sedilă ajunge tot la virgulă
+    assert normalize_text("s\u0327i T\u0327ARA") == "și ȚARA"
+    for decomposed, composed in _COMPOSED:
+        assert normalize_text(decomposed) == composed
+    # Textul deja standard nu este copiat, iar alte semne combinate rămân
+    assert normalize_text(STANDARD) is STANDARD
+    assert normalize_text("café e\u0301") == "café e\u0301"
+
+
+def test_add_diacritics_normalizes_input():
+    expected = add_diacritics("Romania si tara, mashina")
+    assert add_diacritics(unicodedata.normalize("NFD", expected)) == expected
+    assert add_diacritics(expected.replace("ș", "ş").replace("ț", "ţ")) == expected
+
+    details = get_correction_details("ştiinţa")
+    assert [c["type"] for c in details["corrections"]] == ["exact"]
+
+
+def test_incremental_and_lattice_normalize_input():
+    model = BigramModel.train(["Un text fără forme ambigue."])
+    for text in [unicodedata.normalize("NFD", "școală frumoasă, într-o țară"), "Şcoala din ţara noastra"]:
+        expected = add_diacritics(text)
+        document = IncrementalDocument(text, block_words=2)
+        assert document.corrected == expected
+        assert document.text == text
+        assert add_diacritics_lattice(text, model=model) == expected
+
+
+def test_output_convention():
+    assert add_diacritics("Tara si stiinta", convention="cedilla") == "Ţară şi ştiinţă"
+    assert Corrector().add_diacritics("ţara", convention="comma") == "țară"
+    assert apply_convention(STANDARD, "cedilla") == "ÎNVĂŢĂMÂNTUL din ţară şi Şcoala"
+    with pytest.raises(ValueError):
+        apply_convention(STANDARD, "nfd")
@@ -0,0 +1,71 @@
+import json
+import threading
+
+import pytest
+
+from diacritice_rom import add_diacritics, add_overlay, cache_info, clear_cache, list_overlays, remove_overlay
+from diacritice_rom import core
+from diacritice_rom.lexicon import Lexicon
+
+
+@pytest.fixture(autouse=True)
+def restore_lexicon():
+    base = core._get_lexicon()
+    yield
+    for name in list_overlays():
+        remove_overlay(name)
+    core.set_lexicon(base)
+    clear_cache()
+
+
+def test_overlay_sits_in_front_of_base():
+    assert add_diacritics("Brasov si Cluj") == "Brad și Cluj"
+    add_overlay("locuri", {"brasov": "brașov"})
+    assert add_diacritics("Brasov si Cluj, brasv") == "Brașov și Cluj, brașov"
+    assert list_overlays() == ["locuri"]
+
+    # Cel mai recent overlay are prioritate
+    add_overlay("altele", {"brasov": "Brașov"})
+    assert add_diacritics("brasov") == "Brașov"
+
+    assert remove_overlay("altele") and remove_overlay("locuri")
+    assert not remove_overlay("locuri")
+    assert add_diacritics("Brasov") == "Brad"
+
+
+def test_overlay_invalidates_only_affected_tokens(tmp_path):
+    clear_cache()
+    add_diacritics("xiaomii ionescu")
+    assert cache_info().currsize == 2
+
+    path = tmp_path / "produse.json"
+    path.write_text(json.dumps({"xiaomi": "Xiaomi"}), encoding="utf-8")
+    add_overlay("produse", str(path))
+    assert cache_info().currsize == 1
+    assert add_diacritics("xiaomii") == "Xiaomi"
+
+
+def test_swap_while_correcting():
+    small = Lexicon({"tara": "țară"}, core.MAX_EDIT_DISTANCE)
+    full = core._get_lexicon()
+    text = "Romania este o tara frumoasa cu muntii inalti si mashina " * 20
+    errors = []
+
+    def correct():
+        try:
+            for _ in range(20):
+                add_diacritics(text)
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=correct) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for i in range(50):
+        core.set_lexicon(small if i % 2 == 0 else full)
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    core.set_lexicon(full)
+    assert add_diacritics("tara frumoasa") == "țară frumoasă"
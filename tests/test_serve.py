@@ -0,0 +1,58 @@
+import asyncio
+import io
+import json
+
+from diacritice_rom.serve import MicroBatcher, make_executor, serve_stdio, start_http_server
+
+
+async def _http(port, method, path, payload=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body)
+    await writer.drain()
+    status_line = await reader.readline()
+    raw = await reader.read()
+    writer.close()
+    return int(status_line.split()[1]), json.loads(raw.split(b"\r\n\r\n", 1)[1])
+
+
+def test_http_requests_are_batched():
+    async def scenario():
+        with make_executor(0) as executor:
+            batcher = MicroBatcher(executor, max_batch=16, max_delay=0.01)
+            batcher.start()
+            server = await start_http_server(batcher, port=0)
+            port = server.sockets[0].getsockname()[1]
+            try:
+                results = await asyncio.gather(*(_http(port, "POST", "/correct", {"text": "tara frumoasa"}) for _ in range(8)))
+                batch = await _http(port, "POST", "/correct", {"texts": ["Mama si tata", "casa"]})
+                bad = await _http(port, "POST", "/correct", {"nothing": 1})
+                stats = await _http(port, "GET", "/stats")
+            finally:
+                server.close()
+                await batcher.stop()
+            return results, batch, bad, stats
+
+    results, batch, bad, stats = asyncio.run(scenario())
+    assert results == [(200, {"text": "țară frumoasă"})] * 8
+    assert batch == (200, {"texts": ["Mamă și tată", "casă"]})
+    assert bad[0] == 400
+    assert stats[1]["requests"] == 10
+    assert stats[1]["batches"] < 10
+
+
+def test_stdio_json_lines_keep_order():
+    async def scenario():
+        infile = io.StringIO('{"id": 1, "text": "Romania"}\n{"id": 2, "texts": ["tara"]}\nnu e json\n')
+        outfile = io.StringIO()
+        with make_executor(0) as executor:
+            batcher = MicroBatcher(executor)
+            batcher.start()
+            await serve_stdio(batcher, infile, outfile)
+            await batcher.stop()
+        return [json.loads(line) for line in outfile.getvalue().splitlines()]
+
+    responses = asyncio.run(scenario())
+    assert responses[0] == {"text": "România", "id": 1}
+    assert responses[1] == {"texts": ["țară"], "id": 2}
+    assert "error" in responses[2]
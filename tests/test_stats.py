@@ -0,0 +1,33 @@
+from diacritice_rom import add_diacritics, clear_cache, enable_stats, get_stats, profile, reset_stats
+
+
+def test_profile_counts_exact_and_fuzzy():
+    clear_cache()
+    with profile() as stats:
+        add_diacritics("Romania mashina Ionescu mashina")
+    result = stats.as_dict()
+    assert result["words"] == 4
+    assert result["exact_hits"] == 1
+    assert result["fuzzy_attempts"] == 3
+    assert result["fuzzy_successes"] == 2
+    assert result["fuzzy_misses"] == 1
+    assert result["fuzzy_lookups"] == 2
+    assert result["fuzzy_cache_hits"] == 1
+    assert result["candidates_scored"] >= 1
+    assert len(result["slowest"]) == 4
+    assert result["slowest"][0]["ms"] >= result["slowest"][-1]["ms"]
+    assert not get_stats()["enabled"]
+
+
+def test_global_stats_enable_and_reset():
+    enable_stats()
+    try:
+        reset_stats()
+        add_diacritics("tara frumoasa")
+        assert get_stats()["exact_hits"] == 2
+        reset_stats()
+        assert get_stats()["words"] == 0
+    finally:
+        enable_stats(False)
+    add_diacritics("tara")
+    assert get_stats() == dict(get_stats(), enabled=False, words=0)
@@ -0,0 +1,15 @@
+import io
+
+from diacritice_rom import correct_stream, iter_add_diacritics
+
+
+def test_words_split_across_chunks():
+    chunks = ["Roma", "nia este o ta", "ra\n\tfrumoasa", "  "]
+    assert "".join(iter_add_diacritics(chunks)) == "România este o țară\n\tfrumoasă  "
+
+
+def test_correct_stream_preserves_whitespace():
+    text = "Mama si tata\n\nsunt in casa \n" * 50
+    out = io.StringIO()
+    correct_stream(io.StringIO(text), out, chunk_size=7)
+    assert out.getvalue() == "Mamă și tată\n\nsunt în casă \n" * 50
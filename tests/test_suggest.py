@@ -0,0 +1,54 @@
+import json
+
+from diacritice_rom import Corrector, core, get_correction_details, suggest
+from diacritice_rom.lexicon import Lexicon
+
+ENTRIES = {"casa": "casă", "cana": "cană", "capa": "capă", "cada": "cadă", "casta": "castă", "masa": "masă"}
+
+
+def _brute_force(corrector, word, k, threshold):
+    best = {}
+    for position, key in enumerate(corrector.lexicon.entries):
+        corrected = corrector.lexicon.entries[key]
+        score = core._score_candidate(word, key)
+        if not core._validate_correction(word, corrected, None) or score < threshold:
+            continue
+        if corrected not in best or (-score, position) < best[corrected]:
+            best[corrected] = (-score, position)
+    ranked = sorted((rank, corrected) for corrected, rank in best.items())[:k]
+    return [(corrected, -rank[0]) for rank, corrected in ranked]
+
+
+def test_suggest_matches_brute_force_ranking():
+    for distance in (2, None):
+        corrector = Corrector(Lexicon(ENTRIES, distance))
+        for word in ["caza", "casa", "cassa", "maza", "xyz"]:
+            for k in (1, 2, 10):
+                got = [(s.word, s.score) for s in corrector.suggest(word, k, 0.6)]
+                assert got == _brute_force(corrector, word, k, 0.6)
+
+
+def test_ties_keep_dictionary_order():
+    # Toate trei au scorul 0.6 pentru "abaca"; marginile le parcurg în altă ordine
+    lexicon = Lexicon({"babcb": "ababcb6", "bbdac": "abbdac7", "acada": "aacada8"}, 2)
+    assert core._find_best_match("abaca", 0.6, None, lexicon)[0] == "ababcb6"
+    assert [s.word for s in core._suggest("abaca", 1, 0.6, lexicon)] == ["ababcb6"]
+    assert [s.word for s in core._suggest("abaca", 2, 0.6, lexicon)] == ["ababcb6", "abbdac7"]
+
+
+def test_top_suggestion_is_the_correction():
+    for word in ["mashina", "romanija", "muntti", "frumossa"]:
+        best, _ = core._find_best_match(word)
+        assert suggest(word, 3)[0].word == best
+    assert suggest("xqzw", 3) == []
+    assert suggest("mashina", 0) == []
+
+
+def test_details_alternatives():
+    corrector = Corrector(Lexicon(ENTRIES), similarity_threshold=0.6)
+    details = corrector.get_correction_details("Cassa", alternatives=2)
+    correction = details["corrections"][0]
+    assert correction["corrected"] == "Casă"
+    assert [s.word for s in correction["alternatives"]] == ["Castă"]
+    assert json.loads(details["corrections"].to_json())[0]["alternatives"][0]["word"] == "Castă"
+    assert "alternatives" not in get_correction_details("tara")["corrections"][0]
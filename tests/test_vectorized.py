@@ -0,0 +1,25 @@
+import pytest
+
+from diacritice_rom import core
+from diacritice_rom.vectorized import PythonScorer, VectorizedScorer
+
+WORDS = ["mashina", "padurre", "scoalla", "ionescu", "Bucureshti", "frumoosa", "romnaiaa", "x" * 70]
+
+
+def test_python_scorer_matches_similarity_ranking():
+    entries = core.DICT
+    scorer = PythonScorer(entries)
+    for word in WORDS:
+        for threshold in (0.6, 0.8):
+            expected = core._best_among(word, entries, threshold, None)
+            assert core._best_among(word, scorer.candidates(word, threshold), threshold, None) == expected
+
+
+def test_vectorized_scorer_matches_python_scorer():
+    pytest.importorskip("numpy")
+    entries = core.DICT
+    python_scorer = PythonScorer(entries)
+    vector_scorer = VectorizedScorer(entries)
+    for word in WORDS:
+        for threshold in (0.6, 0.8):
+            assert vector_scorer.candidates(word, threshold) == python_scorer.candidates(word, threshold)